@@ -0,0 +1,105 @@
+"""
+Compare HTTP/1.1 and HTTP/2 transports under concurrent requests.
+
+Fires ``--requests`` concurrent ``search.post`` calls through
+``AsyncNewscatcherApi`` at a local mock server and reports the number of TCP
+connections opened and the request latency for each transport.
+
+The mock server speaks plain HTTP, where HTTP/2 cannot be negotiated through
+TLS ALPN as it is with ``http2=True`` against the real API. The HTTP/2 run
+therefore uses prior knowledge (``http1=False``) on the same transport stack
+the client builds for ``http2=True``.
+
+Usage:
+    pip install httpx[http2]
+    python benchmarks/http2_transport.py --requests 64 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from mock_server import MockNewsServer
+from newscatcher import AsyncNewscatcherApi
+from newscatcher.core.transport import AsyncStreamLimitedTransport
+
+
+def make_httpx_client(http2: bool, limits: httpx.Limits, max_concurrent_streams: Optional[int]) -> httpx.AsyncClient:
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(http1=not http2, http2=http2, limits=limits)
+    if max_concurrent_streams is not None:
+        transport = AsyncStreamLimitedTransport(transport, max_concurrent_streams)
+    return httpx.AsyncClient(transport=transport, timeout=60)
+
+
+async def run(
+    server: MockNewsServer,
+    base_url: str,
+    http2: bool,
+    requests: int,
+    limits: httpx.Limits,
+    max_concurrent_streams: Optional[int],
+) -> Dict[str, float]:
+    httpx_client = make_httpx_client(http2, limits, max_concurrent_streams)
+    client = AsyncNewscatcherApi(api_key="benchmark", base_url=base_url, httpx_client=httpx_client)
+    latencies: List[float] = []
+
+    async def one_request() -> None:
+        started = time.perf_counter()
+        await client.search.post(q="benchmark")
+        latencies.append(time.perf_counter() - started)
+
+    # Warm up one connection so both transports start from the same state
+    server.reset_counters()
+    await one_request()
+    latencies.clear()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one_request() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    await httpx_client.aclose()
+
+    latencies.sort()
+    return {
+        "connections": server.connections_opened,
+        "peak_open": server.peak_open_connections,
+        "wall_s": elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "max_ms": latencies[-1] * 1000,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=64, help="concurrent requests per run")
+    parser.add_argument("--latency", type=float, default=0.05, help="server processing time in seconds")
+    parser.add_argument("--max-connections", type=int, default=100, help="httpx pool max_connections")
+    parser.add_argument("--max-streams", type=int, default=None, help="max_concurrent_streams for HTTP/2")
+    args = parser.parse_args()
+
+    server = MockNewsServer(latency=args.latency)
+    base_url = await server.start()
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+
+    print(f"{args.requests} concurrent requests, {args.latency * 1000:.0f} ms server latency\n")
+    print(f"{'transport':<10} {'conns':>6} {'peak':>6} {'wall s':>8} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for label, http2, streams in (("HTTP/1.1", False, None), ("HTTP/2", True, args.max_streams)):
+        result = await run(server, base_url, http2, args.requests, limits, streams)
+        print(
+            f"{label:<10} {result['connections']:>6} {result['peak_open']:>6} {result['wall_s']:>8.3f} "
+            f"{result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} {result['max_ms']:>8.1f}"
+        )
+    await server.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
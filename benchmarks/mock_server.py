@@ -0,0 +1,173 @@
+"""
+Local mock of the Newscatcher API for benchmarks.
+
+Serves a canned search response for every request, over HTTP/1.1 with
+keep-alive or over HTTP/2 with prior knowledge (h2c), after a fixed delay that
+stands in for server processing time. It counts the TCP connections clients
+open so that benchmarks can compare transports.
+
+HTTP/2 support requires the ``h2`` package (``pip install httpx[http2]``).
+"""
+
+import asyncio
+import datetime
+import json
+from typing import Any, Dict, List, Optional
+
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+
+def make_search_response(articles_per_page: int = 20, total_pages: int = 1) -> Dict[str, Any]:
+    """Build a search response with the fields required by SearchResponseDto."""
+    published = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    articles: List[Dict[str, Any]] = [
+        {
+            "id": f"article-{i}",
+            "score": 1.0,
+            "title": f"Mock article {i}",
+            "link": f"https://example.com/news/{i}",
+            "domain_url": "example.com",
+            "full_domain_url": "www.example.com",
+            "parent_url": "https://example.com/news",
+            "rank": 100,
+            "published_date": (published + datetime.timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S"),
+            "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20,
+        }
+        for i in range(articles_per_page)
+    ]
+    return {
+        "status": "ok",
+        "total_hits": articles_per_page * total_pages,
+        "page": 1,
+        "total_pages": total_pages,
+        "page_size": articles_per_page,
+        "articles": articles,
+    }
+
+
+class MockNewsServer:
+    """
+    Asyncio server answering every request with the same JSON body.
+
+    Args:
+        latency: Seconds to wait before answering each request
+        body: Response body; defaults to ``make_search_response()``
+    """
+
+    def __init__(self, latency: float = 0.05, body: Optional[bytes] = None):
+        self.latency = latency
+        self.body = body if body is not None else json.dumps(make_search_response()).encode()
+        self.connections_opened = 0
+        self.open_connections = 0
+        self.peak_open_connections = 0
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> str:
+        """Start listening on a free local port and return the base URL."""
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def reset_counters(self) -> None:
+        self.connections_opened = self.requests = 0
+        self.peak_open_connections = self.open_connections
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections_opened += 1
+        self.open_connections += 1
+        self.peak_open_connections = max(self.peak_open_connections, self.open_connections)
+        try:
+            prefix = b""
+            while len(prefix) < 4:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    return
+                prefix += chunk
+            if prefix.startswith(H2_PREFACE[:4]):
+                await self._serve_http2(prefix, reader, writer)
+            else:
+                await self._serve_http1(prefix, reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.open_connections -= 1
+            writer.close()
+
+    async def _serve_http1(self, buffer: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while True:
+            while b"\r\n\r\n" not in buffer:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    return
+                buffer += chunk
+            head, buffer = buffer.split(b"\r\n\r\n", 1)
+            content_length = 0
+            for line in head.split(b"\r\n")[1:]:
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    content_length = int(value)
+            while len(buffer) < content_length:
+                buffer += await reader.readexactly(content_length - len(buffer))
+            buffer = buffer[content_length:]
+
+            self.requests += 1
+            await asyncio.sleep(self.latency)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+                + f"content-length: {len(self.body)}\r\n\r\n".encode()
+                + self.body
+            )
+            await writer.drain()
+
+    async def _serve_http2(self, data: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        connection = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        connection.initiate_connection()
+        window_open = asyncio.Event()
+        tasks = set()
+
+        async def respond(stream_id: int) -> None:
+            self.requests += 1
+            await asyncio.sleep(self.latency)
+            connection.send_headers(
+                stream_id,
+                [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(self.body)))],
+            )
+            remaining = self.body
+            while remaining:
+                size = min(connection.local_flow_control_window(stream_id), connection.max_outbound_frame_size)
+                if size <= 0:
+                    writer.write(connection.data_to_send())
+                    window_open.clear()
+                    await window_open.wait()
+                    continue
+                connection.send_data(stream_id, remaining[:size])
+                remaining = remaining[size:]
+            connection.end_stream(stream_id)
+            writer.write(connection.data_to_send())
+
+        while data:
+            for event in connection.receive_data(data):
+                if isinstance(event, h2.events.DataReceived):
+                    connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    task = asyncio.ensure_future(respond(event.stream_id))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                elif isinstance(event, h2.events.WindowUpdated):
+                    window_open.set()
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(connection.data_to_send())
+            data = await reader.read(65536)
+        for task in tasks:
+            task.cancel()
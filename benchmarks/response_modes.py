@@ -0,0 +1,93 @@
+"""
+Compare response parsing throughput across ``response_mode`` settings.
+
+Parses the same search response body, ``--articles`` NLP-enriched articles
+per page, with each mode and reports articles parsed per second. With
+``--embeddings`` every article also carries a 1024-dimensional embedding, as
+on the ``v3_nlp_embeddings`` plan, and ``--embedding-format numpy`` decodes them as
+``numpy.float32`` arrays. The memory held by one parsed page is reported too.
+
+In ``lazy`` mode only ``id``, ``title``, ``link`` and ``published_date`` are
+read from each article, as a typical pipeline would; the other modes build
+every field up front.
+
+Usage:
+    python benchmarks/response_modes.py --articles 1000
+    python benchmarks/response_modes.py --articles 100 --embeddings
+    python benchmarks/response_modes.py --articles 100 --embeddings --embedding-format numpy
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from newscatcher.core.parsing import parse_json_as
+from newscatcher.search.types.get_search_response import GetSearchResponse
+from serialization import make_articles
+
+
+def read_articles(response: Any) -> None:
+    for article in response.articles:
+        (article.id, article.title, article.link, article.published_date)
+
+
+def articles_per_second(parse: Callable[[], Any], articles: int, rounds: int) -> float:
+    parse()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        parse()
+    return rounds * articles / (time.perf_counter() - started)
+
+
+def retained_megabytes(parse: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    response = parse()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del response
+    return retained / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=1000, help="articles per page")
+    parser.add_argument("--rounds", type=int, default=10, help="timed parses per mode")
+    parser.add_argument("--embeddings", action="store_true", help="add a 1024-float embedding to every article")
+    parser.add_argument(
+        "--embedding-format", choices=("list", "numpy"), default="list", help="how embeddings are decoded"
+    )
+    args = parser.parse_args()
+
+    articles = make_articles(args.articles)
+    if args.embeddings:
+        for article in articles:
+            article["nlp"]["new_embedding"] = [i / 1024 for i in range(1024)]
+    page = {"status": "ok", "total_hits": len(articles), "page": 1, "total_pages": 1, "page_size": len(articles)}
+    content = json.dumps({**page, "articles": articles}).encode()
+
+    print(f"{args.articles} articles per page, {len(content) / 1e6:.1f} MB body\n")
+    print(f"{'mode':<10} {'articles/s':>12} {'ms/page':>10} {'MB held':>10}")
+    for mode in ("validate", "lazy", "trusted"):
+
+        def parse(mode: Any = mode) -> Any:
+            response = parse_json_as(
+                GetSearchResponse, content, response_mode=mode, embedding_format=args.embedding_format
+            )
+            if mode == "lazy":
+                read_articles(response)
+            return response
+
+        rate = articles_per_second(parse, len(articles), args.rounds)
+        held = retained_megabytes(parse)
+        print(f"{mode:<10} {rate:>12,.0f} {len(articles) / rate * 1000:>10.1f} {held:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
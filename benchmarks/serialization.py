@@ -0,0 +1,122 @@
+"""
+Measure the per-article cost of alias conversion on response bodies.
+
+Runs ``convert_and_respect_annotation_metadata`` in the ``read`` direction,
+as ``parse_obj_as`` does before validation, over single ``ArticleEntity``
+payloads and over a ``ClusteredSearchResponseDto`` page, and reports the time
+per article. Articles carry NLP data with named entities, so the conversion
+has aliases to rewrite.
+
+With ``--baseline REF`` the implementation of ``core/serialization.py`` at
+that git revision is timed on the same payloads for comparison.
+
+Usage:
+    python benchmarks/serialization.py --articles 100 --clusters 10
+    python benchmarks/serialization.py --baseline HEAD~1
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+import types
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from mock_server import make_search_response
+from newscatcher.core import serialization
+from newscatcher.types.article_entity import ArticleEntity
+from newscatcher.types.clustered_search_response_dto import ClusteredSearchResponseDto
+
+Convert = Callable[..., Any]
+
+
+def make_articles(count: int) -> List[Dict[str, Any]]:
+    articles = make_search_response(articles_per_page=count)["articles"]
+    for article in articles:
+        article["nlp"] = {
+            "theme": "Business, Tech",
+            "summary": "A short summary of the article.",
+            "sentiment": {"title": 0.1, "content": -0.2},
+            "ner_PER": [{"entity_name": f"Person {i}", "count": i} for i in range(5)],
+            "ner_ORG": [{"entity_name": f"Org {i}", "count": i} for i in range(5)],
+            "ner_LOC": [{"entity_name": "Paris", "count": 2}],
+            "ner_MISC": [],
+        }
+        article["all_links"] = [f"https://example.com/related/{i}" for i in range(10)]
+        article["additional_domain_info"] = {"is_news_domain": True, "news_type": "News and Blogs"}
+    return articles
+
+
+def make_clustered_response(articles: List[Dict[str, Any]], clusters: int) -> Dict[str, Any]:
+    per_cluster = max(1, len(articles) // clusters)
+    return {
+        "status": "ok",
+        "total_hits": len(articles),
+        "page": 1,
+        "total_pages": 1,
+        "page_size": len(articles),
+        "clusters_count": clusters,
+        "clusters": [
+            {
+                "cluster_id": str(i),
+                "cluster_size": per_cluster,
+                "articles": articles[i * per_cluster : (i + 1) * per_cluster],
+            }
+            for i in range(clusters)
+        ],
+    }
+
+
+def load_baseline(ref: str) -> Convert:
+    source = subprocess.run(
+        ["git", "show", f"{ref}:src/newscatcher/core/serialization.py"],
+        cwd=os.path.join(os.path.dirname(__file__), ".."),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    module = types.ModuleType("baseline_serialization")
+    exec(compile(source, f"{ref}:serialization.py", "exec"), module.__dict__)
+    # Models are annotated with the current FieldMetadata class
+    module.FieldMetadata = serialization.FieldMetadata  # type: ignore[attr-defined]
+    return module.convert_and_respect_annotation_metadata  # type: ignore[no-any-return]
+
+
+def time_per_article(convert: Convert, annotation: Any, objects: List[Any], articles: int, rounds: int) -> float:
+    for object_ in objects:
+        convert(object_=object_, annotation=annotation, direction="read")
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for object_ in objects:
+            convert(object_=object_, annotation=annotation, direction="read")
+    return (time.perf_counter() - started) / (rounds * articles) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=100, help="articles per page")
+    parser.add_argument("--clusters", type=int, default=10, help="clusters in the clustered page")
+    parser.add_argument("--rounds", type=int, default=50, help="timed passes over the payloads")
+    parser.add_argument("--baseline", default=None, help="git revision to compare against")
+    args = parser.parse_args()
+
+    articles = make_articles(args.articles)
+    clustered = make_clustered_response(articles, args.clusters)
+    implementations: Dict[str, Convert] = {"current": serialization.convert_and_respect_annotation_metadata}
+    if args.baseline is not None:
+        implementations[args.baseline] = load_baseline(args.baseline)
+
+    print(f"{args.articles} articles, {args.clusters} clusters, {args.rounds} rounds\n")
+    print(f"{'implementation':<16} {'ArticleEntity us':>18} {'Clustered us':>14}")
+    for label, convert in implementations.items():
+        article_us = time_per_article(convert, ArticleEntity, articles, len(articles), args.rounds)
+        clustered_us = time_per_article(convert, ClusteredSearchResponseDto, [clustered], len(articles), args.rounds)
+        print(f"{label:<16} {article_us:>18.2f} {clustered_us:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from ..core.api_error import ApiError
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
 from ..core.http_response import AsyncHttpResponse, HttpResponse
 from ..core.parse_error import ParsingError
+from ..core.parsing import parse_json_as
 from ..core.pydantic_utilities import parse_obj_as
 from ..core.request_options import RequestOptions
 from ..core.serialization import convert_and_respect_annotation_metadata
@@ -338,9 +339,10 @@ class RawAuthorsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetAuthorsResponse,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=GetAuthorsResponse,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -671,9 +673,10 @@ class RawAuthorsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     PostAuthorsResponse,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=PostAuthorsResponse,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -1032,9 +1035,10 @@ class AsyncRawAuthorsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetAuthorsResponse,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=GetAuthorsResponse,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1365,9 +1369,10 @@ class AsyncRawAuthorsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     PostAuthorsResponse,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=PostAuthorsResponse,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -5,8 +5,15 @@ from __future__ import annotations
 import typing
 
 import httpx
+from .core.circuit_breaker import CircuitBreaker
 from .core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from .core.concurrency import AdaptiveConcurrencyController
+from .core.hedging import RequestHedger
 from .core.logging import LogConfig, Logger
+from .core.parsing import EmbeddingFormat, ResponseMode
+from .core.rate_limiter import RateLimiter
+from .core.response_cache import ResponseCache
+from .core.transport import DEFAULT_LIMITS, AsyncStreamLimitedTransport, StreamLimitedTransport
 from .environment import NewscatcherApiEnvironment
 
 if typing.TYPE_CHECKING:
@@ -54,9 +61,36 @@ class BaseNewscatcherApi:
     httpx_client : typing.Optional[httpx.Client]
         The httpx client to use for making requests, a preconfigured client is used by default, however this is useful should you want to pass in any custom httpx configuration.
 
+    http2 : bool
+        Whether the default httpx client negotiates HTTP/2, so that concurrent requests are multiplexed as streams over a few connections instead of opening one connection each. Requires the `h2` package (`pip install newscatcher-sdk[http2]`). Irrelevant if a custom httpx client is passed in.
+
+    limits : typing.Optional[httpx.Limits]
+        Connection pool sizing of the default httpx client: `max_connections`, `max_keepalive_connections` and `keepalive_expiry`. Irrelevant if a custom httpx client is passed in.
+
+    max_concurrent_streams : typing.Optional[int]
+        Maximum number of requests the default httpx client keeps open at once, i.e. HTTP/2 streams across the pool. Defaults to no limit beyond the server's. Irrelevant if a custom httpx client is passed in.
+
     logging : typing.Optional[typing.Union[LogConfig, Logger]]
         Configure logging for the SDK. Accepts a LogConfig dict with 'level' (debug/info/warn/error), 'logger' (custom logger implementation), and 'silent' (boolean, defaults to True) fields. You can also pass a pre-configured Logger instance.
 
+    response_mode : ResponseMode
+        How response bodies are parsed. "validate" validates every field. "lazy" leaves lists of models, such as the articles of a search response, as `LazyModel` views that validate a field the first time it is read, which saves CPU and memory when only a few fields are used; `.materialize()` returns the full model. "trusted" skips validation altogether and builds the models, nested ones included, straight from the JSON, for high-volume harvests where the API is trusted. Per-request `response_mode` in `request_options` takes precedence. Defaults to "validate".
+
+    embedding_format : EmbeddingFormat
+        How the `new_embedding` and `qwen_embedding` article embeddings are decoded. "list" keeps the lists of floats. "numpy" stores each one as a contiguous `numpy.float32` array, about an eighth of the memory, in the `Numpy` subclasses of the article models; use `stack_embeddings` to get a page's embeddings as one matrix. Requires the numpy extra and Pydantic v2. Per-request `embedding_format` in `request_options` takes precedence. Defaults to "list".
+
+    rate_limiter : typing.Optional[RateLimiter]
+        Pace requests with a token bucket learned from the X-RateLimit response headers, so that concurrent requests stay under the plan's rate limit instead of being retried after 429 responses. A limiter can be shared by several clients that use the same API key.
+
+    coalesce_requests : bool
+        Whether identical requests made at the same time share one network call. Requests are identical when method, URL, query parameters, JSON body and headers match; the first caller sends the request and the others receive its response. Defaults to False.
+
+    response_cache : typing.Optional[ResponseCache]
+        Serve repeated requests from a cache instead of the API. Successful responses are kept for the TTL of their endpoint, so dashboards that re-run the same queries stop re-fetching sources, counts and search pages. A cache can be shared by several clients.
+
+    circuit_breaker : typing.Optional[CircuitBreaker]
+        Fail fast while an endpoint is down. After repeated connection errors, timeouts or 5xx responses, requests to the endpoint raise `CircuitOpenError` immediately instead of retrying with backoff, until a probe request succeeds. A breaker can be shared by several clients.
+
     Examples
     --------
     from newscatcher import NewscatcherApi
@@ -77,7 +111,16 @@ class BaseNewscatcherApi:
         max_retries: typing.Optional[int] = None,
         follow_redirects: typing.Optional[bool] = True,
         httpx_client: typing.Optional[httpx.Client] = None,
+        http2: bool = False,
+        limits: typing.Optional[httpx.Limits] = None,
+        max_concurrent_streams: typing.Optional[int] = None,
         logging: typing.Optional[typing.Union[LogConfig, Logger]] = None,
+        response_mode: ResponseMode = "validate",
+        embedding_format: EmbeddingFormat = "list",
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
     ):
         _defaulted_timeout = (
             timeout if timeout is not None else 60 if httpx_client is None else httpx_client.timeout.read
@@ -89,12 +132,22 @@ class BaseNewscatcherApi:
             headers=headers,
             httpx_client=httpx_client
             if httpx_client is not None
-            else httpx.Client(timeout=_defaulted_timeout, follow_redirects=follow_redirects)
-            if follow_redirects is not None
-            else httpx.Client(timeout=_defaulted_timeout),
+            else _make_default_client(
+                timeout=_defaulted_timeout,
+                follow_redirects=follow_redirects,
+                http2=http2,
+                limits=limits,
+                max_concurrent_streams=max_concurrent_streams,
+            ),
             timeout=_defaulted_timeout,
             max_retries=_defaulted_max_retries,
             logging=logging,
+            response_mode=response_mode,
+            embedding_format=embedding_format,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            circuit_breaker=circuit_breaker,
         )
         self._search: typing.Optional[SearchClient] = None
         self._latest_headlines: typing.Optional[LatestHeadlinesClient] = None
@@ -170,22 +223,68 @@ class BaseNewscatcherApi:
         return self._subscription
 
 
+def _transport_options(
+    http2: bool,
+    limits: typing.Optional[httpx.Limits],
+) -> typing.Dict[str, typing.Any]:
+    options: typing.Dict[str, typing.Any] = {}
+    if http2:
+        options["http2"] = True
+    if limits is not None:
+        options["limits"] = limits
+    return options
+
+
+def _make_default_client(
+    timeout: typing.Optional[float],
+    follow_redirects: typing.Optional[bool],
+    http2: bool = False,
+    limits: typing.Optional[httpx.Limits] = None,
+    max_concurrent_streams: typing.Optional[int] = None,
+) -> httpx.Client:
+    options = _transport_options(http2, limits)
+    if max_concurrent_streams is not None:
+        options = {
+            "transport": StreamLimitedTransport(
+                httpx.HTTPTransport(http2=http2, limits=limits if limits is not None else DEFAULT_LIMITS),
+                max_concurrent_streams,
+            )
+        }
+    if follow_redirects is not None:
+        return httpx.Client(timeout=timeout, follow_redirects=follow_redirects, **options)
+    return httpx.Client(timeout=timeout, **options)
+
+
 def _make_default_async_client(
     timeout: typing.Optional[float],
     follow_redirects: typing.Optional[bool],
+    http2: bool = False,
+    limits: typing.Optional[httpx.Limits] = None,
+    max_concurrent_streams: typing.Optional[int] = None,
 ) -> httpx.AsyncClient:
-    try:
-        import httpx_aiohttp  # type: ignore[import-not-found]
-    except ImportError:
-        pass
-    else:
-        if follow_redirects is not None:
-            return httpx_aiohttp.HttpxAiohttpClient(timeout=timeout, follow_redirects=follow_redirects)
-        return httpx_aiohttp.HttpxAiohttpClient(timeout=timeout)
+    options = _transport_options(http2, limits)
+    if max_concurrent_streams is not None:
+        options = {
+            "transport": AsyncStreamLimitedTransport(
+                httpx.AsyncHTTPTransport(http2=http2, limits=limits if limits is not None else DEFAULT_LIMITS),
+                max_concurrent_streams,
+            )
+        }
+
+    # aiohttp speaks HTTP/1.1 only, so it is used only without transport options
+    if not options:
+        try:
+            import httpx_aiohttp  # type: ignore[import-not-found]
+        except ImportError:
+            pass
+        else:
+            if follow_redirects is not None:
+                return httpx_aiohttp.HttpxAiohttpClient(timeout=timeout, follow_redirects=follow_redirects)
+            return httpx_aiohttp.HttpxAiohttpClient(timeout=timeout)
 
     if follow_redirects is not None:
-        return httpx.AsyncClient(timeout=timeout, follow_redirects=follow_redirects)
-    return httpx.AsyncClient(timeout=timeout)
+        return httpx.AsyncClient(timeout=timeout, follow_redirects=follow_redirects, **options)
+    return httpx.AsyncClient(timeout=timeout, **options)
 
 
 class AsyncBaseNewscatcherApi:
@@ -222,9 +321,42 @@ class AsyncBaseNewscatcherApi:
     httpx_client : typing.Optional[httpx.AsyncClient]
         The httpx client to use for making requests, a preconfigured client is used by default, however this is useful should you want to pass in any custom httpx configuration.
 
+    http2 : bool
+        Whether the default httpx client negotiates HTTP/2, so that concurrent requests are multiplexed as streams over a few connections instead of opening one connection each. Requires the `h2` package (`pip install newscatcher-sdk[http2]`). Irrelevant if a custom httpx client is passed in.
+
+    limits : typing.Optional[httpx.Limits]
+        Connection pool sizing of the default httpx client: `max_connections`, `max_keepalive_connections` and `keepalive_expiry`. Irrelevant if a custom httpx client is passed in.
+
+    max_concurrent_streams : typing.Optional[int]
+        Maximum number of requests the default httpx client keeps open at once, i.e. HTTP/2 streams across the pool. Defaults to no limit beyond the server's. Irrelevant if a custom httpx client is passed in.
+
     logging : typing.Optional[typing.Union[LogConfig, Logger]]
         Configure logging for the SDK. Accepts a LogConfig dict with 'level' (debug/info/warn/error), 'logger' (custom logger implementation), and 'silent' (boolean, defaults to True) fields. You can also pass a pre-configured Logger instance.
 
+    response_mode : ResponseMode
+        How response bodies are parsed. "validate" validates every field. "lazy" leaves lists of models, such as the articles of a search response, as `LazyModel` views that validate a field the first time it is read, which saves CPU and memory when only a few fields are used; `.materialize()` returns the full model. "trusted" skips validation altogether and builds the models, nested ones included, straight from the JSON, for high-volume harvests where the API is trusted. Per-request `response_mode` in `request_options` takes precedence. Defaults to "validate".
+
+    embedding_format : EmbeddingFormat
+        How the `new_embedding` and `qwen_embedding` article embeddings are decoded. "list" keeps the lists of floats. "numpy" stores each one as a contiguous `numpy.float32` array, about an eighth of the memory, in the `Numpy` subclasses of the article models; use `stack_embeddings` to get a page's embeddings as one matrix. Requires the numpy extra and Pydantic v2. Per-request `embedding_format` in `request_options` takes precedence. Defaults to "list".
+
+    rate_limiter : typing.Optional[RateLimiter]
+        Pace requests with a token bucket learned from the X-RateLimit response headers, so that concurrent requests stay under the plan's rate limit instead of being retried after 429 responses. A limiter can be shared by several clients that use the same API key.
+
+    concurrency_controller : typing.Optional[AdaptiveConcurrencyController]
+        Adapt the number of requests in flight with additive-increase/multiplicative-decrease: grow while responses are fast and successful, back off on 429, 5xx or rising latency. Applies to every endpoint of this client; harvests such as `get_all_articles` schedule up to the controller's `max_limit` requests.
+
+    coalesce_requests : bool
+        Whether identical requests made at the same time share one network call. Requests are identical when method, URL, query parameters, JSON body and headers match; the first caller sends the request and the others receive its response. Defaults to False.
+
+    response_cache : typing.Optional[ResponseCache]
+        Serve repeated requests from a cache instead of the API. Successful responses are kept for the TTL of their endpoint, so dashboards that re-run the same queries stop re-fetching sources, counts and search pages. A cache can be shared by several clients.
+
+    request_hedger : typing.Optional[RequestHedger]
+        Duplicate first-page `search` and `latest_headlines` requests that are slower than a percentile of their recent latency, and use whichever response arrives first. The number of duplicates is capped by the hedger's budget.
+
+    circuit_breaker : typing.Optional[CircuitBreaker]
+        Fail fast while an endpoint is down. After repeated connection errors, timeouts or 5xx responses, requests to the endpoint raise `CircuitOpenError` immediately instead of retrying with backoff, until a probe request succeeds. A breaker can be shared by several clients.
+
     Examples
     --------
     from newscatcher import AsyncNewscatcherApi
@@ -245,7 +377,18 @@ class AsyncBaseNewscatcherApi:
         max_retries: typing.Optional[int] = None,
         follow_redirects: typing.Optional[bool] = True,
         httpx_client: typing.Optional[httpx.AsyncClient] = None,
+        http2: bool = False,
+        limits: typing.Optional[httpx.Limits] = None,
+        max_concurrent_streams: typing.Optional[int] = None,
         logging: typing.Optional[typing.Union[LogConfig, Logger]] = None,
+        response_mode: ResponseMode = "validate",
+        embedding_format: EmbeddingFormat = "list",
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        concurrency_controller: typing.Optional[AdaptiveConcurrencyController] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+        request_hedger: typing.Optional[RequestHedger] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
     ):
         _defaulted_timeout = (
             timeout if timeout is not None else 60 if httpx_client is None else httpx_client.timeout.read
@@ -257,10 +400,24 @@ class AsyncBaseNewscatcherApi:
             headers=headers,
             httpx_client=httpx_client
             if httpx_client is not None
-            else _make_default_async_client(timeout=_defaulted_timeout, follow_redirects=follow_redirects),
+            else _make_default_async_client(
+                timeout=_defaulted_timeout,
+                follow_redirects=follow_redirects,
+                http2=http2,
+                limits=limits,
+                max_concurrent_streams=max_concurrent_streams,
+            ),
             timeout=_defaulted_timeout,
             max_retries=_defaulted_max_retries,
             logging=logging,
+            response_mode=response_mode,
+            embedding_format=embedding_format,
+            rate_limiter=rate_limiter,
+            concurrency_controller=concurrency_controller,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            request_hedger=request_hedger,
+            circuit_breaker=circuit_breaker,
         )
         self._search: typing.Optional[AsyncSearchClient] = None
         self._latest_headlines: typing.Optional[AsyncLatestHeadlinesClient] = None
@@ -7,6 +7,7 @@ from ..core.api_error import ApiError
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
 from ..core.http_response import AsyncHttpResponse, HttpResponse
 from ..core.parse_error import ParsingError
+from ..core.parsing import parse_json_as
 from ..core.pydantic_utilities import parse_obj_as
 from ..core.request_options import RequestOptions
 from ..errors.bad_request_error import BadRequestError
@@ -157,9 +158,10 @@ class RawBreakingNewsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     BreakingNewsResponseDto,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=BreakingNewsResponseDto,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -362,9 +364,10 @@ class RawBreakingNewsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     BreakingNewsResponseDto,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=BreakingNewsResponseDto,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -568,9 +571,10 @@ class AsyncRawBreakingNewsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     BreakingNewsResponseDto,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=BreakingNewsResponseDto,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -773,9 +777,10 @@ class AsyncRawBreakingNewsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     BreakingNewsResponseDto,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=BreakingNewsResponseDto,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -0,0 +1,232 @@
+"""
+Checkpoint storage for long-running bulk harvests.
+
+A checkpoint records every (chunk, page) unit that a harvest has fully
+delivered, together with the ids used for deduplication and the number of
+articles returned so far. Re-running ``get_all_articles`` or
+``iter_all_articles`` with the same ``job_id`` skips completed units and
+continues where the previous run stopped.
+
+The same store also keeps sync watermarks for ``get_new_articles``: the
+latest article date returned for a query and the ids at that boundary.
+"""
+
+import datetime
+import json
+import sqlite3
+import threading
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Set, Tuple
+
+# Page number recorded for a chunk that adaptive chunking split in half
+SPLIT_PAGE = 0
+
+ChunkKey = Tuple[str, str]
+
+
+class CheckpointState(NamedTuple):
+    """
+    Saved progress of a harvest job.
+
+    The job's seen ids are not loaded with it; stream them with
+    ``SQLiteCheckpointStore.iter_seen_ids``.
+    """
+
+    from_date: datetime.datetime
+    to_date: datetime.datetime
+    completed_units: Dict[ChunkKey, Dict[int, int]]
+    article_count: int
+
+
+class Watermark(NamedTuple):
+    """Latest article date returned by a sync and the ids near it."""
+
+    timestamp: datetime.datetime
+    boundary_ids: Set[str]
+
+
+class SQLiteCheckpointStore:
+    """
+    Persist harvest progress in a local SQLite database.
+
+    Each delivered page is committed in a single transaction with its article
+    ids, so a job killed at any point resumes without losing or repeating
+    delivered pages. One database file can hold any number of jobs.
+
+    Args:
+        path: Path of the SQLite database file, created if missing
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job_id TEXT PRIMARY KEY, from_date TEXT NOT NULL, to_date TEXT NOT NULL, "
+                "article_count INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS units ("
+                "job_id TEXT NOT NULL, chunk_start TEXT NOT NULL, chunk_end TEXT NOT NULL, "
+                "page INTEGER NOT NULL, total_pages INTEGER NOT NULL, "
+                "PRIMARY KEY (job_id, chunk_start, chunk_end, page))"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS seen_ids ("
+                "job_id TEXT NOT NULL, article_id TEXT NOT NULL, "
+                "PRIMARY KEY (job_id, article_id))"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks ("
+                "sync_key TEXT PRIMARY KEY, timestamp TEXT NOT NULL, boundary_ids TEXT NOT NULL)"
+            )
+
+    def load_job(self, job_id: str) -> Optional[CheckpointState]:
+        """
+        Load the saved progress of a job.
+
+        Args:
+            job_id: Identifier of the harvest job
+
+        Returns:
+            CheckpointState, or None if the job has never been started
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT from_date, to_date, article_count FROM jobs WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            completed_units: Dict[ChunkKey, Dict[int, int]] = {}
+            for chunk_start, chunk_end, page, total_pages in self._connection.execute(
+                "SELECT chunk_start, chunk_end, page, total_pages FROM units WHERE job_id = ?",
+                (job_id,),
+            ):
+                completed_units.setdefault((chunk_start, chunk_end), {})[page] = total_pages
+
+        return CheckpointState(
+            from_date=datetime.datetime.fromisoformat(row[0]),
+            to_date=datetime.datetime.fromisoformat(row[1]),
+            completed_units=completed_units,
+            article_count=row[2],
+        )
+
+    def iter_seen_ids(self, job_id: str, batch_size: int = 10000) -> Iterator[str]:
+        """
+        Stream the ids a job has delivered, ``batch_size`` rows at a time.
+
+        Only one batch is held in memory, so the ids of a large job can be
+        replayed into a compact ``Deduplicator`` without building a set of
+        them first. Each batch is read in its own query, in id order, so
+        the store stays usable between batches.
+        """
+        last_id = ""
+        while True:
+            with self._lock:
+                batch = self._connection.execute(
+                    "SELECT article_id FROM seen_ids WHERE job_id = ? AND article_id > ? "
+                    "ORDER BY article_id LIMIT ?",
+                    (job_id, last_id, batch_size),
+                ).fetchall()
+            for (article_id,) in batch:
+                yield article_id
+            if len(batch) < batch_size:
+                return
+            last_id = batch[-1][0]
+
+    def start_job(
+        self, job_id: str, from_date: datetime.datetime, to_date: datetime.datetime
+    ) -> None:
+        """
+        Register a new job and the resolved date range it covers.
+
+        The range is stored so that a resumed job with relative dates such as
+        ``from_="7d"`` keeps the original windows.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO jobs (job_id, from_date, to_date) VALUES (?, ?, ?)",
+                (job_id, from_date.isoformat(), to_date.isoformat()),
+            )
+
+    def record_unit(
+        self,
+        job_id: str,
+        chunk: ChunkKey,
+        page: int,
+        total_pages: int,
+        article_ids: Iterable[str],
+        article_count: int,
+    ) -> None:
+        """
+        Mark one (chunk, page) unit as delivered.
+
+        Args:
+            job_id: Identifier of the harvest job
+            chunk: (chunk_start, chunk_end) as ISO strings
+            page: Page number, or SPLIT_PAGE for a chunk that was bisected
+            total_pages: total_pages reported by the chunk's first page
+            article_ids: Ids of the articles delivered from this page
+            article_count: Total number of articles delivered so far
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO units (job_id, chunk_start, chunk_end, page, total_pages) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, chunk[0], chunk[1], page, total_pages),
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO seen_ids (job_id, article_id) VALUES (?, ?)",
+                ((job_id, article_id) for article_id in article_ids),
+            )
+            self._connection.execute(
+                "UPDATE jobs SET article_count = ? WHERE job_id = ?",
+                (article_count, job_id),
+            )
+
+    def delete_job(self, job_id: str) -> None:
+        """Remove all saved progress of a job."""
+        with self._lock, self._connection:
+            for table in ("units", "seen_ids", "jobs"):
+                self._connection.execute(f"DELETE FROM {table} WHERE job_id = ?", (job_id,))
+
+    def load_watermark(self, sync_key: str) -> Optional[Watermark]:
+        """
+        Load the watermark of a sync.
+
+        Args:
+            sync_key: Identifier of the synced query
+
+        Returns:
+            Watermark, or None if the query has never been synced
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT timestamp, boundary_ids FROM watermarks WHERE sync_key = ?",
+                (sync_key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return Watermark(datetime.datetime.fromisoformat(row[0]), set(json.loads(row[1])))
+
+    def save_watermark(self, sync_key: str, watermark: Watermark) -> None:
+        """Replace the watermark of a sync."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO watermarks (sync_key, timestamp, boundary_ids) "
+                "VALUES (?, ?, ?)",
+                (
+                    sync_key,
+                    watermark.timestamp.isoformat(),
+                    json.dumps(sorted(watermark.boundary_ids)),
+                ),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
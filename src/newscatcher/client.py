@@ -2,17 +2,52 @@ import sys
 import os
 import datetime
 import asyncio
+import hashlib
+import inspect
+import json
 import re
-from typing import Optional, Union, List, Set, Tuple, Any
+import time
+import warnings
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import aclosing, closing
+from typing import (
+    Optional,
+    Union,
+    List,
+    Set,
+    Tuple,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+)
 
 from .base_client import BaseNewscatcherApi, AsyncBaseNewscatcherApi
+from .checkpoint import SPLIT_PAGE, CheckpointState, SQLiteCheckpointStore, Watermark
+from .dedup import Deduplicator, NearDuplicateDetector
+from .core.compression import TransferStats
+from .core.deadline import request_options_with_deadline
 from .utils import (
     parse_time_parameters,
     create_time_chunks,
+    parse_time_chunk_size,
+    bisect_time_chunk,
     setup_progress_tracking,
     format_datetime,
     calculate_when_param,
     safe_get_articles,
+    advance_watermark,
+    filter_articles_to_window,
+    extract_time_frame_counts,
+    plan_time_chunks,
+    HarvestPlan,
+    HarvestReport,
+    AGGREGATION_BUCKET_DELTAS,
 )
 
 
@@ -513,10 +548,43 @@ class QueryValidator:
         )
 
 
+class _DeferredCall:
+    """Future-like call that runs in the consuming thread when its result is requested."""
+
+    def __init__(self, fn: Callable[..., Any], *args: Any):
+        self._fn = fn
+        self._args = args
+
+    def result(self) -> Any:
+        return self._fn(*self._args)
+
+
 class NewscatcherMixin:
     """Common functionality for both synchronous and asynchronous Newscatcher API clients."""
 
     DEFAULT_MAX_ARTICLES = 100000
+    MAX_PAGES_PER_CHUNK = 10
+    MAX_TOTAL_HITS = 10000
+    MIN_ADAPTIVE_CHUNK = datetime.timedelta(minutes=1)
+    # Arguments of get_all_articles that control how a harvest runs, not which articles match
+    HARVEST_OPTIONS = frozenset(
+        {
+            "max_articles",
+            "show_progress",
+            "deduplicate",
+            "validate_query",
+            "concurrency",
+            "adaptive_chunking",
+            "plan",
+            "checkpoint",
+            "job_id",
+            "near_duplicates",
+            "deadline",
+            "report",
+            "page_size",
+            "request_options",
+        }
+    )
 
     def __init__(self):
         """Initialize the mixin with shared components."""
@@ -526,10 +594,23 @@ class NewscatcherMixin:
         """Validate query syntax using the QueryValidator."""
         return self.query_validator.validate_query(query)
 
+    @property
+    def transfer_stats(self) -> TransferStats:
+        """Response body bytes received on the wire and after decompression."""
+        return self._client_wrapper.httpx_client.transfer_stats
+
     def prepare_time_chunks(self, endpoint_type, **kwargs):
         """Prepare time chunks for API requests."""
         from_date, to_date, chunk_delta = parse_time_parameters(endpoint_type, **kwargs)
-        time_chunks = create_time_chunks(from_date, to_date, chunk_delta)
+        plan = kwargs.get("plan")
+        if plan is not None:
+            from_date, to_date = plan.from_date, plan.to_date
+            time_chunks = plan.time_chunks()
+        elif kwargs.get("adaptive_chunking"):
+            # Start from the whole range; dense windows are bisected on demand
+            time_chunks = [(from_date, to_date)]
+        else:
+            time_chunks = create_time_chunks(from_date, to_date, chunk_delta)
 
         desc = (
             f"Fetching {'article' if endpoint_type == 'search' else 'headlines'} chunks"
@@ -560,8 +641,244 @@ class NewscatcherMixin:
 
         return request_params
 
+    def _with_deadline(self, request_params, deadline_at):
+        """Give a harvest request the time left before ``deadline_at`` as its deadline."""
+        if deadline_at is None:
+            return request_params
+        request_options = request_options_with_deadline(request_params.get("request_options"), deadline_at)
+        return {**request_params, "request_options": request_options}
+
+    def _deadline_passed(self, deadline_at, show_progress: bool) -> bool:
+        """Whether a harvest has run out of time, in which case it stops early."""
+        if deadline_at is None or time.monotonic() < deadline_at:
+            return False
+        if show_progress:
+            print("\nDeadline reached, returning the articles fetched so far")
+        return True
+
+    def _total_pages(self, response) -> int:
+        """Return the total_pages reported by a page response."""
+        return getattr(response, "total_pages", 1) or 1
+
+    def _followup_pages(self, total_pages: int, completed_pages=()) -> List[int]:
+        """Return the page numbers still to fetch after the first page of a chunk."""
+        return [
+            page
+            for page in range(2, min(total_pages, self.MAX_PAGES_PER_CHUNK) + 1)
+            if page not in completed_pages
+        ]
+
+    def _checkpoint_key(self, chunk) -> Tuple[str, str]:
+        """Return the key under which a chunk is stored in a checkpoint."""
+        return chunk[0].isoformat(), chunk[1].isoformat()
+
+    def _completed_pages(self, completed_units, chunk) -> Dict[int, int]:
+        """Return {page: total_pages} for the units of a chunk already delivered."""
+        if not completed_units:
+            return {}
+        return completed_units.get(self._checkpoint_key(chunk), {})
+
+    def _resume_checkpoint(self, checkpoint, job_id, from_, to):
+        """
+        Load a job's saved progress and the date range it must keep using.
+
+        Returns:
+            Tuple of (state, from_, to). ``state`` is None for a new job.
+        """
+        if checkpoint is None:
+            return None, from_, to
+        if not job_id:
+            raise ValueError("job_id is required when a checkpoint store is given")
+        state = checkpoint.load_job(job_id)
+        if state is None:
+            return None, from_, to
+        return state, state.from_date, state.to_date
+
+    def _split_chunk(self, chunk, first_response):
+        """
+        Bisect a chunk whose first page shows more hits than can be paged through.
+
+        A chunk is oversized when it reports more than ``MAX_PAGES_PER_CHUNK``
+        pages or when ``total_hits`` is at the API's 10,000 cap (which hides the
+        true count).
+
+        Args:
+            chunk: The (chunk_start, chunk_end) pair that was fetched
+            first_response: The first page response for that chunk
+
+        Returns:
+            Two half chunks, or None if the chunk fits or is already at
+            ``MIN_ADAPTIVE_CHUNK`` width
+        """
+        if not self._is_oversized(first_response):
+            return None
+        return bisect_time_chunk(chunk[0], chunk[1], self.MIN_ADAPTIVE_CHUNK)
+
+    def _is_oversized(self, first_response) -> bool:
+        """Whether a chunk has more hits than ``MAX_PAGES_PER_CHUNK`` pages can return."""
+        total_pages = self._total_pages(first_response)
+        total_hits = getattr(first_response, "total_hits", 0) or 0
+        return total_pages > self.MAX_PAGES_PER_CHUNK or total_hits >= self.MAX_TOTAL_HITS
+
+    def _headline_window_splitter(self, from_date, to_date, time_chunk_size, first_pages):
+        """
+        Return the rule for splitting an oversized headline harvest into ``when`` windows.
+
+        ``latest_headlines`` only accepts ``when``, a whole number of hours or
+        days that always ends at the current time. The harvest therefore
+        starts with the whole range as one request. Only if that request is
+        oversized is the range split into ``time_chunk_size`` windows.
+
+        The windows are not exact. The request for a window [start, end)
+        reaches back to ``start`` rounded up to a whole hour, and forward to
+        now, so it overlaps the windows on both sides of it. Each window's
+        articles are then filtered to [start, end) on the client, which keeps
+        every article in at most one window, but every request still pages
+        through everything newer than its window, up to
+        ``MAX_PAGES_PER_CHUNK`` pages. Windows that would send the same
+        ``when`` are merged. The oldest window sends the same request as the
+        whole range, so the first page already fetched is stored in
+        ``first_pages`` under its ``when`` for ``fetch_page`` to reuse.
+
+        Splitting cannot bound a request's end, so it does not make requests
+        smaller, and the transfer grows with the number of windows rather
+        than the number of articles. A window whose own request is oversized
+        cannot be split further, and its oldest articles may lie beyond the
+        last page, so the harvest may be truncated. A ``RuntimeWarning`` names
+        the window rather than letting those articles go missing silently.
+
+        Returns:
+            ``split_chunk`` callable for ``_iter_chunk_pages``
+        """
+        windows: List[Tuple[datetime.datetime, datetime.datetime]] = []
+        for window in create_time_chunks(from_date, to_date, parse_time_chunk_size(time_chunk_size)):
+            if windows and calculate_when_param(to_date, window[0]) == calculate_when_param(to_date, windows[-1][0]):
+                windows[-1] = (windows[-1][0], window[1])
+            else:
+                windows.append(window)
+
+        def split_chunk(chunk, first_response):
+            if not self._is_oversized(first_response):
+                return None
+            if chunk == (from_date, to_date) and len(windows) > 1:
+                first_pages[calculate_when_param(to_date, from_date)] = first_response
+                return windows
+            warnings.warn(
+                f"Headlines from {format_datetime(chunk[0])} to {format_datetime(chunk[1])} may be incomplete: "
+                f"when={calculate_when_param(to_date, chunk[0])} has more hits than "
+                f"{self.MAX_PAGES_PER_CHUNK} pages return, newest first. get_all_articles can bound both ends.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            return None
+
+        return split_chunk
+
+    def _headline_date_field(self, params) -> str:
+        """Return the article date that ``when`` filters on."""
+        return "parse_date" if params.get("by_parse_date") else "published_date"
+
+    def _aggregation_params(self, params):
+        """Keep only the parameters that the aggregation count endpoint accepts."""
+        accepted = inspect.signature(self.aggregation_count.post).parameters
+        if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in accepted.values()):
+            return dict(params)
+        return {key: value for key, value in params.items() if key in accepted}
+
+    def _build_harvest_plan(
+        self, response, from_date, to_date, aggregation_by, page_size, fill_ratio
+    ) -> HarvestPlan:
+        """Turn an aggregation count histogram into a HarvestPlan."""
+        capacity = int(
+            min(self.MAX_PAGES_PER_CHUNK * page_size, self.MAX_TOTAL_HITS) * fill_ratio
+        )
+        chunks = plan_time_chunks(
+            extract_time_frame_counts(response),
+            from_date,
+            to_date,
+            AGGREGATION_BUCKET_DELTAS[aggregation_by],
+            capacity,
+        )
+        return HarvestPlan(
+            chunks, from_date, to_date, page_size, self.MAX_PAGES_PER_CHUNK
+        )
+
+    def _sync_key(self, q, params) -> str:
+        """Derive a stable sync key from a query and its search filters."""
+        filters = {key: value for key, value in params.items() if key not in self.HARVEST_OPTIONS}
+        canonical = json.dumps({"q": q, **filters}, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _sync_window(self, store, sync_key, initial_from, overlap):
+        """Return the watermark of a sync and the ``from_`` its next run starts at."""
+        watermark = store.load_watermark(sync_key)
+        if watermark is None:
+            return None, initial_from
+        return watermark, watermark.timestamp - overlap
+
+    def _finish_sync(self, store, sync_key, articles, watermark, overlap, params, report):
+        """
+        Filter already-returned articles and persist the advanced watermark.
+
+        The watermark is only advanced when the harvest fetched the whole
+        range. Otherwise articles in the failed or cut-off parts could be
+        dated before the new watermark and never be fetched again.
+        """
+        date_field = "parse_date" if params.get("by_parse_date") else "published_date"
+        new_articles, next_watermark = advance_watermark(
+            articles, watermark, overlap, date_field
+        )
+        if not report.complete:
+            warnings.warn(
+                f"Sync {sync_key!r} was incomplete ({report!r}); its watermark was not advanced, "
+                "so the next sync fetches the same range again",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+        elif next_watermark is not None:
+            store.save_watermark(sync_key, Watermark(*next_watermark))
+        return new_articles
+
+    def _seen_ids(self, deduplicate, state, checkpoint=None, job_id=None):
+        """
+        Resolve ``deduplicate`` into an on/off flag and the container of seen ids.
+
+        ``deduplicate`` is either a bool, which uses a plain ``set``, or a
+        ``Deduplicator`` backend. When resuming, the ids saved in the
+        checkpoint are streamed into it.
+        """
+        if isinstance(deduplicate, bool) or deduplicate is None:
+            enabled, seen_ids = bool(deduplicate), set()
+        else:
+            enabled, seen_ids = True, deduplicate
+        if enabled and state is not None and checkpoint is not None:
+            for article_id in checkpoint.iter_seen_ids(job_id):
+                seen_ids.add(article_id)
+        return enabled, seen_ids
+
+    def _record_unit(
+        self, checkpoint, job_id, chunk, page, response, articles, article_count
+    ) -> None:
+        """Record a delivered (chunk, page) unit in the checkpoint store, if any."""
+        if checkpoint is None:
+            return
+        checkpoint.record_unit(
+            job_id,
+            self._checkpoint_key(chunk),
+            page,
+            self._total_pages(response),
+            [article.id for article in articles if getattr(article, "id", None)],
+            article_count,
+        )
+
     def _process_articles(
-        self, articles_data, seen_ids, deduplicate, max_articles, current_count
+        self,
+        articles_data,
+        seen_ids,
+        deduplicate,
+        max_articles,
+        current_count,
+        near_duplicates=None,
     ):
         """Process articles with deduplication and limits."""
         processed_articles = []
@@ -577,6 +894,9 @@ class NewscatcherMixin:
                 if article_id:
                     seen_ids.add(article_id)
 
+            if near_duplicates is not None and not near_duplicates.add(article):
+                continue
+
             processed_articles.append(article)
             current_count += 1
 
@@ -610,13 +930,119 @@ class NewscatcherApi(BaseNewscatcherApi, NewscatcherMixin):
         time_chunk_size: str = "1h",
         max_articles: Optional[int] = None,
         show_progress: bool = False,
-        deduplicate: bool = True,
+        deduplicate: Union[bool, Deduplicator] = True,
         validate_query: bool = True,
-        concurrency: int = 3,
+        concurrency: int = 1,
+        adaptive_chunking: bool = False,
+        plan: Optional[HarvestPlan] = None,
+        checkpoint: Optional[SQLiteCheckpointStore] = None,
+        job_id: Optional[str] = None,
+        near_duplicates: Optional[NearDuplicateDetector] = None,
+        deadline: Optional[float] = None,
+        report: Optional[HarvestReport] = None,
         **kwargs,
     ) -> List[Any]:
-        """Retrieve all articles matching search criteria, bypassing the 10,000 limit."""
+        """
+        Retrieve all articles matching search criteria, bypassing the 10,000 limit.
+
+        With ``concurrency`` greater than 1, chunks and pages are fetched by a
+        thread pool of that size. All threads share this client's
+        ``httpx.Client`` and therefore its connection pool. Articles are
+        returned in the same order as with serial fetching.
+
+        With ``adaptive_chunking=True``, ``time_chunk_size`` is ignored. The
+        harvest starts from the whole range, and any window whose first page
+        has more hits than 10 pages can hold is bisected recursively. Quiet
+        spans are fetched as one wide window, and dense ones are split until
+        nothing is truncated.
+
+        With a ``plan`` from ``plan_articles_harvest``, the plan's chunks are
+        fetched and ``from_``, ``to`` and ``time_chunk_size`` are ignored.
+        ``adaptive_chunking`` can be combined with a plan as a safety net
+        for chunks the histogram underestimated.
+
+        With a ``checkpoint`` store and a ``job_id``, every delivered
+        (chunk, page) unit and the deduplication state are saved as the
+        harvest runs. Calling again with the same ``job_id`` skips the saved
+        units, keeps the original date range and returns only the articles
+        not delivered before. Use the same ``time_chunk_size`` or ``plan``
+        when resuming.
+
+        ``deduplicate`` also accepts a backend from ``newscatcher.dedup``,
+        such as ``BloomDeduplicator``, to bound the memory spent on seen ids.
+        ``near_duplicates`` takes a ``NearDuplicateDetector`` that drops or
+        tags syndicated copies of a story published under different ids.
+
+        ``deadline`` bounds the whole harvest, in seconds. Every request gets
+        the time left as its ``deadline`` request option, so retries that
+        cannot finish in time are skipped, and the articles fetched so far
+        are returned once it passes.
+
+        Chunks and pages whose requests fail are skipped. Pass a
+        ``HarvestReport`` as ``report`` to find out whether any were, or
+        whether ``max_articles`` or ``deadline`` cut the harvest short.
+        """
+        all_articles = list(
+            self.iter_all_articles(
+                q,
+                from_=from_,
+                to=to,
+                time_chunk_size=time_chunk_size,
+                max_articles=max_articles,
+                show_progress=show_progress,
+                deduplicate=deduplicate,
+                validate_query=validate_query,
+                concurrency=concurrency,
+                adaptive_chunking=adaptive_chunking,
+                plan=plan,
+                checkpoint=checkpoint,
+                job_id=job_id,
+                near_duplicates=near_duplicates,
+                deadline=deadline,
+                report=report,
+                **kwargs,
+            )
+        )
+
+        if show_progress:
+            print(f"\nCompleted: Retrieved {len(all_articles)} articles")
+
+        return all_articles
+
+    def iter_all_articles(
+        self,
+        q: str,
+        from_: Optional[Union[str, datetime.datetime]] = None,
+        to: Optional[Union[str, datetime.datetime]] = None,
+        time_chunk_size: str = "1h",
+        max_articles: Optional[int] = None,
+        show_progress: bool = False,
+        deduplicate: Union[bool, Deduplicator] = True,
+        validate_query: bool = True,
+        concurrency: int = 1,
+        adaptive_chunking: bool = False,
+        plan: Optional[HarvestPlan] = None,
+        checkpoint: Optional[SQLiteCheckpointStore] = None,
+        job_id: Optional[str] = None,
+        page_batches: bool = False,
+        near_duplicates: Optional[NearDuplicateDetector] = None,
+        deadline: Optional[float] = None,
+        report: Optional[HarvestReport] = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """
+        Stream articles matching search criteria as each page is processed.
 
+        Takes the same arguments as ``get_all_articles``, but yields articles as
+        soon as their page arrives instead of collecting them into one list.
+        Memory is bounded by the pages in flight. With ``page_batches=True``,
+        each item is the list of new articles from one page. Stopping
+        iteration early cancels any outstanding requests.
+
+        Raises:
+            ValueError: Immediately, if the query or time parameters are
+                        invalid, or if ``checkpoint`` is given without ``job_id``
+        """
         if validate_query:
             is_valid, error_message = self.validate_query(q)
             if not is_valid:
@@ -625,90 +1051,297 @@ class NewscatcherApi(BaseNewscatcherApi, NewscatcherMixin):
         if max_articles is None:
             max_articles = self.DEFAULT_MAX_ARTICLES
 
+        state, from_, to = self._resume_checkpoint(checkpoint, job_id, from_, to)
+
         from_date, to_date, chunks_iter = self.prepare_time_chunks(
             "search",
             from_=from_,
             to=to,
             time_chunk_size=time_chunk_size,
             show_progress=show_progress,
+            adaptive_chunking=adaptive_chunking,
+            plan=plan,
         )
 
-        all_articles = []
-        seen_ids: Set[str] = set()
-        current_count = 0
+        if checkpoint is not None and state is None:
+            checkpoint.start_job(job_id, from_date, to_date)
 
-        for chunk_start, chunk_end in chunks_iter:
-            chunk_from = format_datetime(chunk_start)
-            chunk_to = format_datetime(chunk_end)
+        request_params = self.prepare_request_params(kwargs)
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
 
-            request_params = self.prepare_request_params(kwargs)
+        def fetch_page(chunk_start, chunk_end, page):
+            return self.search.post(
+                q=q,
+                from_=format_datetime(chunk_start),
+                to=format_datetime(chunk_end),
+                page=page,
+                **self._with_deadline(request_params, deadline_at),
+            )
 
-            try:
-                first_page_response = self.search.post(
-                    q=q, from_=chunk_from, to=chunk_to, page=1, **request_params
-                )
+        pages = self._iter_chunk_pages(
+            fetch_page,
+            chunks_iter,
+            concurrency,
+            show_progress=show_progress,
+            adaptive_chunking=adaptive_chunking,
+            deadline_at=deadline_at,
+            completed_units=state.completed_units if state else None,
+            report=report,
+        )
+        return self._iter_processed_articles(
+            pages,
+            deduplicate,
+            max_articles,
+            show_progress,
+            page_batches,
+            checkpoint=checkpoint,
+            job_id=job_id,
+            state=state,
+            near_duplicates=near_duplicates,
+            report=report,
+        )
 
-                articles_data = safe_get_articles(first_page_response)
+    def get_new_articles(
+        self,
+        q: str,
+        store: SQLiteCheckpointStore,
+        sync_key: Optional[str] = None,
+        initial_from: Union[str, datetime.datetime] = "1d",
+        overlap: datetime.timedelta = datetime.timedelta(minutes=30),
+        time_chunk_size: str = "1h",
+        **kwargs,
+    ) -> List[Any]:
+        """
+        Retrieve only the articles published since the previous call for this query.
+
+        A watermark is kept in ``store`` for each query: the latest
+        ``published_date`` returned (``parse_date`` with
+        ``by_parse_date=True``) and the ids of the articles within
+        ``overlap`` of it. Each call fetches from ``watermark - overlap`` to
+        now, drops the boundary ids returned last time, and advances the
+        watermark. The overlap re-covers articles indexed late, so set it
+        to the indexing delay you expect. The first call fetches from
+        ``initial_from``.
+
+        If a chunk or page fails, or ``max_articles`` or ``deadline`` cuts
+        the harvest short, the articles fetched are still returned but the
+        watermark is kept, with a ``RuntimeWarning``. The next call then
+        fetches the same range again and may return some articles twice.
 
-                if articles_data:
-                    processed_articles, current_count, should_continue = (
-                        self._process_articles(
-                            articles_data,
-                            seen_ids,
-                            deduplicate,
-                            max_articles,
-                            current_count,
-                        )
-                    )
+        Args:
+            q: Search query
+            store: Store that persists the watermark between runs
+            sync_key: Name of the watermark. Defaults to a hash of ``q`` and the search filters
+            initial_from: Start of the range on the first sync
+            overlap: How far before the watermark each sync starts
+            time_chunk_size: Chunk size, as passed to get_all_articles
+            **kwargs: Other arguments, as passed to get_all_articles
+
+        Returns:
+            Articles not returned by an earlier sync
+        """
+        sync_key = sync_key or self._sync_key(q, kwargs)
+        watermark, from_ = self._sync_window(store, sync_key, initial_from, overlap)
 
-                    all_articles.extend(processed_articles)
+        report = HarvestReport()
+        articles = self.get_all_articles(
+            q, from_=from_, time_chunk_size=time_chunk_size, report=report, **kwargs
+        )
 
-                    if not should_continue:
-                        if show_progress:
-                            print(f"\nReached maximum article limit ({max_articles}).")
-                        break
+        return self._finish_sync(store, sync_key, articles, watermark, overlap, kwargs, report)
 
-                    total_pages = getattr(first_page_response, "total_pages", 1)
-
-                    if total_pages > 1:
-                        for page in range(2, min(total_pages + 1, 11)):
-                            if current_count >= max_articles:
-                                break
-
-                            page_response = self.search.post(
-                                q=q,
-                                from_=chunk_from,
-                                to=chunk_to,
-                                page=page,
-                                **request_params,
-                            )
-
-                            page_articles = safe_get_articles(page_response)
-                            if page_articles:
-                                processed_articles, current_count, should_continue = (
-                                    self._process_articles(
-                                        page_articles,
-                                        seen_ids,
-                                        deduplicate,
-                                        max_articles,
-                                        current_count,
-                                    )
-                                )
-
-                                all_articles.extend(processed_articles)
-
-                                if not should_continue:
-                                    break
-
-            except Exception as e:
-                if show_progress:
-                    print(f"Error processing chunk {chunk_from} to {chunk_to}: {e}")
-                continue
+    def plan_articles_harvest(
+        self,
+        q: str,
+        from_: Optional[Union[str, datetime.datetime]] = None,
+        to: Optional[Union[str, datetime.datetime]] = None,
+        aggregation_by: str = "hour",
+        page_size: int = 1000,
+        fill_ratio: float = 0.9,
+        validate_query: bool = True,
+        **kwargs,
+    ) -> HarvestPlan:
+        """
+        Plan get_all_articles chunks from a single aggregation count request.
 
-        if show_progress:
-            print(f"\nCompleted: Retrieved {len(all_articles)} articles")
+        The per-hour (or per-day) article histogram for the query is packed into
+        chunks that each hold at most ``fill_ratio`` of what 10 pages of
+        ``page_size`` can return. No search requests are made, so
+        ``estimated_requests`` on the returned plan shows the harvest's cost
+        before any quota is spent.
 
-        return all_articles
+        Args:
+            q: Search query, as passed to get_all_articles
+            from_: Start of the range, as passed to get_all_articles
+            to: End of the range, as passed to get_all_articles
+            aggregation_by: Histogram resolution, either "hour" or "day"
+            page_size: Page size the harvest will use
+            fill_ratio: Fraction of the per-chunk ceiling to fill, leaving room
+                        for articles indexed after planning
+            validate_query: Whether to validate the query syntax first
+            **kwargs: Search filters, as passed to get_all_articles
+
+        Returns:
+            HarvestPlan to pass to get_all_articles(plan=...)
+        """
+        if validate_query:
+            is_valid, error_message = self.validate_query(q)
+            if not is_valid:
+                raise ValueError(f"Invalid query syntax: {error_message}")
+
+        if aggregation_by not in AGGREGATION_BUCKET_DELTAS:
+            raise ValueError(
+                f"Unsupported aggregation_by for planning: {aggregation_by}. Use 'hour' or 'day'."
+            )
+
+        from_date, to_date, _ = parse_time_parameters("search", from_=from_, to=to)
+
+        response = self.aggregation_count.post(
+            q=q,
+            aggregation_by=aggregation_by,
+            from_=format_datetime(from_date),
+            to=format_datetime(to_date),
+            **self._aggregation_params(kwargs),
+        )
+
+        return self._build_harvest_plan(
+            response, from_date, to_date, aggregation_by, page_size, fill_ratio
+        )
+
+    def _iter_chunk_pages(
+        self,
+        fetch_page: Callable[[datetime.datetime, datetime.datetime, int], Any],
+        chunks: Iterable[Tuple[datetime.datetime, datetime.datetime]],
+        concurrency: int,
+        show_progress: bool = False,
+        adaptive_chunking: bool = False,
+        completed_units: Optional[Dict[Tuple[str, str], Dict[int, int]]] = None,
+        split_chunk: Optional[Callable[..., Any]] = None,
+        deadline_at: Optional[float] = None,
+        report: Optional[HarvestReport] = None,
+    ) -> Iterator[Tuple[Tuple[datetime.datetime, datetime.datetime], int, Any]]:
+        """
+        Fetch every (chunk, page) unit, optionally through a thread pool.
+
+        With ``concurrency`` of 1 or less, requests are made one at a time in
+        the calling thread, only when the consumer reaches them. Otherwise a ``ThreadPoolExecutor`` with
+        ``concurrency`` workers fetches page 1 up to ``2 * concurrency`` chunks
+        ahead of the consumer. Each worker queues the remaining pages of its
+        chunk on the same pool as soon as ``total_pages`` is known. Workers
+        never wait on each other, so the pool cannot deadlock. Results are
+        yielded in chunk order, then page order. Closing the generator cancels
+        queued requests and waits for in-flight ones to finish.
+
+        With ``adaptive_chunking``, a chunk whose first page is oversized (see
+        ``_split_chunk``) is bisected. Both halves are fetched in its place, and
+        the oversized first page is yielded as page ``SPLIT_PAGE`` so that the
+        split can be checkpointed.
+
+        Units listed in ``completed_units`` are not fetched again. A chunk
+        recorded as split is bisected without a request, and a chunk whose
+        first page is done reuses its recorded ``total_pages``.
+
+        Args:
+            fetch_page: Callable invoked as ``fetch_page(chunk_start, chunk_end, page)``
+            chunks: Iterable of (chunk_start, chunk_end) pairs
+            concurrency: Number of worker threads
+            show_progress: Whether to print chunk errors
+            adaptive_chunking: Whether to bisect oversized chunks
+            completed_units: Units already delivered, from a CheckpointState
+            split_chunk: Replaces ``_split_chunk`` as the rule for splitting a
+                         chunk after its first page
+            deadline_at: ``time.monotonic()`` value at which to stop yielding
+            report: HarvestReport to count failed units and a passed deadline in
+
+        Yields:
+            Tuples of ((chunk_start, chunk_end), page, response)
+        """
+        if split_chunk is None and adaptive_chunking:
+            split_chunk = self._split_chunk
+
+        executor: Optional[ThreadPoolExecutor] = None
+        if concurrency > 1:
+            executor = ThreadPoolExecutor(
+                max_workers=concurrency, thread_name_prefix="newscatcher-harvest"
+            )
+            submit: Callable[..., Any] = executor.submit
+        else:
+            submit = _DeferredCall
+        lookahead = max(2, concurrency * 2)
+
+        def expand_chunk(chunk_start, chunk_end):
+            chunk = (chunk_start, chunk_end)
+            completed_pages = self._completed_pages(completed_units, chunk)
+            if SPLIT_PAGE in completed_pages:
+                halves = bisect_time_chunk(chunk_start, chunk_end, self.MIN_ADAPTIVE_CHUNK)
+                return None, [], [(half, submit(expand_chunk, *half)) for half in halves]
+
+            if 1 in completed_pages:
+                first_response, total_pages = None, completed_pages[1]
+            else:
+                first_response = fetch_page(chunk_start, chunk_end, 1)
+                total_pages = self._total_pages(first_response)
+                halves = split_chunk(chunk, first_response) if split_chunk else None
+                if halves:
+                    return first_response, [], [(half, submit(expand_chunk, *half)) for half in halves]
+
+            page_futures = [
+                (page, submit(fetch_page, chunk_start, chunk_end, page))
+                for page in self._followup_pages(total_pages, completed_pages)
+            ]
+            return first_response, page_futures, []
+
+        chunk_iter = iter(chunks)
+        pending: Deque[Tuple[Tuple[datetime.datetime, datetime.datetime], "Future[Any]"]] = deque()
+
+        def schedule_chunks() -> None:
+            while len(pending) < lookahead:
+                chunk = next(chunk_iter, None)
+                if chunk is None:
+                    return
+                pending.append((chunk, submit(expand_chunk, *chunk)))
+
+        try:
+            schedule_chunks()
+            while pending:
+                if self._deadline_passed(deadline_at, show_progress):
+                    if report is not None:
+                        report.truncated = True
+                    return
+                chunk, chunk_future = pending.popleft()
+                try:
+                    first_response, page_futures, halves = chunk_future.result()
+                except Exception as e:
+                    if show_progress:
+                        print(
+                            f"Error processing chunk {format_datetime(chunk[0])} to {format_datetime(chunk[1])}: {e}"
+                        )
+                    if report is not None:
+                        report.failed_units += 1
+                    schedule_chunks()
+                    continue
+
+                if halves:
+                    pending.extendleft(reversed(halves))
+                    if first_response is not None:
+                        yield chunk, SPLIT_PAGE, first_response
+                    continue
+
+                schedule_chunks()
+                if first_response is not None:
+                    yield chunk, 1, first_response
+
+                for page, page_future in page_futures:
+                    try:
+                        page_response = page_future.result()
+                    except Exception:
+                        if report is not None:
+                            report.failed_units += 1
+                        continue
+                    yield chunk, page, page_response
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
 
     def get_all_headlines(
         self,
@@ -716,148 +1349,182 @@ class NewscatcherApi(BaseNewscatcherApi, NewscatcherMixin):
         time_chunk_size: str = "1h",
         max_articles: Optional[int] = None,
         show_progress: bool = False,
-        deduplicate: bool = True,
+        deduplicate: Union[bool, Deduplicator] = True,
+        near_duplicates: Optional[NearDuplicateDetector] = None,
+        deadline: Optional[float] = None,
         **kwargs,
     ) -> List[Any]:
         """
         Fetch all latest headlines by splitting the request into
         multiple time-based chunks to overcome the 10,000 article limit.
+
+        The whole ``when`` range is requested first. If it has more hits than
+        10 pages can return, it is split into ``time_chunk_size`` windows.
+        The endpoint cannot bound a window's end, and rounds its start to a
+        whole hour, so window requests overlap; each window's results are
+        filtered to the window on the client, by ``published_date``
+        (``parse_date`` with ``by_parse_date=True``). Every window request
+        also pages through the articles newer than the window, so a split
+        harvest transfers far more than it keeps, and a window that is itself
+        oversized may be truncated, which is reported with a
+        ``RuntimeWarning`` (see ``_headline_window_splitter``).
+
+        ``deadline`` bounds the whole harvest, as in ``get_all_articles``.
+        """
+        all_articles = list(
+            self.iter_all_headlines(
+                when=when,
+                time_chunk_size=time_chunk_size,
+                max_articles=max_articles,
+                show_progress=show_progress,
+                deduplicate=deduplicate,
+                near_duplicates=near_duplicates,
+                deadline=deadline,
+                **kwargs,
+            )
+        )
+
+        self.log_completion(show_progress, len(all_articles))
+        return all_articles
+
+    def iter_all_headlines(
+        self,
+        when: Optional[Union[datetime.datetime, str]] = None,
+        time_chunk_size: str = "1h",
+        max_articles: Optional[int] = None,
+        show_progress: bool = False,
+        deduplicate: Union[bool, Deduplicator] = True,
+        page_batches: bool = False,
+        near_duplicates: Optional[NearDuplicateDetector] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> Iterator[Any]:
         """
+        Stream latest headlines as each page is processed.
 
-        # Set defaults
+        Takes the same arguments as ``get_all_headlines``. See
+        ``iter_all_articles`` for ``page_batches`` and early stopping.
+        """
         if max_articles is None:
             max_articles = self.DEFAULT_MAX_ARTICLES
 
-        # Parse time parameters - this converts when="1d" to proper time ranges
-        from_date, to_date, chunk_delta = parse_time_parameters(
-            "latestheadlines", when=when, time_chunk_size=time_chunk_size
+        from_date, to_date, chunks_iter = self.prepare_time_chunks(
+            "latest_headlines",
+            when=when,
+            time_chunk_size=time_chunk_size,
+            show_progress=show_progress,
+            adaptive_chunking=True,
+        )
+        first_pages: Dict[str, Any] = {}
+        split_chunk = self._headline_window_splitter(
+            from_date, to_date, time_chunk_size, first_pages
         )
 
-        # Create time chunks
-        time_chunks = create_time_chunks(from_date, to_date, chunk_delta)
+        request_params = self.prepare_request_params(kwargs)
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+
+        def fetch_page(chunk_start, chunk_end, page):
+            when = calculate_when_param(to_date, chunk_start)
+            if page == 1 and when in first_pages:
+                # The same request as the whole range, already sent
+                return first_pages.pop(when)
+            return self.latest_headlines.post(
+                when=when,
+                page=page,
+                **self._with_deadline(request_params, deadline_at),
+            )
 
-        # Setup progress tracking
-        desc = "Fetching headlines chunks"
-        is_test = "pytest" in sys.modules or "TEST_MODE" in os.environ
-        chunks_iter = setup_progress_tracking(
-            time_chunks,
+        pages = self._iter_chunk_pages(
+            fetch_page,
+            chunks_iter,
+            1,
+            show_progress=show_progress,
+            split_chunk=split_chunk,
+            deadline_at=deadline_at,
+        )
+        return self._iter_processed_articles(
+            pages,
+            deduplicate,
+            max_articles,
             show_progress,
-            description=desc,
-            is_test=is_test,
+            page_batches,
+            near_duplicates=near_duplicates,
+            window_field=self._headline_date_field(kwargs),
         )
 
-        all_articles = []
-        seen_ids = set()
-        current_count = 0
-
-        # Prepare request parameters
-        request_params = {**kwargs}
-        if "page" in request_params:
-            del request_params["page"]
-        if "page_size" not in request_params:
-            request_params["page_size"] = 1000
-
-        # Process each time chunk
-        for chunk_start, chunk_end in chunks_iter:
-            if current_count >= max_articles:
-                break
+    def _iter_processed_articles(
+        self,
+        pages,
+        deduplicate,
+        max_articles,
+        show_progress,
+        page_batches,
+        checkpoint: Optional[SQLiteCheckpointStore] = None,
+        job_id: Optional[str] = None,
+        state: Optional[CheckpointState] = None,
+        near_duplicates: Optional[NearDuplicateDetector] = None,
+        window_field: Optional[str] = None,
+        report: Optional[HarvestReport] = None,
+    ) -> Iterator[Any]:
+        """
+        Deduplicate and limit articles from a page stream, yielding them as they arrive.
 
-            try:
-                # Convert chunk times to the expected format using calculate_when_param
-                when_param = calculate_when_param(
-                    chunk_end, chunk_start
-                )  # This creates "1d", "2h", etc.
+        With ``window_field``, articles dated outside their chunk are dropped
+        first (see ``filter_articles_to_window``).
 
-                # Make the first request
-                first_response = self.latest_headlines.post(
-                    when=when_param, page=1, **request_params
-                )
-
-                # Get articles safely from first response
-                first_articles = safe_get_articles(first_response)
-
-                if first_articles:
-                    # Process first page articles
-                    processed_articles, current_count, should_continue = (
-                        self._process_articles(
-                            first_articles,
-                            seen_ids,
-                            deduplicate,
-                            max_articles,
-                            current_count,
-                        )
+        With a ``checkpoint``, each unit is recorded once all of its articles
+        have been yielded, so a resumed job may repeat at most the page that
+        was being consumed when it stopped.
+        """
+        deduplicate, seen_ids = self._seen_ids(deduplicate, state, checkpoint, job_id)
+        current_count = state.article_count if state else 0
+
+        with closing(pages):
+            for chunk, page, response in pages:
+                articles_data = safe_get_articles(response) if page != SPLIT_PAGE else []
+                if window_field and articles_data:
+                    articles_data = filter_articles_to_window(
+                        articles_data, chunk[0], chunk[1], window_field
                     )
+                if not articles_data:
+                    self._record_unit(checkpoint, job_id, chunk, page, response, [], current_count)
+                    continue
 
-                    all_articles.extend(processed_articles)
+                processed_articles, current_count, should_continue = (
+                    self._process_articles(
+                        articles_data,
+                        seen_ids,
+                        deduplicate,
+                        max_articles,
+                        current_count,
+                        near_duplicates,
+                    )
+                )
 
-                    # Stop if we've reached the limit
-                    if not should_continue:
-                        if show_progress:
-                            print(
-                                f"\nReached maximum article limit ({max_articles}). Stopping."
-                            )
-                        break
+                if processed_articles:
+                    if page_batches:
+                        yield processed_articles
+                    else:
+                        yield from processed_articles
 
-                    # Get total pages for pagination
-                    total_pages = getattr(first_response, "total_pages", 1)
-
-                    # If there are more pages, fetch them
-                    if total_pages > 1:
-                        for page in range(2, min(total_pages + 1, 11)):
-                            if current_count >= max_articles:
-                                break
-
-                            try:
-                                page_response = self.latest_headlines.post(
-                                    when=when_param, page=page, **request_params
-                                )
-
-                                # Get articles safely from page response
-                                page_articles = safe_get_articles(page_response)
-
-                                # Process articles if any were found
-                                if page_articles:
-                                    (
-                                        processed_articles,
-                                        current_count,
-                                        should_continue,
-                                    ) = self._process_articles(
-                                        page_articles,
-                                        seen_ids,
-                                        deduplicate,
-                                        max_articles,
-                                        current_count,
-                                    )
-
-                                    all_articles.extend(processed_articles)
-
-                                    # Stop if we've reached the limit
-                                    if not should_continue:
-                                        if show_progress:
-                                            print(
-                                                f"\nReached maximum article limit ({max_articles}). Stopping."
-                                            )
-                                        break
-
-                            except Exception as e:
-                                print(f"Error fetching page {page}: {str(e)}")
-                                # Continue with partial results
-
-                        # Stop processing chunks if we've reached the limit
-                        if not should_continue:
-                            break
-
-            except Exception as e:
-                print(f"Error processing chunk {chunk_start} to {chunk_end}: {str(e)}")
-                # Continue with next chunk
+                if should_continue:
+                    self._record_unit(
+                        checkpoint, job_id, chunk, page, response, processed_articles, current_count
+                    )
 
-        self.log_completion(show_progress, len(all_articles))
-        return all_articles
+                if not should_continue or current_count >= max_articles:
+                    if show_progress:
+                        print(f"\nReached maximum article limit ({max_articles}).")
+                    if report is not None:
+                        report.truncated = True
+                    return
 
 
 class AsyncNewscatcherApi(AsyncBaseNewscatcherApi, NewscatcherMixin):
     """Asynchronous Newscatcher API client with unlimited article retrieval."""
 
+    DEFAULT_CONCURRENCY = 3
+
     def __init__(self, api_key: str, **kwargs):
         """Initialize the asynchronous client."""
         AsyncBaseNewscatcherApi.__init__(self, api_key=api_key, **kwargs)
@@ -871,13 +1538,91 @@ class AsyncNewscatcherApi(AsyncBaseNewscatcherApi, NewscatcherMixin):
         time_chunk_size: str = "1h",
         max_articles: Optional[int] = None,
         show_progress: bool = False,
-        deduplicate: bool = True,
+        deduplicate: Union[bool, Deduplicator] = True,
         validate_query: bool = True,
-        concurrency: int = 3,
+        concurrency: Optional[int] = None,
+        adaptive_chunking: bool = False,
+        plan: Optional[HarvestPlan] = None,
+        checkpoint: Optional[SQLiteCheckpointStore] = None,
+        job_id: Optional[str] = None,
+        near_duplicates: Optional[NearDuplicateDetector] = None,
+        deadline: Optional[float] = None,
+        report: Optional[HarvestReport] = None,
         **kwargs,
     ) -> List[Any]:
-        """Asynchronously retrieve all articles matching search criteria."""
+        """
+        Asynchronously retrieve all articles matching search criteria.
+
+        Every (chunk, page) request shares a single pool of ``concurrency``
+        in-flight calls, so first pages of upcoming chunks are fetched while
+        later pages of earlier chunks are still in flight. Articles are still
+        returned in chunk order, then page order. ``concurrency`` defaults to
+        ``DEFAULT_CONCURRENCY``, or to the ``max_limit`` of the client's
+        ``AdaptiveConcurrencyController``.
+
+        ``adaptive_chunking``, ``plan``, ``checkpoint``, ``job_id``,
+        ``deadline`` and ``report`` work as in ``NewscatcherApi.get_all_articles``.
+        """
+        all_articles = [
+            article
+            async for article in self.aiter_all_articles(
+                q,
+                from_=from_,
+                to=to,
+                time_chunk_size=time_chunk_size,
+                max_articles=max_articles,
+                show_progress=show_progress,
+                deduplicate=deduplicate,
+                validate_query=validate_query,
+                concurrency=concurrency,
+                adaptive_chunking=adaptive_chunking,
+                plan=plan,
+                checkpoint=checkpoint,
+                job_id=job_id,
+                near_duplicates=near_duplicates,
+                deadline=deadline,
+                report=report,
+                **kwargs,
+            )
+        ]
+
+        if show_progress:
+            print(f"\nCompleted: Retrieved {len(all_articles)} articles")
+
+        return all_articles
+
+    def aiter_all_articles(
+        self,
+        q: str,
+        from_: Optional[Union[str, datetime.datetime]] = None,
+        to: Optional[Union[str, datetime.datetime]] = None,
+        time_chunk_size: str = "1h",
+        max_articles: Optional[int] = None,
+        show_progress: bool = False,
+        deduplicate: Union[bool, Deduplicator] = True,
+        validate_query: bool = True,
+        concurrency: Optional[int] = None,
+        adaptive_chunking: bool = False,
+        plan: Optional[HarvestPlan] = None,
+        checkpoint: Optional[SQLiteCheckpointStore] = None,
+        job_id: Optional[str] = None,
+        page_batches: bool = False,
+        near_duplicates: Optional[NearDuplicateDetector] = None,
+        deadline: Optional[float] = None,
+        report: Optional[HarvestReport] = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """
+        Asynchronously stream articles matching search criteria.
+
+        The async generator counterpart of ``NewscatcherApi.iter_all_articles``.
+        Use it with ``async for``. Breaking out early (preferably inside
+        ``contextlib.aclosing``) cancels outstanding requests.
 
+        Raises:
+            ValueError: Immediately, if the query or time parameters are
+                        invalid, or if ``checkpoint`` is given without ``job_id``
+        """
         if validate_query:
             is_valid, error_message = self.validate_query(q)
             if not is_valid:
@@ -886,110 +1631,264 @@ class AsyncNewscatcherApi(AsyncBaseNewscatcherApi, NewscatcherMixin):
         if max_articles is None:
             max_articles = self.DEFAULT_MAX_ARTICLES
 
+        state, from_, to = self._resume_checkpoint(checkpoint, job_id, from_, to)
+
         from_date, to_date, chunks_iter = self.prepare_time_chunks(
             "search",
             from_=from_,
             to=to,
             time_chunk_size=time_chunk_size,
             show_progress=show_progress,
+            adaptive_chunking=adaptive_chunking,
+            plan=plan,
         )
 
-        all_articles = []
-        seen_ids: Set[str] = set()
-        current_count = 0
+        if checkpoint is not None and state is None:
+            checkpoint.start_job(job_id, from_date, to_date)
 
-        for chunk_start, chunk_end in chunks_iter:
-            chunk_from = format_datetime(chunk_start)
-            chunk_to = format_datetime(chunk_end)
+        request_params = self.prepare_request_params(kwargs)
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
 
-            request_params = self.prepare_request_params(kwargs)
+        async def fetch_page(chunk_start, chunk_end, page):
+            return await self.search.post(
+                q=q,
+                from_=format_datetime(chunk_start),
+                to=format_datetime(chunk_end),
+                page=page,
+                **self._with_deadline(request_params, deadline_at),
+            )
 
-            try:
-                first_page_response = await self.search.post(
-                    q=q, from_=chunk_from, to=chunk_to, page=1, **request_params
-                )
+        pages = self._aiter_chunk_pages(
+            fetch_page,
+            chunks_iter,
+            concurrency,
+            show_progress=show_progress,
+            adaptive_chunking=adaptive_chunking,
+            deadline_at=deadline_at,
+            completed_units=state.completed_units if state else None,
+            report=report,
+        )
+        return self._aiter_processed_articles(
+            pages,
+            deduplicate,
+            max_articles,
+            show_progress,
+            page_batches,
+            checkpoint=checkpoint,
+            job_id=job_id,
+            state=state,
+            near_duplicates=near_duplicates,
+            report=report,
+        )
 
-                articles_data = safe_get_articles(first_page_response)
+    async def get_new_articles(
+        self,
+        q: str,
+        store: SQLiteCheckpointStore,
+        sync_key: Optional[str] = None,
+        initial_from: Union[str, datetime.datetime] = "1d",
+        overlap: datetime.timedelta = datetime.timedelta(minutes=30),
+        time_chunk_size: str = "1h",
+        **kwargs,
+    ) -> List[Any]:
+        """
+        Asynchronously retrieve only the articles new since the previous call.
 
-                if articles_data:
-                    processed_articles, current_count, should_continue = (
-                        self._process_articles(
-                            articles_data,
-                            seen_ids,
-                            deduplicate,
-                            max_articles,
-                            current_count,
-                        )
-                    )
+        See ``NewscatcherApi.get_new_articles``.
+        """
+        sync_key = sync_key or self._sync_key(q, kwargs)
+        watermark, from_ = self._sync_window(store, sync_key, initial_from, overlap)
 
-                    all_articles.extend(processed_articles)
+        report = HarvestReport()
+        articles = await self.get_all_articles(
+            q, from_=from_, time_chunk_size=time_chunk_size, report=report, **kwargs
+        )
 
-                    if not should_continue:
-                        if show_progress:
-                            print(f"\nReached maximum article limit ({max_articles}).")
-                        break
+        return self._finish_sync(store, sync_key, articles, watermark, overlap, kwargs, report)
 
-                    total_pages = getattr(first_page_response, "total_pages", 1)
-
-                    if total_pages > 1:
-                        tasks = []
-                        semaphore = asyncio.Semaphore(concurrency)
-
-                        async def fetch_page(page_num):
-                            async with semaphore:
-                                return await self.search.post(
-                                    q=q,
-                                    from_=chunk_from,
-                                    to=chunk_to,
-                                    page=page_num,
-                                    **request_params,
-                                )
-
-                        for page in range(2, min(total_pages + 1, 11)):
-                            if current_count >= max_articles:
-                                break
-                            tasks.append(fetch_page(page))
-
-                        if tasks:
-                            page_responses = await asyncio.gather(
-                                *tasks, return_exceptions=True
-                            )
-
-                            for page_response in page_responses:
-                                if isinstance(page_response, Exception):
-                                    continue
-
-                                if current_count >= max_articles:
-                                    break
-
-                                page_articles = safe_get_articles(page_response)
-                                if page_articles:
-                                    (
-                                        processed_articles,
-                                        current_count,
-                                        should_continue,
-                                    ) = self._process_articles(
-                                        page_articles,
-                                        seen_ids,
-                                        deduplicate,
-                                        max_articles,
-                                        current_count,
-                                    )
-
-                                    all_articles.extend(processed_articles)
-
-                                    if not should_continue:
-                                        break
-
-            except Exception as e:
-                if show_progress:
-                    print(f"Error processing chunk {chunk_from} to {chunk_to}: {e}")
-                continue
+    async def plan_articles_harvest(
+        self,
+        q: str,
+        from_: Optional[Union[str, datetime.datetime]] = None,
+        to: Optional[Union[str, datetime.datetime]] = None,
+        aggregation_by: str = "hour",
+        page_size: int = 1000,
+        fill_ratio: float = 0.9,
+        validate_query: bool = True,
+        **kwargs,
+    ) -> HarvestPlan:
+        """
+        Asynchronously plan get_all_articles chunks from one aggregation count request.
 
-        if show_progress:
-            print(f"\nCompleted: Retrieved {len(all_articles)} articles")
+        See ``NewscatcherApi.plan_articles_harvest``.
+        """
+        if validate_query:
+            is_valid, error_message = self.validate_query(q)
+            if not is_valid:
+                raise ValueError(f"Invalid query syntax: {error_message}")
 
-        return all_articles
+        if aggregation_by not in AGGREGATION_BUCKET_DELTAS:
+            raise ValueError(
+                f"Unsupported aggregation_by for planning: {aggregation_by}. Use 'hour' or 'day'."
+            )
+
+        from_date, to_date, _ = parse_time_parameters("search", from_=from_, to=to)
+
+        response = await self.aggregation_count.post(
+            q=q,
+            aggregation_by=aggregation_by,
+            from_=format_datetime(from_date),
+            to=format_datetime(to_date),
+            **self._aggregation_params(kwargs),
+        )
+
+        return self._build_harvest_plan(
+            response, from_date, to_date, aggregation_by, page_size, fill_ratio
+        )
+
+    async def _aiter_chunk_pages(
+        self,
+        fetch_page: Callable[[datetime.datetime, datetime.datetime, int], Awaitable[Any]],
+        chunks: Iterable[Tuple[datetime.datetime, datetime.datetime]],
+        concurrency: Optional[int],
+        show_progress: bool = False,
+        adaptive_chunking: bool = False,
+        completed_units: Optional[Dict[Tuple[str, str], Dict[int, int]]] = None,
+        split_chunk: Optional[Callable[..., Any]] = None,
+        deadline_at: Optional[float] = None,
+        report: Optional[HarvestReport] = None,
+    ) -> AsyncIterator[Tuple[Tuple[datetime.datetime, datetime.datetime], int, Any]]:
+        """
+        Fetch every (chunk, page) unit through one bounded pool of requests.
+
+        Page 1 of each chunk is scheduled up to ``2 * concurrency`` chunks ahead
+        of the consumer; as soon as a first page reports ``total_pages``, the
+        remaining pages of that chunk are queued on the same semaphore. Results
+        are yielded strictly in chunk order, then page order, so callers see
+        the same sequence as a serial walk. Closing the generator cancels all
+        outstanding requests.
+
+        With ``adaptive_chunking``, a chunk whose first page is oversized (see
+        ``_split_chunk``) is bisected. Both halves are fetched in its place, and
+        the oversized first page is yielded as page ``SPLIT_PAGE``.
+        ``completed_units`` is handled as in ``NewscatcherApi._iter_chunk_pages``.
+
+        If ``concurrency`` is None, it is ``DEFAULT_CONCURRENCY``, or the
+        ``max_limit`` of the client's ``AdaptiveConcurrencyController``, which
+        then decides how many of the scheduled requests are actually in
+        flight. An explicit ``concurrency`` is kept, and caps the controller.
+
+        Args:
+            fetch_page: Coroutine function called as ``fetch_page(chunk_start, chunk_end, page)``
+            chunks: Iterable of (chunk_start, chunk_end) pairs
+            concurrency: Maximum number of requests in flight at once, or None
+            show_progress: Whether to print chunk errors
+            adaptive_chunking: Whether to bisect oversized chunks
+            completed_units: Units already delivered, from a CheckpointState
+            split_chunk: Replaces ``_split_chunk`` as the rule for splitting a
+                         chunk after its first page
+            deadline_at: ``time.monotonic()`` value at which to stop yielding
+            report: HarvestReport to count failed units and a passed deadline in
+
+        Yields:
+            Tuples of ((chunk_start, chunk_end), page, response)
+        """
+        if split_chunk is None and adaptive_chunking:
+            split_chunk = self._split_chunk
+
+        if concurrency is None:
+            controller = self._client_wrapper.httpx_client.concurrency_controller
+            concurrency = controller.max_limit if controller is not None else self.DEFAULT_CONCURRENCY
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        lookahead = max(2, concurrency * 2)
+        spawned: Set["asyncio.Future[Any]"] = set()
+
+        def spawn(coro) -> "asyncio.Future[Any]":
+            task = asyncio.ensure_future(coro)
+            spawned.add(task)
+            task.add_done_callback(spawned.discard)
+            return task
+
+        async def fetch(chunk_start, chunk_end, page):
+            async with semaphore:
+                return await fetch_page(chunk_start, chunk_end, page)
+
+        async def expand_chunk(chunk_start, chunk_end):
+            chunk = (chunk_start, chunk_end)
+            completed_pages = self._completed_pages(completed_units, chunk)
+            if SPLIT_PAGE in completed_pages:
+                halves = bisect_time_chunk(chunk_start, chunk_end, self.MIN_ADAPTIVE_CHUNK)
+                return None, [], [(half, spawn(expand_chunk(*half))) for half in halves]
+
+            if 1 in completed_pages:
+                first_response, total_pages = None, completed_pages[1]
+            else:
+                first_response = await fetch(chunk_start, chunk_end, 1)
+                total_pages = self._total_pages(first_response)
+                halves = split_chunk(chunk, first_response) if split_chunk else None
+                if halves:
+                    return first_response, [], [(half, spawn(expand_chunk(*half))) for half in halves]
+
+            page_tasks = [
+                (page, spawn(fetch(chunk_start, chunk_end, page)))
+                for page in self._followup_pages(total_pages, completed_pages)
+            ]
+            return first_response, page_tasks, []
+
+        chunk_iter = iter(chunks)
+        pending: Deque[Tuple[Tuple[datetime.datetime, datetime.datetime], "asyncio.Future[Any]"]] = deque()
+
+        def schedule_chunks() -> None:
+            while len(pending) < lookahead:
+                chunk = next(chunk_iter, None)
+                if chunk is None:
+                    return
+                pending.append((chunk, spawn(expand_chunk(*chunk))))
+
+        try:
+            schedule_chunks()
+            while pending:
+                if self._deadline_passed(deadline_at, show_progress):
+                    if report is not None:
+                        report.truncated = True
+                    return
+                chunk, chunk_task = pending.popleft()
+                try:
+                    first_response, page_tasks, halves = await chunk_task
+                except Exception as e:
+                    if show_progress:
+                        print(
+                            f"Error processing chunk {format_datetime(chunk[0])} to {format_datetime(chunk[1])}: {e}"
+                        )
+                    if report is not None:
+                        report.failed_units += 1
+                    schedule_chunks()
+                    continue
+
+                if halves:
+                    pending.extendleft(reversed(halves))
+                    if first_response is not None:
+                        yield chunk, SPLIT_PAGE, first_response
+                    continue
+
+                schedule_chunks()
+                if first_response is not None:
+                    yield chunk, 1, first_response
+
+                for page, page_task in page_tasks:
+                    try:
+                        page_response = await page_task
+                    except Exception:
+                        if report is not None:
+                            report.failed_units += 1
+                        continue
+                    yield chunk, page, page_response
+        finally:
+            for task in list(spawned):
+                task.cancel()
+            if spawned:
+                await asyncio.gather(*spawned, return_exceptions=True)
 
     async def get_all_headlines(
         self,
@@ -997,154 +1896,162 @@ class AsyncNewscatcherApi(AsyncBaseNewscatcherApi, NewscatcherMixin):
         time_chunk_size: str = "1h",  # Default to 1 hour chunks
         max_articles: Optional[int] = None,  # None uses DEFAULT_MAX_ARTICLES
         show_progress: bool = False,
-        deduplicate: bool = True,
-        concurrency: int = 3,  # Default concurrency for page fetching
+        deduplicate: Union[bool, Deduplicator] = True,
+        concurrency: Optional[int] = None,  # None uses DEFAULT_CONCURRENCY
+        near_duplicates: Optional[NearDuplicateDetector] = None,
+        deadline: Optional[float] = None,
         **kwargs,
     ) -> List[Any]:
         """
         Async version: Fetch all latest headlines by splitting the request into
         multiple time-based chunks to overcome the 10,000 article limit.
+
+        ``deadline`` bounds the whole harvest, as in ``NewscatcherApi.get_all_articles``.
+        """
+        all_articles = [
+            article
+            async for article in self.aiter_all_headlines(
+                when=when,
+                time_chunk_size=time_chunk_size,
+                max_articles=max_articles,
+                show_progress=show_progress,
+                deduplicate=deduplicate,
+                concurrency=concurrency,
+                near_duplicates=near_duplicates,
+                deadline=deadline,
+                **kwargs,
+            )
+        ]
+
+        self.log_completion(show_progress, len(all_articles))
+        return all_articles
+
+    def aiter_all_headlines(
+        self,
+        when: Optional[Union[datetime.datetime, str]] = None,
+        time_chunk_size: str = "1h",
+        max_articles: Optional[int] = None,
+        show_progress: bool = False,
+        deduplicate: Union[bool, Deduplicator] = True,
+        concurrency: Optional[int] = None,
+        page_batches: bool = False,
+        near_duplicates: Optional[NearDuplicateDetector] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """
+        Asynchronously stream latest headlines as each page is processed.
+
+        Takes the same arguments as ``get_all_headlines``. See
+        ``aiter_all_articles`` for ``page_batches`` and early stopping.
         """
-        # Set defaults
         if max_articles is None:
             max_articles = self.DEFAULT_MAX_ARTICLES
 
-        # Parse time parameters
-        from_date, to_date, chunk_delta = parse_time_parameters(
-            "latestheadlines", when=when, time_chunk_size=time_chunk_size
+        from_date, to_date, chunks_iter = self.prepare_time_chunks(
+            "latest_headlines",
+            when=when,
+            time_chunk_size=time_chunk_size,
+            show_progress=show_progress,
+            adaptive_chunking=True,
+        )
+        first_pages: Dict[str, Any] = {}
+        split_chunk = self._headline_window_splitter(
+            from_date, to_date, time_chunk_size, first_pages
         )
 
-        # Create time chunks
-        time_chunks = create_time_chunks(from_date, to_date, chunk_delta)
+        request_params = self.prepare_request_params(kwargs)
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+
+        async def fetch_page(chunk_start, chunk_end, page):
+            when = calculate_when_param(to_date, chunk_start)
+            if page == 1 and when in first_pages:
+                # The same request as the whole range, already sent
+                return first_pages.pop(when)
+            return await self.latest_headlines.post(
+                when=when,
+                page=page,
+                **self._with_deadline(request_params, deadline_at),
+            )
 
-        # Setup progress tracking
-        desc = "Fetching headlines chunks"
-        is_test = "pytest" in sys.modules or "TEST_MODE" in os.environ
-        chunks_iter = setup_progress_tracking(
-            time_chunks,
+        pages = self._aiter_chunk_pages(
+            fetch_page,
+            chunks_iter,
+            concurrency,
+            show_progress=show_progress,
+            split_chunk=split_chunk,
+            deadline_at=deadline_at,
+        )
+        return self._aiter_processed_articles(
+            pages,
+            deduplicate,
+            max_articles,
             show_progress,
-            description=desc,
-            is_test=is_test,
+            page_batches,
+            near_duplicates=near_duplicates,
+            window_field=self._headline_date_field(kwargs),
         )
 
-        all_articles = []
-        seen_ids = set()
-        current_count = 0
-
-        # Prepare request parameters
-        request_params = {**kwargs}
-        if "page" in request_params:
-            del request_params["page"]
-        if "page_size" not in request_params:
-            request_params["page_size"] = 1000
-
-        # Process each time chunk
-        for chunk_start, chunk_end in chunks_iter:
-            if current_count >= max_articles:
-                break
-
-            try:
-                # Convert chunk times to the expected format using calculate_when_param
-                when_param = calculate_when_param(chunk_end, chunk_start)
-
-                # Make the first request
-                first_response = await self.latest_headlines.post(
-                    when=when_param, page=1, **request_params
-                )
+    async def _aiter_processed_articles(
+        self,
+        pages,
+        deduplicate,
+        max_articles,
+        show_progress,
+        page_batches,
+        checkpoint: Optional[SQLiteCheckpointStore] = None,
+        job_id: Optional[str] = None,
+        state: Optional[CheckpointState] = None,
+        near_duplicates: Optional[NearDuplicateDetector] = None,
+        window_field: Optional[str] = None,
+        report: Optional[HarvestReport] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Deduplicate and limit articles from a page stream, yielding them as they arrive.
 
-                # Get articles safely from first response
-                first_articles = safe_get_articles(first_response)
-
-                if first_articles:
-                    # Process first page articles
-                    processed_articles, current_count, should_continue = (
-                        self._process_articles(
-                            first_articles,
-                            seen_ids,
-                            deduplicate,
-                            max_articles,
-                            current_count,
-                        )
+        Checkpointing and ``window_field`` work as in
+        ``NewscatcherApi._iter_processed_articles``.
+        """
+        deduplicate, seen_ids = self._seen_ids(deduplicate, state, checkpoint, job_id)
+        current_count = state.article_count if state else 0
+
+        async with aclosing(pages):
+            async for chunk, page, response in pages:
+                articles_data = safe_get_articles(response) if page != SPLIT_PAGE else []
+                if window_field and articles_data:
+                    articles_data = filter_articles_to_window(
+                        articles_data, chunk[0], chunk[1], window_field
                     )
+                if not articles_data:
+                    self._record_unit(checkpoint, job_id, chunk, page, response, [], current_count)
+                    continue
 
-                    all_articles.extend(processed_articles)
+                processed_articles, current_count, should_continue = (
+                    self._process_articles(
+                        articles_data,
+                        seen_ids,
+                        deduplicate,
+                        max_articles,
+                        current_count,
+                        near_duplicates,
+                    )
+                )
 
-                    # Stop if we've reached the limit
-                    if not should_continue:
-                        if show_progress:
-                            print(
-                                f"\nReached maximum article limit ({max_articles}). Stopping."
-                            )
-                        break
+                if processed_articles:
+                    if page_batches:
+                        yield processed_articles
+                    else:
+                        for article in processed_articles:
+                            yield article
 
-                    # Get total pages for pagination
-                    total_pages = getattr(first_response, "total_pages", 1)
-
-                    # If there are more pages, fetch them with concurrency
-                    if total_pages > 1:
-                        page_tasks = []
-                        semaphore = asyncio.Semaphore(concurrency)
-
-                        async def fetch_page(page_num):
-                            async with semaphore:
-                                try:
-                                    return await self.latest_headlines.post(
-                                        when=when_param, page=page_num, **request_params
-                                    )
-                                except Exception as e:
-                                    print(f"Error fetching page {page_num}: {str(e)}")
-                                    return None
-
-                        # Create tasks for all pages
-                        for page in range(
-                            2, min(total_pages + 1, 11)
-                        ):  # Limit to 10 pages max
-                            if current_count >= max_articles:
-                                break
-                            page_tasks.append(fetch_page(page))
-
-                        # Execute page requests with concurrency
-                        if page_tasks:
-                            page_responses = await asyncio.gather(
-                                *page_tasks, return_exceptions=True
-                            )
-
-                            for response in page_responses:
-                                if current_count >= max_articles:
-                                    break
-
-                                if response and not isinstance(response, Exception):
-                                    page_articles = safe_get_articles(response)
-
-                                    if page_articles:
-                                        (
-                                            processed_articles,
-                                            current_count,
-                                            should_continue,
-                                        ) = self._process_articles(
-                                            page_articles,
-                                            seen_ids,
-                                            deduplicate,
-                                            max_articles,
-                                            current_count,
-                                        )
-
-                                        all_articles.extend(processed_articles)
-
-                                        if not should_continue:
-                                            if show_progress:
-                                                print(
-                                                    f"\nReached maximum article limit ({max_articles}). Stopping."
-                                                )
-                                            break
-
-                        # Stop processing chunks if we've reached the limit
-                        if not should_continue:
-                            break
-
-            except Exception as e:
-                print(f"Error processing chunk {chunk_start} to {chunk_end}: {str(e)}")
-                # Continue with next chunk
+                if should_continue:
+                    self._record_unit(
+                        checkpoint, job_id, chunk, page, response, processed_articles, current_count
+                    )
 
-        self.log_completion(show_progress, len(all_articles))
-        return all_articles
+                if not should_continue or current_count >= max_articles:
+                    if show_progress:
+                        print(f"\nReached maximum article limit ({max_articles}).")
+                    if report is not None:
+                        report.truncated = True
+                    return
@@ -7,14 +7,24 @@ from importlib import import_module
 
 if typing.TYPE_CHECKING:
     from .api_error import ApiError
+    from .circuit_breaker import CircuitBreaker, CircuitOpenError
     from .client_wrapper import AsyncClientWrapper, BaseClientWrapper, SyncClientWrapper
+    from .coalescing import AsyncRequestCoalescer, RequestCoalescer
+    from .compression import TransferStats
+    from .concurrency import AdaptiveConcurrencyController
     from .datetime_utils import Rfc2822DateTime, parse_rfc2822_datetime, serialize_datetime
+    from .deadline import DeadlineExceededError
+    from .disk_cache import DiskResponseCache
+    from .embeddings import stack_embeddings
     from .file import File, convert_file_dict_to_httpx_tuples, with_content_type
+    from .hedging import RequestHedger
     from .http_client import AsyncHttpClient, HttpClient
     from .http_response import AsyncHttpResponse, HttpResponse
     from .jsonable_encoder import encode_path_param, jsonable_encoder
+    from .lazy_model import LazyModel
     from .logging import ConsoleLogger, ILogger, LogConfig, LogLevel, Logger, create_logger
     from .parse_error import ParsingError
+    from .parsing import EmbeddingFormat, ResponseMode, parse_json_as
     from .pydantic_utilities import (
         IS_PYDANTIC_V2,
         UniversalBaseModel,
@@ -25,41 +35,61 @@ if typing.TYPE_CHECKING:
         update_forward_refs,
     )
     from .query_encoder import encode_query
+    from .rate_limiter import RateLimiter
     from .remove_none_from_dict import remove_none_from_dict
     from .request_options import RequestOptions
+    from .response_cache import ResponseCache
     from .serialization import FieldMetadata, convert_and_respect_annotation_metadata
+    from .trusted import construct_obj_as
 _dynamic_imports: typing.Dict[str, str] = {
+    "AdaptiveConcurrencyController": ".concurrency",
     "ApiError": ".api_error",
     "AsyncClientWrapper": ".client_wrapper",
     "AsyncHttpClient": ".http_client",
     "AsyncHttpResponse": ".http_response",
+    "AsyncRequestCoalescer": ".coalescing",
     "BaseClientWrapper": ".client_wrapper",
+    "CircuitBreaker": ".circuit_breaker",
+    "CircuitOpenError": ".circuit_breaker",
     "ConsoleLogger": ".logging",
+    "DeadlineExceededError": ".deadline",
+    "DiskResponseCache": ".disk_cache",
+    "EmbeddingFormat": ".parsing",
     "FieldMetadata": ".serialization",
     "File": ".file",
     "HttpClient": ".http_client",
     "HttpResponse": ".http_response",
     "ILogger": ".logging",
     "IS_PYDANTIC_V2": ".pydantic_utilities",
+    "LazyModel": ".lazy_model",
     "LogConfig": ".logging",
     "LogLevel": ".logging",
     "Logger": ".logging",
     "ParsingError": ".parse_error",
+    "RateLimiter": ".rate_limiter",
+    "RequestCoalescer": ".coalescing",
+    "RequestHedger": ".hedging",
     "RequestOptions": ".request_options",
+    "ResponseCache": ".response_cache",
+    "ResponseMode": ".parsing",
     "Rfc2822DateTime": ".datetime_utils",
     "SyncClientWrapper": ".client_wrapper",
+    "TransferStats": ".compression",
     "UniversalBaseModel": ".pydantic_utilities",
     "UniversalRootModel": ".pydantic_utilities",
+    "construct_obj_as": ".trusted",
     "convert_and_respect_annotation_metadata": ".serialization",
     "convert_file_dict_to_httpx_tuples": ".file",
     "create_logger": ".logging",
     "encode_path_param": ".jsonable_encoder",
     "encode_query": ".query_encoder",
     "jsonable_encoder": ".jsonable_encoder",
+    "parse_json_as": ".parsing",
     "parse_obj_as": ".pydantic_utilities",
     "parse_rfc2822_datetime": ".datetime_utils",
     "remove_none_from_dict": ".remove_none_from_dict",
     "serialize_datetime": ".datetime_utils",
+    "stack_embeddings": ".embeddings",
     "universal_field_validator": ".pydantic_utilities",
     "universal_root_validator": ".pydantic_utilities",
     "update_forward_refs": ".pydantic_utilities",
@@ -89,37 +119,54 @@ def __dir__():
 
 
 __all__ = [
+    "AdaptiveConcurrencyController",
     "ApiError",
     "AsyncClientWrapper",
     "AsyncHttpClient",
     "AsyncHttpResponse",
+    "AsyncRequestCoalescer",
     "BaseClientWrapper",
+    "CircuitBreaker",
+    "CircuitOpenError",
     "ConsoleLogger",
+    "DeadlineExceededError",
+    "DiskResponseCache",
+    "EmbeddingFormat",
     "FieldMetadata",
     "File",
     "HttpClient",
     "HttpResponse",
     "ILogger",
     "IS_PYDANTIC_V2",
+    "LazyModel",
     "LogConfig",
     "LogLevel",
     "Logger",
     "ParsingError",
+    "RateLimiter",
+    "RequestCoalescer",
+    "RequestHedger",
     "RequestOptions",
+    "ResponseCache",
+    "ResponseMode",
     "Rfc2822DateTime",
     "SyncClientWrapper",
+    "TransferStats",
     "UniversalBaseModel",
     "UniversalRootModel",
+    "construct_obj_as",
     "convert_and_respect_annotation_metadata",
     "convert_file_dict_to_httpx_tuples",
     "create_logger",
     "encode_path_param",
     "encode_query",
     "jsonable_encoder",
+    "parse_json_as",
     "parse_obj_as",
     "parse_rfc2822_datetime",
     "remove_none_from_dict",
     "serialize_datetime",
+    "stack_embeddings",
     "universal_field_validator",
     "universal_root_validator",
     "update_forward_refs",
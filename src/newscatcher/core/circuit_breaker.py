@@ -0,0 +1,149 @@
+import threading
+import time
+import typing
+from urllib.parse import urlsplit
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the circuit for its endpoint is open."""
+
+    def __init__(self, key: str, retry_after: float) -> None:
+        self.key = key
+        self.retry_after = retry_after
+        super().__init__(f"Circuit open for {key}; retry in {retry_after:.1f}s")
+
+
+class _Circuit:
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.successes = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """
+    Fail fast while an endpoint is down instead of retrying into the outage.
+
+    Each endpoint (or each host, with ``per_endpoint=False``) has its own
+    circuit. ``failure_threshold`` consecutive failures, that is connection
+    errors, timeouts or 5xx responses, open it. While it is open, requests
+    raise ``CircuitOpenError`` without being sent, and pending retries are
+    abandoned. After ``recovery_timeout`` seconds the circuit is half-open:
+    up to ``half_open_max_calls`` probe requests are let through, and
+    ``success_threshold`` successful probes close it again, while a failed
+    probe reopens it.
+
+    Safe to share between threads, async tasks and clients.
+
+    Args:
+        failure_threshold: Consecutive failures that open a circuit
+        recovery_timeout: Seconds a circuit stays open before probing
+        half_open_max_calls: Probe requests allowed in flight while half-open
+        success_threshold: Successful probes that close a half-open circuit
+        per_endpoint: Whether each endpoint path has its own circuit, rather than each host
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+        per_endpoint: bool = True,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ):
+        if failure_threshold < 1 or half_open_max_calls < 1 or success_threshold < 1:
+            raise ValueError("failure_threshold, half_open_max_calls and success_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self.per_endpoint = per_endpoint
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: typing.Dict[str, _Circuit] = {}
+        self.rejected = 0
+        self.opened = 0
+
+    def key_for(self, url: str) -> str:
+        """The circuit a request URL belongs to."""
+        parts = urlsplit(url)
+        key = f"{parts.scheme}://{parts.netloc}"
+        return key + parts.path.rstrip("/") if self.per_endpoint else key
+
+    def state(self, key: str) -> str:
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return CLOSED
+            self._refresh(circuit)
+            return circuit.state
+
+    def before_request(self, key: str) -> None:
+        """Let a request through or raise ``CircuitOpenError``; every admitted request must be recorded."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return
+            self._refresh(circuit)
+            if circuit.state == CLOSED:
+                return
+            if circuit.state == HALF_OPEN and circuit.probes < self.half_open_max_calls:
+                circuit.probes += 1
+                return
+            self.rejected += 1
+            retry_after = max(0.0, circuit.opened_at + self.recovery_timeout - self._clock())
+        raise CircuitOpenError(key, retry_after)
+
+    def record_success(self, key: str) -> None:
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return
+            if circuit.state == CLOSED:
+                del self._circuits[key]
+            elif circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                circuit.successes += 1
+                if circuit.successes >= self.success_threshold:
+                    del self._circuits[key]
+
+    def record_failure(self, key: str) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or (
+                circuit.state == CLOSED and circuit.failures >= self.failure_threshold
+            ):
+                self._open(circuit)
+
+    def record_response(self, key: str, status_code: int) -> None:
+        """Record a response; 5xx statuses count as failures."""
+        if status_code >= 500:
+            self.record_failure(key)
+        else:
+            self.record_success(key)
+
+    def release(self, key: str) -> None:
+        """Give back an admitted request that ended without an outcome, such as a cancelled one."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is not None and circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = self._clock()
+        circuit.probes = 0
+        circuit.successes = 0
+        self.opened += 1
+
+    def _refresh(self, circuit: _Circuit) -> None:
+        if circuit.state == OPEN and self._clock() - circuit.opened_at >= self.recovery_timeout:
+            circuit.state = HALF_OPEN
@@ -3,8 +3,14 @@
 import typing
 
 import httpx
+from .circuit_breaker import CircuitBreaker
+from .concurrency import AdaptiveConcurrencyController
+from .hedging import RequestHedger
 from .http_client import AsyncHttpClient, HttpClient
 from .logging import LogConfig, Logger
+from .parsing import EmbeddingFormat, ResponseMode
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
 
 
 class BaseClientWrapper:
@@ -17,6 +23,8 @@ class BaseClientWrapper:
         timeout: typing.Optional[float] = None,
         max_retries: int = 2,
         logging: typing.Optional[typing.Union[LogConfig, Logger]] = None,
+        response_mode: ResponseMode = "validate",
+        embedding_format: EmbeddingFormat = "list",
     ):
         self.api_key = api_key
         self._headers = headers
@@ -24,6 +32,8 @@ class BaseClientWrapper:
         self._timeout = timeout
         self._max_retries = max_retries
         self._logging = logging
+        self._response_mode = response_mode
+        self._embedding_format = embedding_format
 
     def get_headers(self) -> typing.Dict[str, str]:
         import platform
@@ -63,6 +73,12 @@ class SyncClientWrapper(BaseClientWrapper):
         timeout: typing.Optional[float] = None,
         max_retries: int = 2,
         logging: typing.Optional[typing.Union[LogConfig, Logger]] = None,
+        response_mode: ResponseMode = "validate",
+        embedding_format: EmbeddingFormat = "list",
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
         httpx_client: httpx.Client,
     ):
         super().__init__(
@@ -72,6 +88,8 @@ class SyncClientWrapper(BaseClientWrapper):
             timeout=timeout,
             max_retries=max_retries,
             logging=logging,
+            response_mode=response_mode,
+            embedding_format=embedding_format,
         )
         self.httpx_client = HttpClient(
             httpx_client=httpx_client,
@@ -80,6 +98,12 @@ class SyncClientWrapper(BaseClientWrapper):
             base_url=self.get_base_url,
             base_max_retries=self.get_max_retries(),
             logging_config=self._logging,
+            response_mode=self._response_mode,
+            embedding_format=self._embedding_format,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            circuit_breaker=circuit_breaker,
         )
 
 
@@ -93,7 +117,15 @@ class AsyncClientWrapper(BaseClientWrapper):
         timeout: typing.Optional[float] = None,
         max_retries: int = 2,
         logging: typing.Optional[typing.Union[LogConfig, Logger]] = None,
+        response_mode: ResponseMode = "validate",
+        embedding_format: EmbeddingFormat = "list",
         async_token: typing.Optional[typing.Callable[[], typing.Awaitable[str]]] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        concurrency_controller: typing.Optional[AdaptiveConcurrencyController] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+        request_hedger: typing.Optional[RequestHedger] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
         httpx_client: httpx.AsyncClient,
     ):
         super().__init__(
@@ -103,6 +135,8 @@ class AsyncClientWrapper(BaseClientWrapper):
             timeout=timeout,
             max_retries=max_retries,
             logging=logging,
+            response_mode=response_mode,
+            embedding_format=embedding_format,
         )
         self._async_token = async_token
         self.httpx_client = AsyncHttpClient(
@@ -113,6 +147,14 @@ class AsyncClientWrapper(BaseClientWrapper):
             base_max_retries=self.get_max_retries(),
             async_base_headers=self.async_get_headers,
             logging_config=self._logging,
+            response_mode=self._response_mode,
+            embedding_format=self._embedding_format,
+            rate_limiter=rate_limiter,
+            concurrency_controller=concurrency_controller,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            request_hedger=request_hedger,
+            circuit_breaker=circuit_breaker,
         )
 
     async def async_get_headers(self) -> typing.Dict[str, str]:
@@ -0,0 +1,115 @@
+import asyncio
+import json
+import threading
+import typing
+
+import httpx
+
+# Methods whose identical concurrent calls may share one response. The API's
+# search endpoints are read-only POSTs, so POST is included.
+COALESCED_METHODS = frozenset({"GET", "HEAD", "POST"})
+
+CoalescingKey = typing.Tuple[str, str, str, str, str]
+
+
+def coalescing_key(
+    method: str,
+    url: str,
+    params: typing.Sequence[typing.Tuple[str, typing.Any]],
+    json_body: typing.Any,
+    headers: typing.Mapping[str, typing.Any],
+) -> typing.Optional[CoalescingKey]:
+    """
+    Build a canonical key for a request, or None if it must not be coalesced.
+
+    Query parameters, JSON body and headers are serialized with sorted keys, so
+    requests that differ only in parameter order share a key.
+    """
+    method = method.upper()
+    if method not in COALESCED_METHODS:
+        return None
+    try:
+        body = json.dumps(json_body, sort_keys=True, separators=(",", ":"), default=str)
+    except (TypeError, ValueError):
+        return None
+    query = json.dumps(sorted((str(key), str(value)) for key, value in params), separators=(",", ":"))
+    header_items = json.dumps(sorted((key.lower(), str(value)) for key, value in headers.items()), separators=(",", ":"))
+    return method, url, query, body, header_items
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: typing.Optional[httpx.Response] = None
+        self.error: typing.Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """
+    Let identical concurrent requests share one network call (singleflight).
+
+    The first caller for a key sends the request; callers with the same key that
+    arrive while it is in flight wait and receive the same response, or the same
+    exception. Nothing is cached once the call completes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: typing.Dict[CoalescingKey, _Call] = {}
+        self.coalesced = 0
+
+    def do(self, key: CoalescingKey, send: typing.Callable[[], httpx.Response]) -> httpx.Response:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return typing.cast(httpx.Response, call.response)
+
+        try:
+            call.response = send()
+            return call.response
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncRequestCoalescer:
+    """Async counterpart of ``RequestCoalescer`` for tasks of one event loop."""
+
+    def __init__(self) -> None:
+        self._calls: typing.Dict[CoalescingKey, "asyncio.Future[httpx.Response]"] = {}
+        self.coalesced = 0
+
+    async def do(
+        self, key: CoalescingKey, send: typing.Callable[[], typing.Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        call = self._calls.get(key)
+        if call is not None:
+            self.coalesced += 1
+            # Shielded so that a cancelled follower does not cancel the shared call
+            return await asyncio.shield(call)
+
+        call = asyncio.ensure_future(send())
+        self._calls[key] = call
+
+        def finished(future: "asyncio.Future[httpx.Response]") -> None:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+            if not future.cancelled():
+                # Mark the error as retrieved even if every caller was cancelled
+                future.exception()
+
+        call.add_done_callback(finished)
+        return await asyncio.shield(call)
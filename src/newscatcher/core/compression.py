@@ -0,0 +1,92 @@
+import importlib.util
+import re
+import threading
+import typing
+
+import httpx
+
+# Strongest first. httpx always decodes gzip and deflate; br and zstd need optional
+# packages, so they are advertised only when httpx can find one of them.
+_ENCODING_PREFERENCE = ("zstd", "br", "gzip", "deflate")
+# The packages httpx decodes each optional encoding with
+_DECODER_PACKAGES = {"br": ("brotli", "brotlicffi"), "zstd": ("zstandard",)}
+# httpx decodes zstd from 0.27.1 on
+_ZSTD_HTTPX_VERSION = (0, 27, 1)
+_HTTPX_VERSION = tuple(int(part) for part in re.findall(r"\d+", httpx.__version__)[:3])
+
+
+def _installed(package: str) -> bool:
+    return importlib.util.find_spec(package) is not None
+
+
+def supported_encodings() -> typing.List[str]:
+    """Content encodings httpx can decode here, strongest first."""
+    encodings = []
+    for encoding in _ENCODING_PREFERENCE:
+        if encoding == "zstd" and _HTTPX_VERSION < _ZSTD_HTTPX_VERSION:
+            continue
+        packages = _DECODER_PACKAGES.get(encoding)
+        if packages is None or any(_installed(package) for package in packages):
+            encodings.append(encoding)
+    return encodings
+
+
+def accept_encoding_header() -> str:
+    """Build an Accept-Encoding value that ranks the strongest encoding highest."""
+    return ", ".join(
+        encoding if rank == 0 else f"{encoding};q={1 - rank / 10:.1f}"
+        for rank, encoding in enumerate(supported_encodings())
+    )
+
+
+ACCEPT_ENCODING = accept_encoding_header()
+
+
+def transfer_sizes(response: httpx.Response) -> typing.Tuple[int, int]:
+    """
+    Return the (wire, decoded) byte counts of a response that has been read.
+
+    httpx decodes the body chunk by chunk as it arrives, so the compressed body is
+    never held in memory in full; ``num_bytes_downloaded`` counts it on the wire.
+    """
+    content = getattr(response, "_content", None)
+    return getattr(response, "num_bytes_downloaded", 0), len(content) if content is not None else 0
+
+
+class TransferStats:
+    """
+    Running totals of response body bytes on the wire and after decoding.
+
+    Shared by every request of a client and safe to update from several threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.responses = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self.encodings: typing.Dict[str, int] = {}
+
+    def record(self, response: httpx.Response) -> None:
+        """Add the body sizes of a response that has been read."""
+        wire, decoded = transfer_sizes(response)
+        encoding = response.headers.get("content-encoding", "identity")
+        with self._lock:
+            self.responses += 1
+            self.wire_bytes += wire
+            self.decoded_bytes += decoded
+            self.encodings[encoding] = self.encodings.get(encoding, 0) + 1
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.decoded_bytes - self.wire_bytes
+
+    @property
+    def compression_ratio(self) -> float:
+        """Decoded bytes per wire byte; 1.0 when nothing was compressed."""
+        return self.decoded_bytes / self.wire_bytes if self.wire_bytes else 1.0
+
+    def reset(self) -> None:
+        with self._lock:
+            self.responses = self.wire_bytes = self.decoded_bytes = 0
+            self.encodings = {}
@@ -0,0 +1,148 @@
+import asyncio
+import time
+import typing
+from collections import deque
+
+import httpx
+
+
+def _is_overload(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+
+class AdaptiveConcurrencyController:
+    """
+    Additive-increase/multiplicative-decrease limit on requests in flight.
+
+    Shared by every request of an async client. While responses succeed and their
+    latency stays near the fastest latency seen, the limit grows by ``increase``
+    for every full window of requests, as TCP congestion avoidance does. A 429, a
+    5xx, a failed connection or smoothed latency above ``latency_tolerance`` times
+    the baseline multiplies the limit by ``decrease_factor``, at most once per
+    round trip, so one burst of failures counts as a single congestion event.
+
+    Args:
+        initial_limit: Requests allowed in flight before any feedback
+        min_limit: Lowest limit the controller backs off to
+        max_limit: Highest limit the controller grows to
+        increase: Requests added to the limit per window of healthy responses
+        decrease_factor: Factor applied to the limit on congestion
+        latency_tolerance: Ratio of smoothed to baseline latency treated as congestion
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self._clock = clock
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: typing.Deque["asyncio.Future[None]"] = deque()
+        self._baseline_latency: typing.Optional[float] = None
+        self._smoothed_latency: typing.Optional[float] = None
+        self._last_decrease = float("-inf")
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait until fewer than ``limit`` requests are in flight and take a slot."""
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif not waiter.cancelled():
+                    # Pass the wake-up on instead of losing it
+                    self._wake()
+                raise
+        self._in_flight += 1
+
+    def release(self, status_code: typing.Optional[int], latency: typing.Optional[float]) -> None:
+        """
+        Give back a slot and adjust the limit from the outcome of the request.
+
+        Args:
+            status_code: HTTP status of the response, or None if the request failed
+                         before a response arrived
+            latency: Seconds the request took, or None to skip latency tracking
+        """
+        window_full = self._in_flight >= self.limit
+        self._in_flight -= 1
+
+        if status_code is None or _is_overload(status_code):
+            self._decrease()
+        elif latency is not None and self._is_congested(latency):
+            self._decrease()
+        elif window_full and 200 <= status_code < 400:
+            self._limit = min(float(self.max_limit), self._limit + self.increase / self._limit)
+        self._wake()
+
+    async def run(self, send: typing.Callable[[], typing.Awaitable[httpx.Response]]) -> httpx.Response:
+        """Send one request within a slot and feed its outcome back to the controller."""
+        await self.acquire()
+        started_at = self._clock()
+        try:
+            response = await send()
+        except asyncio.CancelledError:
+            self._in_flight -= 1
+            self._wake()
+            raise
+        except Exception:
+            self.release(None, None)
+            raise
+        self.release(response.status_code, self._clock() - started_at)
+        return response
+
+    def _is_congested(self, latency: float) -> bool:
+        if self._baseline_latency is None or latency < self._baseline_latency:
+            self._baseline_latency = latency
+        if self._smoothed_latency is None:
+            self._smoothed_latency = latency
+        else:
+            self._smoothed_latency = 0.8 * self._smoothed_latency + 0.2 * latency
+        return self._smoothed_latency > self._baseline_latency * self.latency_tolerance
+
+    def _decrease(self) -> None:
+        now = self._clock()
+        round_trip = self._smoothed_latency or 0.0
+        if now - self._last_decrease < round_trip:
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self.decreases += 1
+        if self._smoothed_latency is not None and self._baseline_latency is not None:
+            # Let the baseline follow a lasting change instead of cutting forever
+            self._baseline_latency = max(self._baseline_latency, self._smoothed_latency / self.latency_tolerance)
+
+    def _wake(self) -> None:
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
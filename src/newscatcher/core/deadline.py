@@ -0,0 +1,42 @@
+import time
+import typing
+
+import httpx
+
+from .request_options import RequestOptions
+
+
+class DeadlineExceededError(httpx.TimeoutException):
+    """Raised when a request's ``deadline`` passes before it could complete."""
+
+    def __init__(self, message: str = "Request deadline exceeded") -> None:
+        super().__init__(message)
+
+
+def deadline_from_request_options(request_options: typing.Optional[RequestOptions]) -> typing.Optional[float]:
+    """Convert the ``deadline`` budget of a call into an absolute ``time.monotonic()`` value."""
+    if request_options is None or request_options.get("deadline") is None:
+        return None
+    return time.monotonic() + request_options["deadline"]
+
+
+def request_options_with_deadline(
+    request_options: typing.Optional[RequestOptions], deadline_at: typing.Optional[float]
+) -> typing.Optional[RequestOptions]:
+    """Copy ``request_options`` with ``deadline`` set to the time left before ``deadline_at``."""
+    if deadline_at is None:
+        return request_options
+    return {**(request_options or {}), "deadline": max(deadline_at - time.monotonic(), 0.0)}
+
+
+def time_left(deadline_at: float) -> float:
+    """Seconds left before ``deadline_at``; raises ``DeadlineExceededError`` if none are."""
+    remaining = deadline_at - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceededError()
+    return remaining
+
+
+def retry_fits_deadline(deadline_at: typing.Optional[float], delay: float, attempt_seconds: float) -> bool:
+    """Whether a retry after ``delay`` that takes as long as the last attempt ends before the deadline."""
+    return deadline_at is None or time.monotonic() + delay + attempt_seconds < deadline_at
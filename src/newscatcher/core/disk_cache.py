@@ -0,0 +1,247 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import typing
+import zlib
+from contextlib import contextmanager
+
+from .response_cache import CachedResponse, ResponseCache
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS responses (
+        key TEXT PRIMARY KEY,
+        expires_at REAL NOT NULL,
+        accessed_at REAL NOT NULL,
+        size INTEGER NOT NULL,
+        status_code INTEGER NOT NULL,
+        headers TEXT NOT NULL,
+        method TEXT NOT NULL,
+        url TEXT NOT NULL,
+        body BLOB NOT NULL
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)",
+    "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at, size)",
+    # Running totals of the responses table, kept by triggers so that writes need not count the table
+    """
+    CREATE TABLE IF NOT EXISTS totals (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        entries INTEGER NOT NULL,
+        bytes INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN
+        UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN
+        UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS responses_update_size AFTER UPDATE OF size ON responses BEGIN
+        UPDATE totals SET bytes = bytes - OLD.size + NEW.size;
+    END
+    """,
+    "INSERT OR IGNORE INTO totals (id, entries, bytes) SELECT 1, COUNT(*), COALESCE(SUM(size), 0) FROM responses",
+)
+
+
+class DiskResponseCache(ResponseCache):
+    """
+    Response cache stored in a SQLite database that several processes can share.
+
+    Bodies are stored zlib-compressed. Entries expire after the TTL of their
+    endpoint, as with ``ResponseCache``. Once the stored bodies exceed
+    ``max_bytes`` or ``max_entries`` rows, the least recently read entries are
+    evicted. The database runs in WAL mode, so readers never wait for a writer
+    and worker processes can read and write the same file concurrently.
+
+    The entry count and total size are kept in a one-row ``totals`` table by
+    triggers, so a write only scans for eviction candidates when the cache is
+    over budget; totals found to have drifted from the table are recounted
+    before anything is evicted. A read only records its time when the stored one is at least
+    ``access_resolution`` seconds old, so hot entries do not turn every read
+    into a write; eviction order is exact to that resolution.
+
+    Parameters
+    ----------
+    path : typing.Union[str, os.PathLike]
+        Database file. Created with its parent directory if missing.
+
+    max_bytes : int
+        Maximum total size of the compressed bodies.
+
+    max_entries : int
+        Maximum number of responses stored.
+
+    ttl : float
+        Seconds a response stays fresh when its endpoint has no entry in ``endpoint_ttls``.
+
+    endpoint_ttls : typing.Optional[typing.Dict[str, float]]
+        TTLs by endpoint path. Defaults to ``DEFAULT_ENDPOINT_TTLS``.
+
+    compression_level : int
+        zlib compression level of stored bodies, from 0 (none) to 9.
+
+    access_resolution : float
+        Seconds within which repeated reads of an entry update its read time only once.
+    """
+
+    def __init__(
+        self,
+        path: typing.Union[str, "os.PathLike[str]"],
+        max_bytes: int = 256 * 1024 * 1024,
+        max_entries: int = 100_000,
+        ttl: float = 60.0,
+        endpoint_ttls: typing.Optional[typing.Dict[str, float]] = None,
+        compression_level: int = 6,
+        access_resolution: float = 1.0,
+        clock: typing.Callable[[], float] = time.time,
+    ):
+        super().__init__(max_entries=max_entries, ttl=ttl, endpoint_ttls=endpoint_ttls, clock=clock)
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.access_resolution = access_resolution
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with self._transaction() as connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread, reopened in a forked worker
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    @contextmanager
+    def _transaction(self) -> typing.Iterator[sqlite3.Connection]:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        """Close the database connection of the calling thread."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM responses")
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT entries FROM totals").fetchone()[0]
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the stored, compressed bodies."""
+        return self._connection().execute("SELECT bytes FROM totals").fetchone()[0]
+
+    def _load(self, key: str) -> typing.Optional[CachedResponse]:
+        now = self._clock()
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT expires_at, accessed_at, status_code, headers, method, url, body FROM responses "
+            "WHERE key = ? AND expires_at > ?",
+            (key, now),
+        ).fetchone()
+        if row is None:
+            return None
+        expires_at, accessed_at, status_code, headers, method, url, body = row
+        if now - accessed_at >= self.access_resolution:
+            connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return CachedResponse(
+            expires_at=expires_at,
+            status_code=status_code,
+            headers=[tuple(header) for header in json.loads(headers)],
+            content=zlib.decompress(body),
+            method=method,
+            url=url,
+        )
+
+    def _save(self, key: str, entry: CachedResponse) -> None:
+        body = zlib.compress(entry.content, self.compression_level)
+        now = self._clock()
+        with self._transaction() as connection:
+            # An upsert rather than INSERT OR REPLACE, whose implicit delete does not fire the totals trigger
+            connection.execute(
+                "INSERT INTO responses "
+                "(key, expires_at, accessed_at, size, status_code, headers, method, url, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET expires_at = excluded.expires_at, "
+                "accessed_at = excluded.accessed_at, size = excluded.size, status_code = excluded.status_code, "
+                "headers = excluded.headers, method = excluded.method, url = excluded.url, body = excluded.body",
+                (
+                    key,
+                    entry.expires_at,
+                    now,
+                    len(body),
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    entry.method,
+                    entry.url,
+                    body,
+                ),
+            )
+            connection.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            evicted = self._evict(connection)
+        if evicted:
+            with self._lock:
+                self.evictions += evicted
+
+    def _evict(self, connection: sqlite3.Connection) -> int:
+        count, size = connection.execute("SELECT entries, bytes FROM totals").fetchone()
+        if count <= self.max_entries and size <= self.max_bytes:
+            return 0
+        evicted = 0
+        while count > self.max_entries or size > self.max_bytes:
+            limit = max(count - self.max_entries, 64)
+            batch = connection.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT ?", (limit,)
+            ).fetchall()
+            if len(batch) < limit and (
+                count - len(batch) > self.max_entries or size - sum(entry[1] for entry in batch) > self.max_bytes
+            ):
+                # The whole table would not bring the totals within budget, so they drifted from it, for
+                # instance after rows were changed without the triggers. Count it again before deleting.
+                connection.execute(
+                    "UPDATE totals SET entries = (SELECT COUNT(*) FROM responses), "
+                    "bytes = (SELECT COALESCE(SUM(size), 0) FROM responses)"
+                )
+                count, size = connection.execute("SELECT entries, bytes FROM totals").fetchone()
+                continue
+            if not batch:
+                break
+            deleted = []
+            for key, entry_size in batch:
+                if count <= self.max_entries and size <= self.max_bytes:
+                    break
+                deleted.append((key,))
+                count -= 1
+                size -= entry_size
+            connection.executemany("DELETE FROM responses WHERE key = ?", deleted)
+            evicted += len(deleted)
+        return evicted
@@ -0,0 +1,195 @@
+import typing
+
+import pydantic
+import typing_extensions
+
+from ..types.article_entity import ArticleEntity
+from ..types.breaking_news_article_entity import BreakingNewsArticleEntity
+from ..types.breaking_news_event_entity import BreakingNewsEventEntity
+from ..types.breaking_news_response_dto import BreakingNewsResponseDto
+from ..types.cluster_entity import ClusterEntity
+from ..types.clustered_search_response_dto import ClusteredSearchResponseDto
+from ..types.nlp_data_entity import NlpDataEntity
+from ..types.search_response_dto import SearchResponseDto
+from .pydantic_utilities import IS_PYDANTIC_V2
+
+if typing.TYPE_CHECKING:
+    import numpy
+
+EmbeddingField = typing_extensions.Literal["new_embedding", "qwen_embedding"]
+# Size of both embeddings, used for the shape of an empty matrix
+EMBEDDING_DIMENSIONS = 1024
+
+
+def _import_numpy() -> typing.Any:
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError(
+            "To decode embeddings as numpy arrays, install the numpy extra: pip install newscatcher-sdk[numpy]"
+        ) from None
+    return numpy
+
+
+def _to_array(value: typing.Any) -> "numpy.ndarray":
+    numpy = _import_numpy()
+    array = numpy.asarray(value)
+    # Converting to float32 directly would turn None into NaN and accept strings
+    if array.ndim != 1 or array.dtype.kind not in "iuf":
+        raise ValueError("An embedding must be a list of numbers")
+    return numpy.ascontiguousarray(array, dtype=numpy.float32)
+
+
+def _to_list(array: "numpy.ndarray") -> typing.List[float]:
+    return array.tolist()  # type: ignore[no-any-return]
+
+
+if IS_PYDANTIC_V2:
+    # A contiguous numpy.float32 array, validated from a list of numbers and serialized back to one
+    EmbeddingArray = typing_extensions.Annotated[
+        typing.Any,
+        pydantic.PlainValidator(_to_array),  # type: ignore[attr-defined]
+        pydantic.PlainSerializer(_to_list, return_type=typing.List[float]),  # type: ignore[attr-defined]
+    ]
+else:
+    # embedding_format="numpy" requires Pydantic v2; the models below then keep lists
+    EmbeddingArray = typing.List[float]  # type: ignore[misc]
+
+
+class NumpyNlpDataEntity(NlpDataEntity):
+    """``NlpDataEntity`` with its embeddings as ``numpy.float32`` arrays, for ``embedding_format="numpy"``."""
+
+    new_embedding: typing.Optional[EmbeddingArray] = None  # type: ignore[assignment]
+    qwen_embedding: typing.Optional[EmbeddingArray] = None  # type: ignore[assignment]
+
+    def __eq__(self, other: typing.Any) -> bool:
+        # BaseModel compares the field values with ==, which numpy arrays answer element-wise
+        if not isinstance(other, pydantic.BaseModel):
+            return NotImplemented
+        if type(other) is not type(self) or self.__dict__.keys() != other.__dict__.keys():
+            return False
+        numpy = _import_numpy()
+        return (
+            all(
+                numpy.array_equal(value, other.__dict__[name])
+                if isinstance(value, numpy.ndarray)
+                else value == other.__dict__[name]
+                for name, value in self.__dict__.items()
+            )
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+            and self.__pydantic_private__ == other.__pydantic_private__
+        )
+
+    # Defining __eq__ would otherwise drop the hash of the frozen model
+    __hash__ = NlpDataEntity.__hash__
+
+
+class NumpyArticleEntity(ArticleEntity):
+    nlp: typing.Optional[NumpyNlpDataEntity] = None  # type: ignore[assignment]
+
+
+class NumpyBreakingNewsArticleEntity(BreakingNewsArticleEntity):
+    nlp: typing.Optional[NumpyNlpDataEntity] = None  # type: ignore[assignment]
+
+
+class NumpyClusterEntity(ClusterEntity):
+    articles: typing.List[NumpyArticleEntity]  # type: ignore[assignment]
+
+
+class NumpySearchResponseDto(SearchResponseDto):
+    articles: typing.Optional[typing.List[NumpyArticleEntity]] = None  # type: ignore[assignment]
+
+
+class NumpyClusteredSearchResponseDto(ClusteredSearchResponseDto):
+    clusters: typing.List[NumpyClusterEntity]  # type: ignore[assignment]
+
+
+class NumpyBreakingNewsEventEntity(BreakingNewsEventEntity):
+    articles: typing.List[NumpyBreakingNewsArticleEntity]  # type: ignore[assignment]
+
+
+class NumpyBreakingNewsResponseDto(BreakingNewsResponseDto):
+    breaking_news_events: typing.Optional[typing.List[NumpyBreakingNewsEventEntity]] = None  # type: ignore[assignment]
+
+
+# The models that hold article embeddings, directly or through their articles, and their numpy variants
+_NUMPY_MODELS: typing.Dict[typing.Any, typing.Any] = {
+    NlpDataEntity: NumpyNlpDataEntity,
+    ArticleEntity: NumpyArticleEntity,
+    BreakingNewsArticleEntity: NumpyBreakingNewsArticleEntity,
+    ClusterEntity: NumpyClusterEntity,
+    SearchResponseDto: NumpySearchResponseDto,
+    ClusteredSearchResponseDto: NumpyClusteredSearchResponseDto,
+    BreakingNewsEventEntity: NumpyBreakingNewsEventEntity,
+    BreakingNewsResponseDto: NumpyBreakingNewsResponseDto,
+}
+_with_embedding_arrays_cache: typing.Dict[typing.Any, typing.Any] = {}
+
+
+def with_embedding_arrays(type_: typing.Any) -> typing.Any:
+    """
+    The type to parse a response of ``type_`` as with ``embedding_format="numpy"``.
+
+    Models holding article embeddings are replaced by their ``Numpy`` subclasses, inside unions and lists
+    too; other types are returned as they are.
+    """
+    _import_numpy()
+    try:
+        cached = _with_embedding_arrays_cache.get(type_)
+    except TypeError:
+        return _compute_with_embedding_arrays(type_)
+    if cached is None:
+        cached = _compute_with_embedding_arrays(type_)
+        _with_embedding_arrays_cache[type_] = cached
+    return cached
+
+
+def _compute_with_embedding_arrays(type_: typing.Any) -> typing.Any:
+    try:
+        numpy_model = _NUMPY_MODELS.get(type_)
+    except TypeError:
+        numpy_model = None
+    if numpy_model is not None:
+        return numpy_model
+    origin = typing_extensions.get_origin(type_)
+    args = typing_extensions.get_args(type_)
+    if not args or origin is typing_extensions.Annotated:
+        return type_
+    numpy_args = tuple(_compute_with_embedding_arrays(arg) for arg in args)
+    if numpy_args == args:
+        return type_
+    if origin is typing.Union:
+        return typing.Union[numpy_args]
+    if origin is list:
+        return typing.List[numpy_args[0]]  # type: ignore[valid-type]
+    if origin is dict:
+        return typing.Dict[numpy_args[0], numpy_args[1]]  # type: ignore[valid-type]
+    return type_
+
+
+def stack_embeddings(
+    articles: typing.Iterable[typing.Any],
+    field: EmbeddingField = "qwen_embedding",
+    *,
+    skip_missing: bool = False,
+) -> "numpy.ndarray":
+    """
+    Stack the embeddings of a page of articles into one ``(n, 1024)`` ``numpy.float32`` matrix.
+
+    Row ``i`` is the ``field`` embedding of the ``i``-th article. Articles without it raise ``ValueError``
+    unless ``skip_missing`` is set, in which case they are left out. Embeddings decoded with
+    ``embedding_format="numpy"`` are copied into the matrix as they are; lists of floats are converted.
+    """
+    numpy = _import_numpy()
+    rows = []
+    for index, article in enumerate(articles):
+        nlp = getattr(article, "nlp", None)
+        embedding = getattr(nlp, field, None) if nlp is not None else None
+        if embedding is None:
+            if skip_missing:
+                continue
+            raise ValueError(f"Article {index} has no {field}")
+        rows.append(numpy.asarray(embedding, dtype=numpy.float32))
+    if not rows:
+        return numpy.empty((0, EMBEDDING_DIMENSIONS), dtype=numpy.float32)
+    return numpy.stack(rows)
@@ -0,0 +1,136 @@
+import asyncio
+import time
+import typing
+from collections import deque
+from urllib.parse import urlsplit
+
+import httpx
+
+# Latency-sensitive endpoints whose first page callers usually wait on
+DEFAULT_HEDGED_ENDPOINTS = ("api/search", "api/latest_headlines")
+
+
+class RequestHedger:
+    """
+    Send a duplicate of a slow request and use whichever response arrives first.
+
+    Latencies are tracked per endpoint over the last ``window`` requests. Once
+    ``min_samples`` have been seen, a request still unanswered after the
+    ``percentile`` latency of its endpoint is sent again; the first of the two
+    to complete is returned and the other is cancelled. A slow backend shard
+    then costs one percentile delay instead of its full latency.
+
+    Hedges are capped at ``budget`` times the number of hedgeable requests, so
+    the extra load stays bounded even when the whole backend slows down. Each
+    duplicate goes through ``send`` again, so it is rate limited and holds a
+    concurrency slot like any other request.
+
+    When a duplicate wins, the cancelled original is recorded with the time it
+    had been waiting, a lower bound on its latency. Recording only winners
+    would drop the slow tail and pull the percentile, and so the hedge delay,
+    ever lower.
+
+    Args:
+        percentile: Latency percentile, between 0 and 1, after which a duplicate is sent
+        budget: Maximum ratio of duplicates to hedgeable requests
+        endpoints: Endpoint paths to hedge
+        first_page_only: Whether to hedge only requests for the first page of results
+        min_delay: Lower bound on the delay before a duplicate is sent, in seconds
+        min_samples: Latencies observed for an endpoint before it is hedged
+        window: Number of recent latencies kept per endpoint
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget: float = 0.05,
+        endpoints: typing.Iterable[str] = DEFAULT_HEDGED_ENDPOINTS,
+        first_page_only: bool = True,
+        min_delay: float = 0.01,
+        min_samples: int = 20,
+        window: int = 500,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if budget < 0:
+            raise ValueError("budget must not be negative")
+        self.percentile = percentile
+        self.budget = budget
+        self.endpoints = tuple("/" + endpoint.strip("/") for endpoint in endpoints)
+        self.first_page_only = first_page_only
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window = window
+        self._clock = clock
+        self._latencies: typing.Dict[str, typing.Deque[float]] = {}
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def endpoint_for(self, url: str, json_body: typing.Any = None) -> typing.Optional[str]:
+        """The hedged endpoint a request belongs to, or None if it is not hedged."""
+        if self.first_page_only and isinstance(json_body, dict) and json_body.get("page", 1) not in (1, None):
+            return None
+        path = urlsplit(url).path.rstrip("/")
+        for endpoint in self.endpoints:
+            if path.endswith(endpoint):
+                return endpoint
+        return None
+
+    def hedge_delay(self, endpoint: str) -> typing.Optional[float]:
+        """Seconds to wait before duplicating a request, or None while too few latencies are known."""
+        latencies = self._latencies.get(endpoint)
+        if latencies is None or len(latencies) < self.min_samples:
+            return None
+        ordered = sorted(latencies)
+        index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        return max(self.min_delay, ordered[index])
+
+    def record(self, endpoint: str, latency: float) -> None:
+        latencies = self._latencies.get(endpoint)
+        if latencies is None:
+            latencies = self._latencies[endpoint] = deque(maxlen=self.window)
+        latencies.append(latency)
+
+    async def run(self, endpoint: str, send: typing.Callable[[], typing.Awaitable[httpx.Response]]) -> httpx.Response:
+        """Send a request through ``send``, duplicating it if it is slower than the hedge delay."""
+        self.requests += 1
+        delay = self.hedge_delay(endpoint)
+        started = self._clock()
+        primary = asyncio.ensure_future(self._timed(send))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and self.hedges < self.budget * self.requests:
+                self.hedges += 1
+                tasks.add(asyncio.ensure_future(self._timed(send)))
+
+            error: typing.Optional[BaseException] = None
+            pending = tasks
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                        continue
+                    response, latency = task.result()
+                    self.record(endpoint, latency)
+                    if task is not primary:
+                        self.hedge_wins += 1
+                        if not primary.done():
+                            # Censored at the time it is cancelled
+                            self.record(endpoint, self._clock() - started)
+                    return response
+            raise typing.cast(BaseException, error)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _timed(
+        self, send: typing.Callable[[], typing.Awaitable[httpx.Response]]
+    ) -> typing.Tuple[httpx.Response, float]:
+        started = self._clock()
+        response = await send()
+        return response, self._clock() - started
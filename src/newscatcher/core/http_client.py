@@ -9,13 +9,28 @@ from contextlib import asynccontextmanager, contextmanager
 from random import random
 
 import httpx
+from .circuit_breaker import CLOSED, CircuitBreaker
+from .coalescing import AsyncRequestCoalescer, RequestCoalescer, coalescing_key
+from .compression import ACCEPT_ENCODING, TransferStats
+from .concurrency import AdaptiveConcurrencyController
+from .deadline import (
+    DeadlineExceededError,
+    deadline_from_request_options,
+    request_options_with_deadline,
+    retry_fits_deadline,
+    time_left,
+)
 from .file import File, convert_file_dict_to_httpx_tuples
 from .force_multipart import FORCE_MULTIPART
+from .hedging import RequestHedger
 from .jsonable_encoder import jsonable_encoder
 from .logging import LogConfig, Logger, create_logger
+from .parsing import EmbeddingFormat, ResponseMode, parse_options
 from .query_encoder import encode_query
+from .rate_limiter import RateLimiter
 from .remove_none_from_dict import remove_none_from_dict as remove_none_from_dict
 from .request_options import RequestOptions
+from .response_cache import ResponseCache, request_cache_key
 from httpx._types import RequestFiles
 
 INITIAL_RETRY_DELAY_SECONDS = 1.0
@@ -272,6 +287,12 @@ class HttpClient:
         base_url: typing.Optional[typing.Callable[[], str]] = None,
         base_max_retries: int = 2,
         logging_config: typing.Optional[typing.Union[LogConfig, Logger]] = None,
+        response_mode: ResponseMode = "validate",
+        embedding_format: EmbeddingFormat = "list",
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
     ):
         self.base_url = base_url
         self.base_timeout = base_timeout
@@ -279,6 +300,23 @@ class HttpClient:
         self.base_max_retries = base_max_retries
         self.httpx_client = httpx_client
         self.logger = create_logger(logging_config)
+        self.response_mode = response_mode
+        self.embedding_format = embedding_format
+        self.rate_limiter = rate_limiter
+        self.transfer_stats = TransferStats()
+        self.request_coalescer = RequestCoalescer() if coalesce_requests else None
+        self.response_cache = response_cache
+        self.circuit_breaker = circuit_breaker
+
+    def _circuit_closed(self, circuit_key: typing.Optional[str]) -> bool:
+        """Whether a retry may be sent; retries are abandoned once the endpoint's circuit opens."""
+        if self.circuit_breaker is None or circuit_key is None:
+            return True
+        return self.circuit_breaker.state(circuit_key) == CLOSED
+
+    def parse_options(self, request_options: typing.Optional[RequestOptions]) -> typing.Dict[str, typing.Any]:
+        """How the raw clients pass a response body to ``parse_json_as``, given the call's request options."""
+        return parse_options(request_options, self.response_mode, self.embedding_format)
 
     def get_base_url(self, maybe_base_url: typing.Optional[str]) -> str:
         base_url = maybe_base_url
@@ -317,6 +355,10 @@ class HttpClient:
             if request_options is not None and request_options.get("timeout_in_seconds") is not None
             else self.base_timeout()
         )
+        deadline_at = deadline_from_request_options(request_options)
+        if deadline_at is not None:
+            remaining = time_left(deadline_at)
+            timeout = remaining if timeout is None else min(timeout, remaining)
 
         json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
 
@@ -355,6 +397,8 @@ class HttpClient:
         _request_headers = jsonable_encoder(
             remove_none_from_dict(
                 {
+                    # Ask for the strongest encoding httpx can decode; explicit headers override it
+                    "Accept-Encoding": ACCEPT_ENCODING,
                     **self.base_headers(),
                     **(headers if headers is not None else {}),
                     **(request_options.get("additional_headers", {}) or {} if request_options is not None else {}),
@@ -377,21 +421,81 @@ class HttpClient:
             else self.base_max_retries
         )
 
+        # Whether the attempt's timeout was cut to the time left before the deadline
+        _cut_to_deadline = deadline_at is not None and timeout == remaining
+        _circuit_key = self.circuit_breaker.key_for(_request_url) if self.circuit_breaker is not None else None
+
+        def _send() -> httpx.Response:
+            if self.circuit_breaker is not None and _circuit_key is not None:
+                self.circuit_breaker.before_request(_circuit_key)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = self.httpx_client.request(
+                    method=method,
+                    url=_request_url,
+                    headers=_request_headers,
+                    params=_encoded_params if _encoded_params else None,
+                    json=json_body,
+                    data=data_body,
+                    content=content,
+                    files=request_files,
+                    timeout=timeout,
+                )
+            except httpx.TimeoutException as e:
+                if self.circuit_breaker is not None and _circuit_key is not None:
+                    # A timeout that only the caller's deadline imposed says nothing about the endpoint
+                    if _cut_to_deadline or isinstance(e, DeadlineExceededError):
+                        self.circuit_breaker.release(_circuit_key)
+                    else:
+                        self.circuit_breaker.record_failure(_circuit_key)
+                raise
+            except httpx.TransportError:
+                if self.circuit_breaker is not None and _circuit_key is not None:
+                    self.circuit_breaker.record_failure(_circuit_key)
+                raise
+            except BaseException:
+                if self.circuit_breaker is not None and _circuit_key is not None:
+                    self.circuit_breaker.release(_circuit_key)
+                raise
+            if self.circuit_breaker is not None and _circuit_key is not None:
+                self.circuit_breaker.record_response(_circuit_key, response.status_code)
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(response.status_code, response.headers)
+            self.transfer_stats.record(response)
+            return response
+
+        _keyable = data_body is None and content is None and not request_files
+        _coalescing_key = (
+            coalescing_key(method, _request_url, _encoded_params, json_body, _request_headers)
+            if self.request_coalescer is not None and _keyable
+            else None
+        )
+        _cache_key = (
+            request_cache_key(method, _request_url, _encoded_params, json_body, _request_headers)
+            if self.response_cache is not None and _keyable
+            else None
+        )
+
+        def _fetch() -> httpx.Response:
+            if self.response_cache is not None and _cache_key is not None:
+                return self.response_cache.fetch(_cache_key, _send)
+            return _send()
+
+        _attempt_started = time.monotonic()
         try:
-            response = self.httpx_client.request(
-                method=method,
-                url=_request_url,
-                headers=_request_headers,
-                params=_encoded_params if _encoded_params else None,
-                json=json_body,
-                data=data_body,
-                content=content,
-                files=request_files,
-                timeout=timeout,
-            )
+            if self.request_coalescer is not None and _coalescing_key is not None:
+                response = self.request_coalescer.do(_coalescing_key, _fetch)
+            else:
+                response = _fetch()
         except (httpx.ConnectError, httpx.RemoteProtocolError):
-            if retries < max_retries:
-                time.sleep(_retry_timeout_from_retries(retries=retries))
+            _delay = _retry_timeout_from_retries(retries=retries)
+            if (
+                retries < max_retries
+                and retry_fits_deadline(deadline_at, _delay, time.monotonic() - _attempt_started)
+                and self._circuit_closed(_circuit_key)
+            ):
+                time.sleep(_delay)
                 return self.request(
                     path=path,
                     method=method,
@@ -402,16 +506,25 @@ class HttpClient:
                     content=content,
                     files=files,
                     headers=headers,
-                    request_options=request_options,
+                    request_options=request_options_with_deadline(request_options, deadline_at),
                     retries=retries + 1,
                     omit=omit,
                     force_multipart=force_multipart,
                 )
             raise
+        except httpx.TimeoutException as e:
+            if _cut_to_deadline and not isinstance(e, DeadlineExceededError):
+                raise DeadlineExceededError() from e
+            raise
 
         if _should_retry(response=response):
-            if retries < max_retries:
-                time.sleep(_retry_timeout(response=response, retries=retries))
+            _delay = _retry_timeout(response=response, retries=retries)
+            if (
+                retries < max_retries
+                and retry_fits_deadline(deadline_at, _delay, time.monotonic() - _attempt_started)
+                and self._circuit_closed(_circuit_key)
+            ):
+                time.sleep(_delay)
                 return self.request(
                     path=path,
                     method=method,
@@ -422,7 +535,7 @@ class HttpClient:
                     content=content,
                     files=files,
                     headers=headers,
-                    request_options=request_options,
+                    request_options=request_options_with_deadline(request_options, deadline_at),
                     retries=retries + 1,
                     omit=omit,
                     force_multipart=force_multipart,
@@ -477,6 +590,10 @@ class HttpClient:
             if request_options is not None and request_options.get("timeout_in_seconds") is not None
             else self.base_timeout()
         )
+        deadline_at = deadline_from_request_options(request_options)
+        if deadline_at is not None:
+            remaining = time_left(deadline_at)
+            timeout = remaining if timeout is None else min(timeout, remaining)
 
         request_files: typing.Optional[RequestFiles] = (
             convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
@@ -515,6 +632,7 @@ class HttpClient:
         _request_headers = jsonable_encoder(
             remove_none_from_dict(
                 {
+                    "Accept-Encoding": ACCEPT_ENCODING,
                     **self.base_headers(),
                     **(headers if headers is not None else {}),
                     **(request_options.get("additional_headers", {}) if request_options is not None else {}),
@@ -530,6 +648,9 @@ class HttpClient:
                 headers=_redact_headers(_request_headers),
             )
 
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
         with self.httpx_client.stream(
             method=method,
             url=_request_url,
@@ -541,6 +662,8 @@ class HttpClient:
             files=request_files,
             timeout=timeout,
         ) as stream:
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(stream.status_code, stream.headers)
             yield stream
 
 
@@ -555,6 +678,14 @@ class AsyncHttpClient:
         base_max_retries: int = 2,
         async_base_headers: typing.Optional[typing.Callable[[], typing.Awaitable[typing.Dict[str, str]]]] = None,
         logging_config: typing.Optional[typing.Union[LogConfig, Logger]] = None,
+        response_mode: ResponseMode = "validate",
+        embedding_format: EmbeddingFormat = "list",
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        concurrency_controller: typing.Optional[AdaptiveConcurrencyController] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+        request_hedger: typing.Optional[RequestHedger] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
     ):
         self.base_url = base_url
         self.base_timeout = base_timeout
@@ -563,12 +694,31 @@ class AsyncHttpClient:
         self.async_base_headers = async_base_headers
         self.httpx_client = httpx_client
         self.logger = create_logger(logging_config)
+        self.response_mode = response_mode
+        self.embedding_format = embedding_format
+        self.rate_limiter = rate_limiter
+        self.transfer_stats = TransferStats()
+        self.request_coalescer = AsyncRequestCoalescer() if coalesce_requests else None
+        self.response_cache = response_cache
+        self.circuit_breaker = circuit_breaker
+        self.concurrency_controller = concurrency_controller
+        self.request_hedger = request_hedger
 
     async def _get_headers(self) -> typing.Dict[str, str]:
         if self.async_base_headers is not None:
             return await self.async_base_headers()
         return self.base_headers()
 
+    def _circuit_closed(self, circuit_key: typing.Optional[str]) -> bool:
+        """Whether a retry may be sent; retries are abandoned once the endpoint's circuit opens."""
+        if self.circuit_breaker is None or circuit_key is None:
+            return True
+        return self.circuit_breaker.state(circuit_key) == CLOSED
+
+    def parse_options(self, request_options: typing.Optional[RequestOptions]) -> typing.Dict[str, typing.Any]:
+        """How the raw clients pass a response body to ``parse_json_as``, given the call's request options."""
+        return parse_options(request_options, self.response_mode, self.embedding_format)
+
     def get_base_url(self, maybe_base_url: typing.Optional[str]) -> str:
         base_url = maybe_base_url
         if self.base_url is not None and base_url is None:
@@ -606,6 +756,10 @@ class AsyncHttpClient:
             if request_options is not None and request_options.get("timeout_in_seconds") is not None
             else self.base_timeout()
         )
+        deadline_at = deadline_from_request_options(request_options)
+        if deadline_at is not None:
+            remaining = time_left(deadline_at)
+            timeout = remaining if timeout is None else min(timeout, remaining)
 
         request_files: typing.Optional[RequestFiles] = (
             convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
@@ -647,6 +801,8 @@ class AsyncHttpClient:
         _request_headers = jsonable_encoder(
             remove_none_from_dict(
                 {
+                    # Ask for the strongest encoding httpx can decode; explicit headers override it
+                    "Accept-Encoding": ACCEPT_ENCODING,
                     **_headers,
                     **(headers if headers is not None else {}),
                     **(request_options.get("additional_headers", {}) or {} if request_options is not None else {}),
@@ -669,8 +825,8 @@ class AsyncHttpClient:
             else self.base_max_retries
         )
 
-        try:
-            response = await self.httpx_client.request(
+        async def _request() -> httpx.Response:
+            return await self.httpx_client.request(
                 method=method,
                 url=_request_url,
                 headers=_request_headers,
@@ -681,9 +837,87 @@ class AsyncHttpClient:
                 files=request_files,
                 timeout=timeout,
             )
+
+        _hedged_endpoint = (
+            self.request_hedger.endpoint_for(_request_url, json_body) if self.request_hedger is not None else None
+        )
+
+        async def _admitted() -> httpx.Response:
+            # Every request sent, a hedged duplicate included, takes its own rate limit token and concurrency slot
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            if self.concurrency_controller is not None:
+                return await self.concurrency_controller.run(_request)
+            return await _request()
+
+        async def _attempt() -> httpx.Response:
+            if self.request_hedger is not None and _hedged_endpoint is not None:
+                return await self.request_hedger.run(_hedged_endpoint, _admitted)
+            return await _admitted()
+
+        # Whether the attempt's timeout was cut to the time left before the deadline
+        _cut_to_deadline = deadline_at is not None and timeout == remaining
+        _circuit_key = self.circuit_breaker.key_for(_request_url) if self.circuit_breaker is not None else None
+
+        async def _send() -> httpx.Response:
+            if self.circuit_breaker is not None and _circuit_key is not None:
+                self.circuit_breaker.before_request(_circuit_key)
+            try:
+                response = await _attempt()
+            except httpx.TimeoutException as e:
+                if self.circuit_breaker is not None and _circuit_key is not None:
+                    # A timeout that only the caller's deadline imposed says nothing about the endpoint
+                    if _cut_to_deadline or isinstance(e, DeadlineExceededError):
+                        self.circuit_breaker.release(_circuit_key)
+                    else:
+                        self.circuit_breaker.record_failure(_circuit_key)
+                raise
+            except httpx.TransportError:
+                if self.circuit_breaker is not None and _circuit_key is not None:
+                    self.circuit_breaker.record_failure(_circuit_key)
+                raise
+            except BaseException:
+                if self.circuit_breaker is not None and _circuit_key is not None:
+                    self.circuit_breaker.release(_circuit_key)
+                raise
+            if self.circuit_breaker is not None and _circuit_key is not None:
+                self.circuit_breaker.record_response(_circuit_key, response.status_code)
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(response.status_code, response.headers)
+            self.transfer_stats.record(response)
+            return response
+
+        _keyable = data_body is None and content is None and not request_files
+        _coalescing_key = (
+            coalescing_key(method, _request_url, _encoded_params, json_body, _request_headers)
+            if self.request_coalescer is not None and _keyable
+            else None
+        )
+        _cache_key = (
+            request_cache_key(method, _request_url, _encoded_params, json_body, _request_headers)
+            if self.response_cache is not None and _keyable
+            else None
+        )
+
+        async def _fetch() -> httpx.Response:
+            if self.response_cache is not None and _cache_key is not None:
+                return await self.response_cache.fetch_async(_cache_key, _send)
+            return await _send()
+
+        _attempt_started = time.monotonic()
+        try:
+            if self.request_coalescer is not None and _coalescing_key is not None:
+                response = await self.request_coalescer.do(_coalescing_key, _fetch)
+            else:
+                response = await _fetch()
         except (httpx.ConnectError, httpx.RemoteProtocolError):
-            if retries < max_retries:
-                await asyncio.sleep(_retry_timeout_from_retries(retries=retries))
+            _delay = _retry_timeout_from_retries(retries=retries)
+            if (
+                retries < max_retries
+                and retry_fits_deadline(deadline_at, _delay, time.monotonic() - _attempt_started)
+                and self._circuit_closed(_circuit_key)
+            ):
+                await asyncio.sleep(_delay)
                 return await self.request(
                     path=path,
                     method=method,
@@ -694,16 +928,25 @@ class AsyncHttpClient:
                     content=content,
                     files=files,
                     headers=headers,
-                    request_options=request_options,
+                    request_options=request_options_with_deadline(request_options, deadline_at),
                     retries=retries + 1,
                     omit=omit,
                     force_multipart=force_multipart,
                 )
             raise
+        except httpx.TimeoutException as e:
+            if _cut_to_deadline and not isinstance(e, DeadlineExceededError):
+                raise DeadlineExceededError() from e
+            raise
 
         if _should_retry(response=response):
-            if retries < max_retries:
-                await asyncio.sleep(_retry_timeout(response=response, retries=retries))
+            _delay = _retry_timeout(response=response, retries=retries)
+            if (
+                retries < max_retries
+                and retry_fits_deadline(deadline_at, _delay, time.monotonic() - _attempt_started)
+                and self._circuit_closed(_circuit_key)
+            ):
+                await asyncio.sleep(_delay)
                 return await self.request(
                     path=path,
                     method=method,
@@ -714,7 +957,7 @@ class AsyncHttpClient:
                     content=content,
                     files=files,
                     headers=headers,
-                    request_options=request_options,
+                    request_options=request_options_with_deadline(request_options, deadline_at),
                     retries=retries + 1,
                     omit=omit,
                     force_multipart=force_multipart,
@@ -769,6 +1012,10 @@ class AsyncHttpClient:
             if request_options is not None and request_options.get("timeout_in_seconds") is not None
             else self.base_timeout()
         )
+        deadline_at = deadline_from_request_options(request_options)
+        if deadline_at is not None:
+            remaining = time_left(deadline_at)
+            timeout = remaining if timeout is None else min(timeout, remaining)
 
         request_files: typing.Optional[RequestFiles] = (
             convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
@@ -810,6 +1057,7 @@ class AsyncHttpClient:
         _request_headers = jsonable_encoder(
             remove_none_from_dict(
                 {
+                    "Accept-Encoding": ACCEPT_ENCODING,
                     **_headers,
                     **(headers if headers is not None else {}),
                     **(request_options.get("additional_headers", {}) if request_options is not None else {}),
@@ -825,6 +1073,9 @@ class AsyncHttpClient:
                 headers=_redact_headers(_request_headers),
             )
 
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+
         async with self.httpx_client.stream(
             method=method,
             url=_request_url,
@@ -836,4 +1087,6 @@ class AsyncHttpClient:
             files=request_files,
             timeout=timeout,
         ) as stream:
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(stream.status_code, stream.headers)
             yield stream
@@ -3,6 +3,7 @@
 from typing import Dict, Generic, TypeVar
 
 import httpx
+from .compression import transfer_sizes
 
 # Generic to represent the underlying type of the data wrapped by the HTTP response.
 T = TypeVar("T")
@@ -24,6 +25,20 @@ class BaseHttpResponse:
     def status_code(self) -> int:
         return self._response.status_code
 
+    @property
+    def wire_bytes(self) -> int:
+        """Size of the response body as received, before decompression."""
+        return transfer_sizes(self._response)[0]
+
+    @property
+    def decoded_bytes(self) -> int:
+        """Size of the response body after decompression."""
+        return transfer_sizes(self._response)[1]
+
+    @property
+    def content_encoding(self) -> str:
+        return self._response.headers.get("content-encoding", "identity")
+
 
 class HttpResponse(Generic[T], BaseHttpResponse):
     """HTTP response wrapper that exposes response headers and data."""
@@ -0,0 +1,263 @@
+import json
+import typing
+
+import pydantic
+import typing_extensions
+
+from ..types.breaking_news_response_dto import BreakingNewsResponseDto
+from ..types.clustered_search_response_dto import ClusteredSearchResponseDto
+from ..types.search_response_dto import SearchResponseDto
+from .embeddings import NumpyBreakingNewsResponseDto, NumpyClusteredSearchResponseDto, NumpySearchResponseDto
+from .parsing import parse_json_as
+from .pydantic_utilities import IS_PYDANTIC_V2, parse_obj_as
+from .serialization import (
+    _get_alias_from_type,
+    _get_cached_type_hints,
+    _remove_annotations,
+    convert_and_respect_annotation_metadata,
+)
+
+T = typing.TypeVar("T")
+M = typing.TypeVar("M", bound=pydantic.BaseModel)
+
+
+class _LazyField:
+    def __init__(self, name: str, key: str, hint: typing.Any, field_info: typing.Any) -> None:
+        self.name = name
+        # Key of the field in the JSON object
+        self.key = key
+        self.hint = hint
+        self.field_info = field_info
+        # Lists of models are not validated but turned into lists of views
+        self.item_type = _model_list_item_type(field_info.annotation)
+        self._adapter: typing.Any = None
+
+    def validate(self, value: typing.Any) -> typing.Any:
+        if self._adapter is None:
+            self._adapter = pydantic.TypeAdapter(self.hint)  # type: ignore[attr-defined]
+        converted = convert_and_respect_annotation_metadata(object_=value, annotation=self.hint, direction="read")
+        return self._adapter.validate_python(converted)
+
+
+_lazy_fields_cache: typing.Dict[typing.Any, typing.Dict[str, _LazyField]] = {}
+
+
+def _lazy_fields(model_type: typing.Type[pydantic.BaseModel]) -> typing.Dict[str, _LazyField]:
+    fields = _lazy_fields_cache.get(model_type)
+    if fields is None:
+        hints = _get_cached_type_hints(model_type)
+        fields = {}
+        for name, field_info in model_type.model_fields.items():  # type: ignore[attr-defined]
+            hint = hints.get(name, field_info.annotation)
+            key = field_info.alias or _get_alias_from_type(hint) or name
+            fields[name] = _LazyField(name, key, hint, field_info)
+        _lazy_fields_cache[model_type] = fields
+    return fields
+
+
+def _model_list_item_type(annotation: typing.Any) -> typing.Optional[typing.Type[pydantic.BaseModel]]:
+    annotation = _remove_annotations(annotation)
+    if typing_extensions.get_origin(annotation) is typing.Union:
+        members = [arg for arg in typing_extensions.get_args(annotation) if arg is not type(None)]
+        if len(members) != 1:
+            return None
+        annotation = _remove_annotations(members[0])
+    if typing_extensions.get_origin(annotation) is not list:
+        return None
+    item_type = _remove_annotations(typing_extensions.get_args(annotation)[0])
+    if isinstance(item_type, type) and issubclass(item_type, pydantic.BaseModel):
+        return item_type
+    return None
+
+
+class LazyModel(typing.Generic[M]):
+    """
+    Read-only view over the JSON object of a model that validates each field on first access.
+
+    Fields are looked up by attribute as on the model itself, and each one is
+    validated the first time it is read; fields that are never read cost
+    nothing. Fields holding lists of models return lists of views in turn, so
+    the articles of a cluster stay lazy too. ``materialize()`` validates the
+    whole object and returns the model; views compare equal to views and
+    models of the same data, and pickle as the materialized model.
+    """
+
+    def __init__(self, model_type: typing.Type[M], raw: typing.Mapping[str, typing.Any]) -> None:
+        self._model_type = model_type
+        self._raw = raw
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        field = _lazy_fields(self._model_type).get(name)
+        if field is not None:
+            value = self._read(field)
+        elif name in self._raw:
+            # Extra fields are kept as they were received, as models with extra="allow" do
+            value = self._raw[name]
+        else:
+            raise AttributeError(f"{self._model_type.__name__!r} object has no attribute {name!r}")
+        # Later reads are plain attribute lookups
+        self.__dict__[name] = value
+        return value
+
+    def materialize(self) -> M:
+        """Validate every field and return the model."""
+        return parse_obj_as(self._model_type, self._raw)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if isinstance(other, LazyModel):
+            if self._model_type is other._model_type and self._raw == other._raw:
+                return True
+            return self.materialize() == other.materialize()
+        if isinstance(other, pydantic.BaseModel):
+            return self.materialize() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> typing.Any:
+        model = self.materialize()
+        return _unpickle_model, (type(model), model.__getstate__())
+
+    def __repr__(self) -> str:
+        return f"LazyModel[{self._model_type.__name__}]({', '.join(map(str, self._raw))})"
+
+    def _read(self, field: _LazyField) -> typing.Any:
+        if field.key in self._raw:
+            value = self._raw[field.key]
+        elif field.name in self._raw:
+            value = self._raw[field.name]
+        elif field.field_info.is_required():
+            # Raises the same ValidationError as validating the model would
+            return getattr(self.materialize(), field.name)
+        else:
+            return field.field_info.get_default(call_default_factory=True)
+        if field.item_type is not None and _is_object_list(value):
+            return [LazyModel(field.item_type, item) for item in value]
+        return field.validate(value)
+
+
+def _unpickle_model(model_type: typing.Type[M], state: typing.Any) -> M:
+    model = model_type.__new__(model_type)
+    model.__setstate__(state)
+    return model
+
+
+def _is_object_list(value: typing.Any) -> bool:
+    return isinstance(value, list) and all(isinstance(item, dict) for item in value)
+
+
+_deferred_keys_cache: typing.Dict[typing.Any, typing.FrozenSet[str]] = {}
+
+
+def _deferred_keys(type_: typing.Any) -> typing.FrozenSet[str]:
+    """JSON keys of the lists of models left as views, across the members of a union."""
+    try:
+        keys = _deferred_keys_cache.get(type_)
+    except TypeError:
+        return frozenset()
+    if keys is None:
+        clean_type = _remove_annotations(type_)
+        if typing_extensions.get_origin(clean_type) is typing.Union:
+            keys = frozenset().union(*(_deferred_keys(member) for member in typing_extensions.get_args(clean_type)))
+        elif clean_type in _VIEW_CONTAINERS:
+            keys = frozenset(field.key for field in _lazy_fields(clean_type).values() if field.item_type is not None)
+        else:
+            keys = frozenset()
+        _deferred_keys_cache[type_] = keys
+    return keys
+
+
+def parse_lazy_json_as(type_: typing.Type[T], content: bytes) -> T:
+    """
+    Parse a JSON response body into ``type_``, leaving its lists of models as ``LazyModel`` views.
+
+    This applies to the article, cluster and event lists of search and breaking news responses, which are
+    returned as the matching ``Lazy`` subclass, such as ``LazySearchResponseDto``. The rest of the response,
+    such as its paging fields, is validated as usual, as are responses of other types.
+    Requires Pydantic v2; on v1 the body is validated in full.
+    """
+    if not IS_PYDANTIC_V2:
+        return parse_json_as(type_, content)
+    return parse_lazy_obj_as(type_, json.loads(content))
+
+
+def parse_lazy_obj_as(type_: typing.Type[T], data: typing.Any) -> T:
+    """Like ``parse_lazy_json_as``, for a response body that has already been decoded."""
+    deferred = _deferred_keys(type_)
+    if not isinstance(data, dict) or deferred.isdisjoint(data):
+        return parse_obj_as(type_, data)
+
+    # Validate the response with its lists of models emptied, then put views in their place
+    stripped = {key: [] if key in deferred and _is_object_list(value) else value for key, value in data.items()}
+    model = parse_obj_as(type_, stripped)
+    container = _VIEW_CONTAINERS.get(type(model))
+    if container is None:
+        return parse_obj_as(type_, data)
+    update = {
+        field.name: [LazyModel(field.item_type, item) for item in data[field.key]]
+        for field in _lazy_fields(type(model)).values()
+        if field.item_type is not None and field.key in deferred and _is_object_list(data.get(field.key))
+    }
+    values = {**model.__dict__, **(model.__pydantic_extra__ or {}), **update}
+    return typing.cast(T, container.model_construct(_fields_set=model.model_fields_set, **values))
+
+
+def _materialize_views(values: typing.Optional[typing.List[typing.Any]]) -> typing.Any:
+    if values is None:
+        return None
+    return [value.materialize() if isinstance(value, LazyModel) else value for value in values]
+
+
+if IS_PYDANTIC_V2:
+    # A list of models that may hold LazyModel views, serialized by materializing each view so that dict(),
+    # json() and model_dump() give what the fully validated model would
+    _Views = typing_extensions.Annotated[
+        typing.Optional[typing.List[typing.Any]],
+        pydantic.PlainSerializer(_materialize_views),  # type: ignore[attr-defined]
+    ]
+else:
+    # response_mode="lazy" requires Pydantic v2
+    _Views = typing.Optional[typing.List[typing.Any]]  # type: ignore[misc]
+
+
+class LazySearchResponseDto(SearchResponseDto):
+    """``SearchResponseDto`` as parsed with ``response_mode="lazy"``: its articles are ``LazyModel`` views."""
+
+    articles: _Views = None  # type: ignore[assignment]
+
+
+class LazyClusteredSearchResponseDto(ClusteredSearchResponseDto):
+    """``ClusteredSearchResponseDto`` as parsed with ``response_mode="lazy"``: its clusters are ``LazyModel`` views."""
+
+    clusters: _Views  # type: ignore[assignment]
+
+
+class LazyBreakingNewsResponseDto(BreakingNewsResponseDto):
+    """``BreakingNewsResponseDto`` as parsed with ``response_mode="lazy"``: its events are ``LazyModel`` views."""
+
+    breaking_news_events: _Views = None  # type: ignore[assignment]
+
+
+class LazyNumpySearchResponseDto(NumpySearchResponseDto):
+    articles: _Views = None  # type: ignore[assignment]
+
+
+class LazyNumpyClusteredSearchResponseDto(NumpyClusteredSearchResponseDto):
+    clusters: _Views  # type: ignore[assignment]
+
+
+class LazyNumpyBreakingNewsResponseDto(NumpyBreakingNewsResponseDto):
+    breaking_news_events: _Views = None  # type: ignore[assignment]
+
+
+# The responses whose lists of models are left as views, and the types they are then returned as
+_VIEW_CONTAINERS: typing.Dict[typing.Any, typing.Any] = {
+    SearchResponseDto: LazySearchResponseDto,
+    ClusteredSearchResponseDto: LazyClusteredSearchResponseDto,
+    BreakingNewsResponseDto: LazyBreakingNewsResponseDto,
+    NumpySearchResponseDto: LazyNumpySearchResponseDto,
+    NumpyClusteredSearchResponseDto: LazyNumpyClusteredSearchResponseDto,
+    NumpyBreakingNewsResponseDto: LazyNumpyBreakingNewsResponseDto,
+}
@@ -0,0 +1,120 @@
+import inspect
+import json
+import typing
+
+import pydantic
+import typing_extensions
+
+from .pydantic_utilities import IS_PYDANTIC_V2, _get_type_adapter, parse_obj_as
+from .serialization import _get_alias_from_type, _get_cached_type_hints, _remove_annotations
+
+if typing.TYPE_CHECKING:
+    from .request_options import RequestOptions
+
+T = typing.TypeVar("T")
+
+# How response bodies are turned into models:
+# - "validate": validate the whole body (the default)
+# - "lazy": leave lists of models, such as the articles of a search response, as LazyModel views
+#   whose fields are validated on first access
+# - "trusted": build the models without validating anything, for high-volume reads from a trusted API
+ResponseMode = typing_extensions.Literal["validate", "lazy", "trusted"]
+EmbeddingFormat = typing_extensions.Literal["list", "numpy"]
+
+
+def parse_json_as(
+    type_: typing.Type[T],
+    content: bytes,
+    response_mode: ResponseMode = "validate",
+    embedding_format: EmbeddingFormat = "list",
+) -> T:
+    """
+    Parse a JSON response body into ``type_``.
+
+    On Pydantic v2, types whose wire keys need no rewriting are validated straight from the bytes,
+    skipping the intermediate dicts built by ``json.loads``. Everything else goes through ``parse_obj_as``.
+    With ``embedding_format="numpy"`` the body is parsed into the ``Numpy`` subclasses of the article
+    models, which hold their embeddings as ``numpy.float32`` arrays.
+    """
+    if embedding_format == "numpy" and IS_PYDANTIC_V2:
+        from .embeddings import with_embedding_arrays
+
+        type_ = with_embedding_arrays(type_)
+    if response_mode == "lazy":
+        from .lazy_model import parse_lazy_json_as
+
+        return parse_lazy_json_as(type_, content)
+    if response_mode == "trusted":
+        from .trusted import parse_trusted_json_as
+
+        return parse_trusted_json_as(type_, content)
+    if IS_PYDANTIC_V2 and _validates_wire_json(type_):
+        try:
+            return _get_type_adapter(type_).validate_json(content)  # type: ignore[no-any-return]
+        except pydantic.ValidationError as e:
+            # Let json.loads decide, so malformed bodies still raise JSONDecodeError
+            if not any(error["type"] == "json_invalid" for error in e.errors()):
+                raise
+    return parse_obj_as(type_, json.loads(content))
+
+
+def parse_options(
+    request_options: typing.Optional["RequestOptions"],
+    response_mode: ResponseMode,
+    embedding_format: EmbeddingFormat,
+) -> typing.Dict[str, typing.Any]:
+    """
+    The ``parse_json_as`` keyword arguments of a call: the client's response mode and embedding format,
+    unless its request options set them.
+    """
+    if request_options is not None:
+        if request_options.get("response_mode") is not None:
+            response_mode = request_options["response_mode"]
+        if request_options.get("embedding_format") is not None:
+            embedding_format = request_options["embedding_format"]
+    return {"response_mode": response_mode, "embedding_format": embedding_format}
+
+
+# Whether a type can be validated from wire JSON as is: every FieldMetadata alias reachable from it is
+# also the Pydantic alias of its field, so convert_and_respect_annotation_metadata has nothing to rewrite
+# that Pydantic would not accept anyway. This is constant per type, so it is decided once and cached.
+_validates_wire_json_cache: typing.Dict[typing.Any, bool] = {}
+
+
+def _validates_wire_json(type_: typing.Any) -> bool:
+    try:
+        cached = _validates_wire_json_cache.get(type_)
+    except TypeError:
+        # Unhashable annotation; compute without caching.
+        return _compute_validates_wire_json(type_, set())
+    if cached is None:
+        cached = _compute_validates_wire_json(type_, set())
+        _validates_wire_json_cache[type_] = cached
+    return cached
+
+
+def _compute_validates_wire_json(type_: typing.Any, seen: typing.Set[typing.Any]) -> bool:
+    clean_type = _remove_annotations(type_)
+    try:
+        if clean_type in seen:
+            return True
+        seen = seen | {clean_type}
+    except TypeError:
+        pass
+
+    if typing_extensions.is_typeddict(clean_type):
+        annotations = _get_cached_type_hints(clean_type)
+        if any(_get_alias_from_type(hint) is not None for hint in annotations.values()):
+            return False
+        return all(_compute_validates_wire_json(hint, seen) for hint in annotations.values())
+
+    if inspect.isclass(clean_type) and issubclass(clean_type, pydantic.BaseModel):
+        annotations = _get_cached_type_hints(clean_type)
+        model_fields = getattr(clean_type, "model_fields", {})
+        for field_name, hint in annotations.items():
+            alias = _get_alias_from_type(hint)
+            if alias is not None and alias != getattr(model_fields.get(field_name), "alias", None):
+                return False
+        return all(_compute_validates_wire_json(hint, seen) for hint in annotations.values())
+
+    return all(_compute_validates_wire_json(arg, seen) for arg in typing_extensions.get_args(clean_type))
@@ -0,0 +1,164 @@
+import asyncio
+import threading
+import time
+import typing
+
+import httpx
+
+# X-RateLimit-Reset values above this are Unix timestamps, smaller ones are seconds
+_RESET_TIMESTAMP_THRESHOLD = 1_000_000_000
+
+
+def _parse_number(value: typing.Optional[str]) -> typing.Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_reset_delay(response_headers: httpx.Headers) -> typing.Optional[float]:
+    """
+    Parse the X-RateLimit-Reset header as seconds from now.
+    Accepts both a Unix timestamp and a number of seconds.
+    """
+    reset = _parse_number(response_headers.get("x-ratelimit-reset"))
+    if reset is None:
+        return None
+    if reset > _RESET_TIMESTAMP_THRESHOLD:
+        reset -= time.time()
+    return max(reset, 0.0)
+
+
+def _parse_retry_after_seconds(response_headers: httpx.Headers) -> typing.Optional[float]:
+    retry_after_ms = _parse_number(response_headers.get("retry-after-ms"))
+    if retry_after_ms is not None:
+        return max(retry_after_ms / 1000, 0.0)
+    retry_after = _parse_number(response_headers.get("retry-after"))
+    if retry_after is not None:
+        return max(retry_after, 0.0)
+    return None
+
+
+class RateLimiter:
+    """
+    Token bucket that paces requests before they are sent.
+
+    One limiter is shared by every request of a client, from any number of threads
+    or asyncio tasks. The refill rate and burst size are learned from the
+    X-RateLimit-Limit, X-RateLimit-Remaining and X-RateLimit-Reset response headers,
+    so requests are spread over the rate limit window instead of running into 429
+    responses. A 429 that still gets through pauses every request until the server's
+    reset time.
+
+    Args:
+        requests_per_second: Initial refill rate. None sends requests unpaced until
+            the first rate limit headers arrive.
+        burst: Maximum number of requests sent back to back. Defaults to the learned
+            X-RateLimit-Limit, or to one second of requests.
+        window_seconds: Length of the rate limit window assumed when the server sends
+            X-RateLimit-Limit without X-RateLimit-Reset.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: typing.Optional[float] = None,
+        burst: typing.Optional[float] = None,
+        window_seconds: float = 1.0,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ):
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        self.window_seconds = window_seconds
+        self._clock = clock
+        # Both the bucket state and the counters are guarded by a thread lock. It is
+        # never held across a sleep or an await, so it is also safe for asyncio tasks.
+        self._lock = threading.Lock()
+        self._rate = requests_per_second
+        self._fixed_burst = burst
+        self._burst = burst if burst is not None else max(requests_per_second or 1.0, 1.0)
+        self._tokens = self._burst
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self.throttled_seconds = 0.0
+        self.rate_limited_responses = 0
+
+    @property
+    def requests_per_second(self) -> typing.Optional[float]:
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        if self._rate is not None and now > self._updated_at:
+            self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = max(now, self._updated_at)
+
+    def reserve(self) -> float:
+        """
+        Take one token and return the number of seconds to wait before sending.
+
+        Tokens may go negative: each waiting request holds its own place in line, so
+        concurrent callers are spaced out instead of all waking at the same moment.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            delay = max(self._paused_until - now, 0.0)
+            if self._rate is not None:
+                self._tokens -= 1
+                if self._tokens < 0:
+                    delay = max(delay, -self._tokens / self._rate)
+            self.throttled_seconds += delay
+            return delay
+
+    def acquire(self) -> None:
+        """Block the calling thread until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Suspend the calling task until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, status_code: int, response_headers: httpx.Headers) -> None:
+        """
+        Learn the rate limit from a response.
+
+        Args:
+            status_code: HTTP status code of the response
+            response_headers: Headers of the response
+        """
+        limit = _parse_number(response_headers.get("x-ratelimit-limit"))
+        remaining = _parse_number(response_headers.get("x-ratelimit-remaining"))
+        reset_delay = _parse_reset_delay(response_headers)
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+
+            if status_code == 429:
+                self.rate_limited_responses += 1
+                pause = _parse_retry_after_seconds(response_headers)
+                if pause is None:
+                    pause = reset_delay if reset_delay is not None else self.window_seconds
+                self._paused_until = max(self._paused_until, now + pause)
+                self._tokens = min(self._tokens, 0.0)
+                return
+
+            if limit is not None and limit > 0:
+                window = reset_delay if reset_delay else self.window_seconds
+                if remaining is not None and reset_delay:
+                    # Spread what is left of the window evenly until it resets
+                    self._rate = max(remaining, 1.0) / reset_delay
+                else:
+                    self._rate = limit / window
+                if self._fixed_burst is None:
+                    self._burst = limit
+
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+                if remaining <= 0 and reset_delay:
+                    self._paused_until = max(self._paused_until, now + reset_delay)
@@ -7,6 +7,8 @@ try:
 except ImportError:
     from typing_extensions import NotRequired
 
+from .parsing import EmbeddingFormat, ResponseMode
+
 
 class RequestOptions(typing.TypedDict, total=False):
     """
@@ -25,6 +27,12 @@ class RequestOptions(typing.TypedDict, total=False):
         - additional_body_parameters: typing.Dict[str, typing.Any]. A dictionary containing additional parameters to spread into the request's body parameters dict
 
         - chunk_size: int. The size, in bytes, to process each chunk of data being streamed back within the response. This equates to leveraging `chunk_size` within `requests` or `httpx`, and is only leveraged for file downloads.
+
+        - deadline: float. The number of seconds the call may take in total, across all attempts and the backoff between them. Retries that cannot finish in time are skipped.
+
+        - response_mode: ResponseMode. How the response body is parsed, overriding the client's `response_mode`. "lazy" leaves lists of models, such as the articles of a search response, as views whose fields are validated on first access. "trusted" builds the models without validating them.
+
+        - embedding_format: EmbeddingFormat. How article embeddings are decoded, overriding the client's `embedding_format`. "numpy" stores them as `numpy.float32` arrays.
     """
 
     timeout_in_seconds: NotRequired[int]
@@ -33,3 +41,6 @@ class RequestOptions(typing.TypedDict, total=False):
     additional_query_parameters: NotRequired[typing.Dict[str, typing.Any]]
     additional_body_parameters: NotRequired[typing.Dict[str, typing.Any]]
     chunk_size: NotRequired[int]
+    deadline: NotRequired[float]
+    response_mode: NotRequired[ResponseMode]
+    embedding_format: NotRequired[EmbeddingFormat]
@@ -0,0 +1,203 @@
+import collections
+import hashlib
+import json
+import threading
+import time
+import typing
+from urllib.parse import urlsplit
+
+import httpx
+
+from .coalescing import coalescing_key
+
+# Seconds a response stays fresh, by endpoint path. Sources and aggregation
+# counts change slowly; headlines and breaking news are refreshed often.
+DEFAULT_ENDPOINT_TTLS: typing.Dict[str, float] = {
+    "api/sources": 3600.0,
+    "api/aggregation_count": 300.0,
+    "api/authors": 300.0,
+    "api/search": 300.0,
+    "api/search_by_link": 300.0,
+    "api/subscription": 60.0,
+    "api/latest_headlines": 60.0,
+    "api/breaking_news": 60.0,
+}
+
+# Describe the encoded body and do not apply to the decoded body that is stored
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def request_cache_key(
+    method: str,
+    url: str,
+    params: typing.Sequence[typing.Tuple[str, typing.Any]],
+    json_body: typing.Any,
+    headers: typing.Mapping[str, typing.Any],
+) -> typing.Optional[str]:
+    """
+    Hash the canonical form of a request into a cache key, or None if it must not be cached.
+
+    ``params`` and ``json_body`` are the values after ``encode_query`` and
+    ``jsonable_encoder``. Headers are part of the key, so responses are never
+    shared between API keys, and only their hash is kept.
+    """
+    key = coalescing_key(method, url, params, json_body, headers)
+    if key is None:
+        return None
+    return hashlib.sha256(json.dumps(key).encode()).hexdigest()
+
+
+class CachedResponse(typing.NamedTuple):
+    """The parts of a response needed to rebuild it."""
+
+    expires_at: float
+    status_code: int
+    headers: typing.List[typing.Tuple[str, str]]
+    content: bytes
+    method: str
+    url: str
+
+    @classmethod
+    def from_response(cls, response: httpx.Response, expires_at: float) -> "CachedResponse":
+        headers = [(key, value) for key, value in response.headers.items() if key.lower() not in _DROPPED_HEADERS]
+        return cls(
+            expires_at=expires_at,
+            status_code=response.status_code,
+            headers=headers,
+            content=response.content,
+            method=response.request.method,
+            url=str(response.request.url),
+        )
+
+    def to_response(self) -> httpx.Response:
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request(self.method, self.url),
+        )
+
+
+class ResponseCache:
+    """
+    In-memory response cache with per-endpoint TTLs and LRU eviction.
+
+    Only successful responses are stored. ``endpoint_ttls`` maps an endpoint path
+    such as ``"api/sources"`` to the seconds its responses stay fresh; endpoints
+    not listed use ``ttl``, and a TTL of 0 disables caching for an endpoint.
+    Once ``max_entries`` responses are held, the least recently used is evicted.
+
+    Safe to share between threads and between clients.
+
+    Parameters
+    ----------
+    max_entries : int
+        Maximum number of responses held.
+
+    ttl : float
+        Seconds a response stays fresh when its endpoint has no entry in ``endpoint_ttls``.
+
+    endpoint_ttls : typing.Optional[typing.Dict[str, float]]
+        TTLs by endpoint path. Defaults to ``DEFAULT_ENDPOINT_TTLS``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 60.0,
+        endpoint_ttls: typing.Optional[typing.Dict[str, float]] = None,
+        clock: typing.Callable[[], float] = time.time,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.endpoint_ttls = dict(DEFAULT_ENDPOINT_TTLS if endpoint_ttls is None else endpoint_ttls)
+        # Longest path first, so "api/search_by_link" wins over "api/search"
+        self._endpoints = sorted(self.endpoint_ttls, key=len, reverse=True)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "collections.OrderedDict[str, CachedResponse]" = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for(self, url: str) -> float:
+        """Seconds a response from ``url`` stays fresh."""
+        path = urlsplit(url).path.rstrip("/")
+        for endpoint in self._endpoints:
+            endpoint_path = "/" + endpoint.strip("/")
+            if path == endpoint_path or path.endswith(endpoint_path):
+                return self.endpoint_ttls[endpoint]
+        return self.ttl
+
+    def get(self, key: str) -> typing.Optional[httpx.Response]:
+        """Return a fresh cached response for ``key``, counting a hit or a miss."""
+        entry = self._load(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return entry.to_response()
+
+    def set(self, key: str, response: httpx.Response) -> None:
+        """Store a successful response for the TTL of its endpoint."""
+        if response.status_code != 200:
+            return
+        ttl = self.ttl_for(str(response.request.url))
+        if ttl <= 0:
+            return
+        self._save(key, CachedResponse.from_response(response, self._clock() + ttl))
+
+    def fetch(self, key: str, send: typing.Callable[[], httpx.Response]) -> httpx.Response:
+        """Return the cached response for ``key``, or send the request and cache its response."""
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        response = send()
+        self.set(key, response)
+        return response
+
+    async def fetch_async(
+        self, key: str, send: typing.Callable[[], typing.Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        response = await send()
+        self.set(key, response)
+        return response
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        """Drop every cached response and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self, key: str) -> typing.Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _save(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
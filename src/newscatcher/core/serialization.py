@@ -124,142 +124,142 @@ def convert_and_respect_annotation_metadata(
 
     if object_ is None:
         return None
-    if inner_type is None:
-        inner_type = annotation
-        # The only thing this function ever rewrites is keys that carry a FieldMetadata
-        # alias. If nothing in the (cached) type graph has such an alias, the conversion is
-        # a content-identity transform, so we can skip the entire recursive walk. This is
-        # the hot path for SSE streaming, where a large discriminated union would otherwise
-        # be traversed on every single event.
-        if not _requires_conversion(annotation):
-            return object_
+    return _get_converter(annotation if inner_type is None else inner_type, direction)(object_)
 
-    clean_type = _remove_annotations(inner_type)
-    # Pydantic models
-    if (
-        inspect.isclass(clean_type)
-        and issubclass(clean_type, pydantic.BaseModel)
-        and isinstance(object_, typing.Mapping)
-    ):
-        return _convert_mapping(object_, clean_type, direction)
-    # TypedDicts
-    if typing_extensions.is_typeddict(clean_type) and isinstance(object_, typing.Mapping):
-        return _convert_mapping(object_, clean_type, direction)
-
-    if (
-        typing_extensions.get_origin(clean_type) == typing.Dict
-        or typing_extensions.get_origin(clean_type) == dict
-        or clean_type == typing.Dict
-    ) and isinstance(object_, typing.Dict):
-        key_type = typing_extensions.get_args(clean_type)[0]
-        value_type = typing_extensions.get_args(clean_type)[1]
-
-        return {
-            key: convert_and_respect_annotation_metadata(
-                object_=value,
-                annotation=annotation,
-                inner_type=value_type,
-                direction=direction,
-            )
-            for key, value in object_.items()
-        }
-
-    # If you're iterating on a string, do not bother to coerce it to a sequence.
-    if not isinstance(object_, str):
-        if (
-            typing_extensions.get_origin(clean_type) == typing.Set
-            or typing_extensions.get_origin(clean_type) == set
-            or clean_type == typing.Set
-        ) and isinstance(object_, typing.Set):
-            inner_type = typing_extensions.get_args(clean_type)[0]
-            return {
-                convert_and_respect_annotation_metadata(
-                    object_=item,
-                    annotation=annotation,
-                    inner_type=inner_type,
-                    direction=direction,
-                )
-                for item in object_
-            }
-        elif (
-            (
-                typing_extensions.get_origin(clean_type) == typing.List
-                or typing_extensions.get_origin(clean_type) == list
-                or clean_type == typing.List
-            )
-            and isinstance(object_, typing.List)
-        ) or (
-            (
-                typing_extensions.get_origin(clean_type) == typing.Sequence
-                or typing_extensions.get_origin(clean_type) == collections.abc.Sequence
-                or clean_type == typing.Sequence
-            )
-            and isinstance(object_, typing.Sequence)
-        ):
-            inner_type = typing_extensions.get_args(clean_type)[0]
-            return [
-                convert_and_respect_annotation_metadata(
-                    object_=item,
-                    annotation=annotation,
-                    inner_type=inner_type,
-                    direction=direction,
-                )
-                for item in object_
-            ]
-
-    if typing_extensions.get_origin(clean_type) == typing.Union:
-        # We should be able to ~relatively~ safely try to convert keys against all
-        # member types in the union, the edge case here is if one member aliases a field
-        # of the same name to a different name from another member
-        # Or if another member aliases a field of the same name that another member does not.
-        for member in typing_extensions.get_args(clean_type):
-            object_ = convert_and_respect_annotation_metadata(
-                object_=object_,
-                annotation=annotation,
-                inner_type=member,
-                direction=direction,
-            )
-        return object_
-
-    annotated_type = _get_annotation(annotation)
-    if annotated_type is None:
-        return object_
-
-    # If the object is not a TypedDict, a Union, or other container (list, set, sequence, etc.)
-    # Then we can safely call it on the recursive conversion.
+
+# convert_and_respect_annotation_metadata runs on every request and response body, and walking the
+# annotations of a large response type for every object dominated its cost. Instead, each
+# (annotation, direction) pair is compiled once into a converter closure that only does the work the
+# type needs: subtrees without FieldMetadata aliases compile to the identity function and are skipped.
+_Converter = typing.Callable[[typing.Any], typing.Any]
+_converter_cache: typing.Dict[typing.Tuple[typing.Any, str], _Converter] = {}
+
+
+def _identity(object_: typing.Any) -> typing.Any:
     return object_
 
 
-def _convert_mapping(
-    object_: typing.Mapping[str, object],
-    expected_type: typing.Any,
-    direction: typing.Literal["read", "write"],
-) -> typing.Mapping[str, object]:
-    converted_object: typing.Dict[str, object] = {}
+def _get_converter(type_: typing.Any, direction: typing.Literal["read", "write"]) -> _Converter:
+    try:
+        converter = _converter_cache.get((type_, direction))
+    except TypeError:
+        # Unhashable annotation; compile without caching.
+        return _compile_converter(type_, direction)
+    if converter is None:
+        converter = _compile_converter(type_, direction)
+        _converter_cache[(type_, direction)] = converter
+    return converter
+
+
+def _compile_converter(type_: typing.Any, direction: typing.Literal["read", "write"]) -> _Converter:
+    if not _requires_conversion(type_):
+        return _identity
+
+    clean_type = _remove_annotations(type_)
+    if (inspect.isclass(clean_type) and issubclass(clean_type, pydantic.BaseModel)) or typing_extensions.is_typeddict(
+        clean_type
+    ):
+        return _compile_mapping_converter(type_, clean_type, direction)
+
+    origin = typing_extensions.get_origin(clean_type)
+    args = typing_extensions.get_args(clean_type)
+    if origin is typing.Union:
+        member_converters = [_get_converter(member, direction) for member in args]
+        member_converters = [converter for converter in member_converters if converter is not _identity]
+
+        # Keys are converted against every member in turn. The edge case here is if one member
+        # aliases a field of the same name to a different name from another member.
+        def convert_union(object_: typing.Any) -> typing.Any:
+            for convert_member in member_converters:
+                object_ = convert_member(object_)
+            return object_
+
+        return convert_union
+
+    if not args:
+        return _identity
+    if origin is dict:
+        convert_value = _get_converter(args[1], direction)
+
+        def convert_dict(object_: typing.Any) -> typing.Any:
+            if not isinstance(object_, dict):
+                return object_
+            return {key: None if value is None else convert_value(value) for key, value in object_.items()}
+
+        return convert_dict
+
+    convert_item = _get_converter(args[0], direction)
+    if origin is set:
+
+        def convert_set(object_: typing.Any) -> typing.Any:
+            if not isinstance(object_, collections.abc.Set):
+                return object_
+            return {None if item is None else convert_item(item) for item in object_}
+
+        return convert_set
+
+    if origin is list or origin is collections.abc.Sequence:
+        sequence_type = list if origin is list else collections.abc.Sequence
+
+        def convert_sequence(object_: typing.Any) -> typing.Any:
+            # If you're iterating on a string, do not bother to coerce it to a sequence.
+            if not isinstance(object_, sequence_type) or isinstance(object_, str):
+                return object_
+            return [None if item is None else convert_item(item) for item in object_]
+
+        return convert_sequence
+
+    return _identity
+
+
+def _compile_mapping_converter(
+    type_: typing.Any, expected_type: typing.Any, direction: typing.Literal["read", "write"]
+) -> _Converter:
+    # Only keys that are renamed or whose values need converting are visited; the rest are copied as is.
+    # key in the object -> (key in the converted object, converter for its value)
+    fields: typing.Dict[str, typing.Tuple[str, _Converter]] = {}
+    renamed: typing.Set[str] = set()
+
+    def convert_mapping(object_: typing.Any) -> typing.Any:
+        if not isinstance(object_, typing.Mapping):
+            return object_
+        if not renamed.intersection(object_):
+            converted_object = dict(object_)
+            for key, (_, convert_value) in fields.items():
+                value = converted_object.get(key)
+                if value is not None:
+                    converted_object[key] = convert_value(value)
+            return converted_object
+        converted_object = {}
+        for key, value in object_.items():
+            field = fields.get(key)
+            if field is None:
+                converted_object[key] = value
+            else:
+                converted_key, convert_value = field
+                converted_object[converted_key] = None if value is None else convert_value(value)
+        return converted_object
+
+    # Register before compiling the fields so that self-referencing types resolve to this converter
+    try:
+        _converter_cache[(type_, direction)] = convert_mapping
+    except TypeError:
+        pass
+
     annotations = _get_cached_type_hints(expected_type)
-    aliases_to_field_names = _get_alias_to_field_name(annotations)
-    for key, value in object_.items():
-        if direction == "read" and key in aliases_to_field_names:
-            dealiased_key = aliases_to_field_names.get(key)
-            if dealiased_key is not None:
-                type_ = annotations.get(dealiased_key)
-        else:
-            type_ = annotations.get(key)
-        # Note you can't get the annotation by the field name if you're in read mode, so you must check the aliases map
-        #
-        # So this is effectively saying if we're in write mode, and we don't have a type, or if we're in read mode and we don't have an alias
-        # then we can just pass the value through as is
-        if type_ is None:
-            converted_object[key] = value
-        elif direction == "read" and key not in aliases_to_field_names:
-            converted_object[key] = convert_and_respect_annotation_metadata(
-                object_=value, annotation=type_, direction=direction
-            )
-        else:
-            converted_object[_alias_key(key, type_, direction, aliases_to_field_names)] = (
-                convert_and_respect_annotation_metadata(object_=value, annotation=type_, direction=direction)
-            )
-    return converted_object
+    for field_name, hint in annotations.items():
+        alias = _get_alias_from_type(hint)
+        convert_value = _get_converter(hint, direction)
+        keys = {field_name: alias or field_name} if direction == "write" else {field_name: field_name}
+        if direction == "read" and alias is not None:
+            # Aliased keys are read by their alias; field names are still accepted as they are
+            keys[alias] = field_name
+        for key, converted_key in keys.items():
+            if converted_key != key:
+                renamed.add(key)
+            if converted_key != key or convert_value is not _identity:
+                fields[key] = (converted_key, convert_value)
+    return convert_mapping
 
 
 def _get_annotation(type_: typing.Any) -> typing.Optional[typing.Any]:
@@ -334,14 +334,3 @@ def _get_alias_from_type(type_: typing.Any) -> typing.Optional[str]:
             if isinstance(annotation, FieldMetadata) and annotation.alias is not None:
                 return annotation.alias
     return None
-
-
-def _alias_key(
-    key: str,
-    type_: typing.Any,
-    direction: typing.Literal["read", "write"],
-    aliases_to_field_names: typing.Dict[str, str],
-) -> str:
-    if direction == "read":
-        return aliases_to_field_names.get(key, key)
-    return _get_alias_from_type(type_=type_) or key
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import typing
+
+import httpx
+
+# httpx's own pool limits, used when only a stream limit is configured
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+class _ReleasingByteStream(httpx.SyncByteStream):
+    """Response body that frees its stream slot once the body is closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, release: typing.Callable[[], None]):
+        self._stream = stream
+        self._release: typing.Optional[typing.Callable[[], None]] = release
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class _AsyncReleasingByteStream(httpx.AsyncByteStream):
+    """Async response body that frees its stream slot once the body is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: typing.Callable[[], None]):
+        self._stream = stream
+        self._release: typing.Optional[typing.Callable[[], None]] = release
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class StreamLimitedTransport(httpx.BaseTransport):
+    """
+    Transport that bounds the number of requests open at once.
+
+    With HTTP/2 every request is a stream multiplexed over the pooled connections.
+    The limit holds a request until a stream slot is free, from the moment it is
+    sent until its response body is closed, so a large harvest cannot open more
+    streams than the server is known to handle well.
+
+    Args:
+        transport: Transport that sends the requests
+        max_concurrent_streams: Maximum number of requests open at once
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, max_concurrent_streams: int):
+        if max_concurrent_streams < 1:
+            raise ValueError("max_concurrent_streams must be at least 1")
+        self.transport = transport
+        self.max_concurrent_streams = max_concurrent_streams
+        self._slots = threading.BoundedSemaphore(max_concurrent_streams)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._slots.acquire()
+        try:
+            response = self.transport.handle_request(request)
+        except BaseException:
+            self._slots.release()
+            raise
+        if response.is_closed:
+            # Body already read in full, as for responses built from bytes
+            self._slots.release()
+            return response
+        response.stream = _ReleasingByteStream(typing.cast(httpx.SyncByteStream, response.stream), self._slots.release)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncStreamLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Async counterpart of ``StreamLimitedTransport``.
+
+    Args:
+        transport: Transport that sends the requests
+        max_concurrent_streams: Maximum number of requests open at once
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_concurrent_streams: int):
+        if max_concurrent_streams < 1:
+            raise ValueError("max_concurrent_streams must be at least 1")
+        self.transport = transport
+        self.max_concurrent_streams = max_concurrent_streams
+        self._slots = asyncio.BoundedSemaphore(max_concurrent_streams)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self._slots.acquire()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            self._slots.release()
+            raise
+        if response.is_closed:
+            # Body already read in full, as for responses built from bytes
+            self._slots.release()
+            return response
+        response.stream = _AsyncReleasingByteStream(
+            typing.cast(httpx.AsyncByteStream, response.stream), self._slots.release
+        )
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
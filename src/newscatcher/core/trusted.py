@@ -0,0 +1,208 @@
+import datetime as dt
+import json
+import typing
+
+import pydantic
+import typing_extensions
+
+from .parsing import parse_json_as
+from .pydantic_utilities import IS_PYDANTIC_V2, parse_date, parse_datetime
+from .serialization import _get_alias_from_type, _get_cached_type_hints, _remove_annotations
+
+T = typing.TypeVar("T")
+
+# Builds the value of an annotation from its JSON form without validating it
+_Builder = typing.Callable[[typing.Any], typing.Any]
+_builder_cache: typing.Dict[typing.Any, _Builder] = {}
+
+
+def _identity(object_: typing.Any) -> typing.Any:
+    return object_
+
+
+def construct_obj_as(type_: typing.Type[T], object_: typing.Any) -> T:
+    """
+    Build ``type_`` from JSON data without validating it, as ``model_construct`` does, but recursively.
+
+    Nested models, lists and dicts of models and date-times are built too, as are values declared with a
+    ``PlainValidator``, such as embedding arrays, which it converts; other values are used as received.
+    Data that does not match the type is not detected, so this is only for trusted input.
+    """
+    return typing.cast(T, _get_builder(type_)(object_))
+
+
+def parse_trusted_json_as(type_: typing.Type[T], content: bytes) -> T:
+    """
+    Parse a JSON response body into ``type_`` without validating it; see ``construct_obj_as``.
+
+    Requires Pydantic v2; on v1 the body is validated in full.
+    """
+    if not IS_PYDANTIC_V2:
+        return parse_json_as(type_, content)
+    return construct_obj_as(type_, json.loads(content))
+
+
+def _get_builder(type_: typing.Any) -> _Builder:
+    try:
+        builder = _builder_cache.get(type_)
+    except TypeError:
+        # Unhashable annotation; compile without caching.
+        return _compile_builder(type_)
+    if builder is None:
+        builder = _compile_builder(type_)
+        _builder_cache[type_] = builder
+    return builder
+
+
+def _compile_builder(type_: typing.Any) -> _Builder:
+    for metadata in getattr(type_, "__metadata__", ()):
+        if IS_PYDANTIC_V2 and isinstance(metadata, pydantic.PlainValidator):  # type: ignore[attr-defined]
+            return typing.cast(_Builder, metadata.func)
+    clean_type = _remove_annotations(type_)
+    if isinstance(clean_type, type):
+        if issubclass(clean_type, pydantic.BaseModel) and not getattr(clean_type, "__pydantic_root_model__", False):
+            return _compile_model_builder(type_, clean_type)
+        if issubclass(clean_type, dt.datetime):
+            return lambda object_: parse_datetime(object_) if isinstance(object_, (str, int, float)) else object_
+        if issubclass(clean_type, dt.date):
+            return lambda object_: parse_date(object_) if isinstance(object_, str) else object_
+        return _identity
+
+    origin = typing_extensions.get_origin(clean_type)
+    args = typing_extensions.get_args(clean_type)
+    if origin is typing.Union:
+        return _compile_union_builder([arg for arg in args if arg is not type(None)])
+    if origin is list and args:
+        build_item = _get_builder(args[0])
+        if build_item is _identity:
+            return _identity
+        return lambda object_: (
+            [None if item is None else build_item(item) for item in object_] if isinstance(object_, list) else object_
+        )
+    if origin is dict and len(args) == 2:
+        build_value = _get_builder(args[1])
+        if build_value is _identity:
+            return _identity
+        return lambda object_: (
+            {key: None if value is None else build_value(value) for key, value in object_.items()}
+            if isinstance(object_, dict)
+            else object_
+        )
+    return _identity
+
+
+def _compile_union_builder(members: typing.List[typing.Any]) -> _Builder:
+    if len(members) == 1:
+        return _get_builder(members[0])
+    models = [_remove_annotations(member) for member in members]
+    models = [model for model in models if isinstance(model, type) and issubclass(model, pydantic.BaseModel)]
+    lists = [member for member in members if typing_extensions.get_origin(_remove_annotations(member)) is list]
+    build_list = _get_builder(lists[0]) if len(lists) == 1 else _identity
+    if not models and build_list is _identity:
+        return _identity
+
+    def build_union(object_: typing.Any) -> typing.Any:
+        if isinstance(object_, dict) and models:
+            return _get_builder(_best_model(models, object_))(object_)
+        if isinstance(object_, list):
+            return build_list(object_)
+        return object_
+
+    return build_union
+
+
+def _best_model(
+    models: typing.List[typing.Type[pydantic.BaseModel]], object_: typing.Dict[str, typing.Any]
+) -> typing.Type[pydantic.BaseModel]:
+    # Without validation, pick the member whose required fields are all present and that knows the most keys
+    def score(model: typing.Type[pydantic.BaseModel]) -> typing.Tuple[bool, int]:
+        fields = _model_fields(model)
+        required = all(
+            field.alias in object_ or name in object_ for name, field in fields.items() if field.info.is_required()
+        )
+        return required, sum(key in fields or key in _model_keys(model) for key in object_)
+
+    return max(models, key=score)
+
+
+class _Field:
+    def __init__(self, name: str, alias: str, info: typing.Any) -> None:
+        self.name = name
+        # Key of the field in the JSON object
+        self.alias = alias
+        self.info = info
+
+
+_model_fields_cache: typing.Dict[typing.Any, typing.Dict[str, _Field]] = {}
+
+
+def _model_fields(model_type: typing.Type[pydantic.BaseModel]) -> typing.Dict[str, _Field]:
+    fields = _model_fields_cache.get(model_type)
+    if fields is None:
+        hints = _get_cached_type_hints(model_type)
+        fields = {}
+        for name, info in model_type.model_fields.items():  # type: ignore[attr-defined]
+            alias = info.alias or _get_alias_from_type(hints.get(name)) or name
+            fields[name] = _Field(name, alias, info)
+        _model_fields_cache[model_type] = fields
+    return fields
+
+
+def _model_keys(model_type: typing.Type[pydantic.BaseModel]) -> typing.FrozenSet[str]:
+    return frozenset(field.alias for field in _model_fields(model_type).values())
+
+
+def _compile_model_builder(type_: typing.Any, model_type: typing.Type[pydantic.BaseModel]) -> _Builder:
+    # JSON key -> (field name, builder for its value)
+    keys: typing.Dict[str, typing.Tuple[str, _Builder]] = {}
+    defaults: typing.Dict[str, typing.Any] = {}
+    default_factories: typing.Dict[str, typing.Callable[[], typing.Any]] = {}
+    keep_extra = model_type.model_config.get("extra") == "allow"  # type: ignore[attr-defined]
+    has_post_init = model_type.__pydantic_post_init__ is not None  # type: ignore[attr-defined]
+    new = object.__new__
+    setattr_ = object.__setattr__
+
+    def build_model(object_: typing.Any) -> typing.Any:
+        if not isinstance(object_, dict):
+            return object_
+        values: typing.Dict[str, typing.Any] = {}
+        extra: typing.Dict[str, typing.Any] = {}
+        for key, value in object_.items():
+            field = keys.get(key)
+            if field is None:
+                extra[key] = value
+            else:
+                name, build = field
+                values[name] = value if value is None else build(value)
+        fields_set = set(values)
+        # Same instance state as BaseModel.model_construct, without walking every field in Python
+        field_values = {**defaults, **values}
+        for name, factory in default_factories.items():
+            if name not in field_values:
+                field_values[name] = factory()
+        model = new(model_type)
+        setattr_(model, "__dict__", field_values)
+        setattr_(model, "__pydantic_fields_set__", fields_set)
+        setattr_(model, "__pydantic_extra__", extra if keep_extra else None)
+        if has_post_init:
+            model.model_post_init(None)
+        else:
+            setattr_(model, "__pydantic_private__", None)
+        return model
+
+    # Register before compiling the fields so that self-referencing models resolve to this builder
+    try:
+        _builder_cache[type_] = build_model
+    except TypeError:
+        pass
+
+    hints = _get_cached_type_hints(model_type)
+    for name, field in _model_fields(model_type).items():
+        build = _get_builder(hints.get(name, field.info.annotation))
+        keys[name] = (name, build)
+        keys[field.alias] = (name, build)
+        if field.info.default_factory is not None:
+            default_factories[name] = field.info.default_factory
+        elif not field.info.is_required():
+            defaults[name] = field.info.default
+    return build_model
@@ -0,0 +1,398 @@
+"""
+Deduplication backends for bulk harvests.
+
+``get_all_articles`` and ``get_all_headlines`` track the ids of articles
+they have already returned. By default the ids are kept in a Python
+``set``, which costs roughly 100 bytes per id. For harvests of tens of
+millions of articles, pass one of the compact backends below as
+``deduplicate=`` instead:
+
+- ``HashedIdDeduplicator`` keeps a 64-bit hash of each id in a flat
+  array, about 16 bytes per id, with a negligible collision rate.
+- ``BloomDeduplicator`` keeps a Bloom filter sized for a fixed capacity
+  and false-positive rate, about 1.8 bytes per id at 0.1%. A false
+  positive drops an article that was not actually seen.
+
+Every backend reports its size through ``stats()``.
+
+``NearDuplicateDetector`` goes further and catches syndicated copies of a
+story published under different ids, using MinHash signatures over the
+title and content and an LSH index, so each article is compared only with
+the few stories it shares a band with.
+"""
+
+import abc
+import math
+import random
+import re
+import sys
+import zlib
+from array import array
+from hashlib import blake2b
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+
+class DedupStats(NamedTuple):
+    """Memory usage of a deduplication backend."""
+
+    items: int
+    memory_bytes: int
+    false_positive_rate: float
+
+    @property
+    def bytes_per_item(self) -> float:
+        return self.memory_bytes / self.items if self.items else 0.0
+
+
+def _id_digest(article_id: str, digest_size: int) -> int:
+    """Return a stable integer hash of an article id."""
+    return int.from_bytes(
+        blake2b(article_id.encode("utf-8"), digest_size=digest_size).digest(), "little"
+    )
+
+
+class Deduplicator(abc.ABC):
+    """
+    Base class for seen-id containers accepted by ``deduplicate=``.
+
+    Subclasses implement ``add``, ``__contains__``, ``__len__`` and
+    ``stats``, which is the subset of the ``set`` interface the harvest
+    uses. A subclass missing one of them cannot be instantiated.
+    """
+
+    @abc.abstractmethod
+    def add(self, article_id: str) -> None: ...
+
+    @abc.abstractmethod
+    def __contains__(self, article_id: object) -> bool: ...
+
+    @abc.abstractmethod
+    def __len__(self) -> int: ...
+
+    @abc.abstractmethod
+    def stats(self) -> DedupStats: ...
+
+
+class ExactDeduplicator(Deduplicator):
+    """Exact deduplication backed by a Python set. This is the default behavior."""
+
+    def __init__(self) -> None:
+        self._ids: Set[str] = set()
+
+    def add(self, article_id: str) -> None:
+        self._ids.add(article_id)
+
+    def __contains__(self, article_id: object) -> bool:
+        return article_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def stats(self) -> DedupStats:
+        """Return memory usage. This walks every stored id, so it is O(n)."""
+        memory = sys.getsizeof(self._ids) + sum(sys.getsizeof(i) for i in self._ids)
+        return DedupStats(len(self._ids), memory, 0.0)
+
+
+class HashedIdDeduplicator(Deduplicator):
+    """
+    Deduplicate by 64-bit id hashes stored in an open-addressing array.
+
+    The table doubles when it is half full, so memory stays between 16 and
+    32 bytes per id. Two different ids collide with probability about
+    ``n**2 / 2**65``, which is under 0.03% for 100 million ids.
+
+    Args:
+        initial_capacity: Number of ids to allocate room for up front
+    """
+
+    def __init__(self, initial_capacity: int = 1024):
+        size = 1
+        while size < max(2, initial_capacity * 2):
+            size *= 2
+        self._slots = array("Q", bytes(8 * size))
+        self._mask = size - 1
+        self._count = 0
+
+    @staticmethod
+    def _fingerprint(article_id: str) -> int:
+        # Zero marks an empty slot
+        return _id_digest(article_id, 8) or 1
+
+    def _find(self, fingerprint: int) -> int:
+        slots, mask = self._slots, self._mask
+        index = fingerprint & mask
+        while slots[index] and slots[index] != fingerprint:
+            index = (index + 1) & mask
+        return index
+
+    def _grow(self) -> None:
+        old_slots = self._slots
+        self._slots = array("Q", bytes(16 * len(old_slots)))
+        self._mask = len(self._slots) - 1
+        for fingerprint in old_slots:
+            if fingerprint:
+                self._slots[self._find(fingerprint)] = fingerprint
+
+    def add(self, article_id: str) -> None:
+        fingerprint = self._fingerprint(article_id)
+        index = self._find(fingerprint)
+        if self._slots[index]:
+            return
+        self._slots[index] = fingerprint
+        self._count += 1
+        if self._count * 2 > len(self._slots):
+            self._grow()
+
+    def __contains__(self, article_id: object) -> bool:
+        if not isinstance(article_id, str):
+            return False
+        fingerprint = self._fingerprint(article_id)
+        return self._slots[self._find(fingerprint)] == fingerprint
+
+    def __len__(self) -> int:
+        return self._count
+
+    def stats(self) -> DedupStats:
+        rate = self._count / 2**64
+        return DedupStats(self._count, sys.getsizeof(self._slots), rate)
+
+
+class BloomDeduplicator(Deduplicator):
+    """
+    Deduplicate with a fixed-size Bloom filter.
+
+    The filter is sized up front for ``capacity`` ids at the requested
+    ``false_positive_rate``. Adding more ids than ``capacity`` keeps working,
+    but the false-positive rate rises; ``stats()`` reports the current
+    estimate. A false positive causes an unseen article to be skipped, so
+    pick a rate your use case can tolerate.
+
+    Args:
+        capacity: Expected number of distinct ids
+        false_positive_rate: Target false-positive rate at ``capacity`` ids
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.001):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.target_false_positive_rate = false_positive_rate
+        self._num_bits = max(
+            8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        )
+        self._num_hashes = max(1, round(self._num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self._num_bits + 7) // 8)
+        self._count = 0
+
+    def _positions(self, article_id: str):
+        digest = _id_digest(article_id, 16)
+        # Kirsch-Mitzenmacher double hashing
+        h1, h2 = digest & 0xFFFFFFFFFFFFFFFF, (digest >> 64) | 1
+        return [(h1 + i * h2) % self._num_bits for i in range(self._num_hashes)]
+
+    def add(self, article_id: str) -> None:
+        added = False
+        for position in self._positions(article_id):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not self._bits[byte] & mask:
+                self._bits[byte] |= mask
+                added = True
+        if added:
+            self._count += 1
+
+    def __contains__(self, article_id: object) -> bool:
+        if not isinstance(article_id, str):
+            return False
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(article_id)
+        )
+
+    def __len__(self) -> int:
+        """Approximate number of distinct ids added."""
+        return self._count
+
+    def stats(self) -> DedupStats:
+        rate = (
+            1 - math.exp(-self._num_hashes * self._count / self._num_bits)
+        ) ** self._num_hashes
+        return DedupStats(self._count, sys.getsizeof(self._bits), rate)
+
+
+# Marker for a MinHash bin that no shingle hashed into
+_EMPTY_BIN = 1 << 64
+# Added per step when an empty bin borrows a neighbour's value
+_DENSIFY_OFFSET = 0x9E3779B1
+_WORD_RE = re.compile(r"\w+")
+
+
+def _lsh_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Pick (bands, rows) with bands * rows == num_perm for a similarity threshold.
+
+    Two signatures with Jaccard similarity ``s`` share at least one band
+    with probability ``1 - (1 - s**rows)**bands``. That curve is steepest
+    near ``(1 / bands) ** (1 / rows)``, so the divisor pair that puts this
+    point closest to ``threshold`` is chosen.
+    """
+    pairs = [
+        (num_perm // rows, rows)
+        for rows in range(1, num_perm + 1)
+        if num_perm % rows == 0
+    ]
+    return min(pairs, key=lambda pair: abs((1 / pair[0]) ** (1 / pair[1]) - threshold))
+
+
+class NearDuplicateDetector:
+    """
+    Detect near-duplicate articles such as syndicated wire stories.
+
+    Each article's title and the start of its content are split into word
+    shingles and summarized as a MinHash signature. Signatures are split into
+    LSH bands, and only articles that share a band with an earlier story are
+    compared. A candidate is a duplicate when the estimated Jaccard
+    similarity of the two signatures reaches ``threshold``. Cost per article
+    is constant, so the whole harvest stays linear in the number of articles.
+
+    Only the first article of each story is indexed. Memory therefore grows
+    with the number of distinct stories, roughly 1-2 KB each.
+
+    Pass an instance as ``near_duplicates=`` to ``get_all_articles`` or
+    ``get_all_headlines``. With ``action="drop"`` duplicates are removed from
+    the results. With ``action="tag"`` they are kept, and ``duplicates`` maps
+    each duplicate's id to the id of the first article of its story.
+
+    Args:
+        threshold: Jaccard similarity at or above which two articles are duplicates
+        num_perm: Number of MinHash bins; more is more precise but uses more memory
+        shingle_size: Number of consecutive words per shingle
+        max_chars: Number of content characters to use per article
+        action: "drop" to remove duplicates, or "tag" to keep and record them
+        seed: Seed for the MinHash permutations
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 64,
+        shingle_size: int = 3,
+        max_chars: int = 2000,
+        action: str = "drop",
+        seed: int = 1,
+    ):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be between 0 and 1")
+        if action not in ("drop", "tag"):
+            raise ValueError(f"Unsupported action: {action}. Use 'drop' or 'tag'.")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.max_chars = max_chars
+        self.action = action
+        self.bands, self.rows = _lsh_bands(threshold, num_perm)
+
+        rng = random.Random(seed)
+        self._seed = rng.getrandbits(32)
+        self._multiplier = rng.getrandbits(64) | 1
+        self._band_tables: List[Dict[int, int]] = [{} for _ in range(self.bands)]
+        self._signatures: List[array] = []
+        self._story_ids: List[Optional[str]] = []
+        self.duplicates: Dict[str, Optional[str]] = {}
+        self.articles_seen = 0
+
+    def _text(self, article: Any) -> str:
+        parts = []
+        for field in ("title", "content"):
+            value = getattr(article, field, None)
+            if isinstance(value, str):
+                parts.append(value)
+        return " ".join(parts)[: self.max_chars]
+
+    def signature(self, text: str) -> Optional[array]:
+        """
+        Return the MinHash signature of a text, or None if it has no words.
+
+        Uses one-permutation hashing: each shingle hash is assigned to one of
+        ``num_perm`` bins and each bin keeps its minimum, so the cost is one
+        hash per shingle rather than one per shingle and permutation. Empty
+        bins borrow the value of the next non-empty bin (rotation
+        densification) so that signatures stay comparable.
+        """
+        words = _WORD_RE.findall(text.lower())
+        if not words:
+            return None
+        size = min(self.shingle_size, len(words))
+        num_perm = self.num_perm
+        bins = [_EMPTY_BIN] * num_perm
+        for i in range(len(words) - size + 1):
+            shingle = " ".join(words[i : i + size]).encode("utf-8")
+            value = zlib.crc32(shingle, self._seed) << 32 | zlib.crc32(shingle)
+            value = (value * self._multiplier) & 0xFFFFFFFFFFFFFFFF
+            index, value = value % num_perm, value // num_perm
+            if value < bins[index]:
+                bins[index] = value
+
+        for index in range(num_perm):
+            if bins[index] == _EMPTY_BIN:
+                for distance in range(1, num_perm):
+                    donor = bins[(index + distance) % num_perm]
+                    if donor != _EMPTY_BIN and donor < _EMPTY_BIN - distance:
+                        bins[index] = donor + distance * _DENSIFY_OFFSET
+                        break
+        return array("I", (value & 0xFFFFFFFF for value in bins))
+
+    def _band_keys(self, signature: array) -> List[int]:
+        rows = self.rows
+        return [
+            hash(signature[band * rows : (band + 1) * rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def _find_story(self, signature: array, band_keys: List[int]) -> Optional[int]:
+        checked: Set[int] = set()
+        for table, key in zip(self._band_tables, band_keys):
+            story = table.get(key)
+            if story is None or story in checked:
+                continue
+            checked.add(story)
+            candidate = self._signatures[story]
+            matches = sum(x == y for x, y in zip(signature, candidate))
+            if matches >= self.threshold * self.num_perm:
+                return story
+        return None
+
+    def add(self, article: Any) -> bool:
+        """
+        Check an article against the stories seen so far and index it if new.
+
+        Returns:
+            True if the article should be kept, False if it should be dropped
+        """
+        self.articles_seen += 1
+        signature = self.signature(self._text(article))
+        if signature is None:
+            return True
+
+        band_keys = self._band_keys(signature)
+        story = self._find_story(signature, band_keys)
+        if story is not None:
+            article_id = getattr(article, "id", None)
+            if article_id:
+                self.duplicates[article_id] = self._story_ids[story]
+            return self.action == "tag"
+
+        story = len(self._signatures)
+        self._signatures.append(signature)
+        self._story_ids.append(getattr(article, "id", None))
+        for table, key in zip(self._band_tables, band_keys):
+            table.setdefault(key, story)
+        return True
+
+    def __len__(self) -> int:
+        """Number of distinct stories indexed."""
+        return len(self._signatures)
@@ -7,6 +7,7 @@ from ..core.api_error import ApiError
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
 from ..core.http_response import AsyncHttpResponse, HttpResponse
 from ..core.parse_error import ParsingError
+from ..core.parsing import parse_json_as
 from ..core.pydantic_utilities import parse_obj_as
 from ..core.request_options import RequestOptions
 from ..core.serialization import convert_and_respect_annotation_metadata
@@ -343,9 +344,10 @@ class RawLatestHeadlinesClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetLatestHeadlinesResponse,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=GetLatestHeadlinesResponse,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -676,9 +678,10 @@ class RawLatestHeadlinesClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     PostLatestHeadlinesResponse,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=PostLatestHeadlinesResponse,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -1041,9 +1044,10 @@ class AsyncRawLatestHeadlinesClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetLatestHeadlinesResponse,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=GetLatestHeadlinesResponse,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1374,9 +1378,10 @@ class AsyncRawLatestHeadlinesClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     PostLatestHeadlinesResponse,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=PostLatestHeadlinesResponse,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -7,6 +7,7 @@ from ..core.api_error import ApiError
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
 from ..core.http_response import AsyncHttpResponse, HttpResponse
 from ..core.parse_error import ParsingError
+from ..core.parsing import parse_json_as
 from ..core.pydantic_utilities import parse_obj_as
 from ..core.request_options import RequestOptions
 from ..core.serialization import convert_and_respect_annotation_metadata
@@ -99,9 +100,10 @@ class RawSearchByLinkClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     SearchResponseDto,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=SearchResponseDto,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -252,9 +254,10 @@ class RawSearchByLinkClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     SearchResponseDto,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=SearchResponseDto,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -412,9 +415,10 @@ class AsyncRawSearchByLinkClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     SearchResponseDto,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=SearchResponseDto,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -565,9 +569,10 @@ class AsyncRawSearchByLinkClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     SearchResponseDto,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=SearchResponseDto,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -7,6 +7,7 @@ from ..core.api_error import ApiError
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
 from ..core.http_response import AsyncHttpResponse, HttpResponse
 from ..core.parse_error import ParsingError
+from ..core.parsing import parse_json_as
 from ..core.pydantic_utilities import parse_obj_as
 from ..core.request_options import RequestOptions
 from ..errors.bad_request_error import BadRequestError
@@ -48,9 +49,10 @@ class RawSubscriptionClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     SubscriptionResponseDto,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=SubscriptionResponseDto,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -163,9 +165,10 @@ class RawSubscriptionClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     SubscriptionResponseDto,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=SubscriptionResponseDto,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -285,9 +288,10 @@ class AsyncRawSubscriptionClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     SubscriptionResponseDto,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=SubscriptionResponseDto,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -402,9 +406,10 @@ class AsyncRawSubscriptionClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     SubscriptionResponseDto,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=SubscriptionResponseDto,  # type: ignore
-                        object_=_response.json(),
+                        content=_response.content,
+                        **self._client_wrapper.httpx_client.parse_options(request_options),
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -6,12 +6,61 @@ progress tracking, and formatting that are used by the Newscatcher client.
 """
 
 import datetime
-from typing import List, Tuple, Union, Iterator, Optional, Dict, Any, Set, TypeVar, cast
+import math
+from typing import (
+    List,
+    Tuple,
+    Union,
+    Iterator,
+    Optional,
+    Dict,
+    Any,
+    Set,
+    TypeVar,
+    NamedTuple,
+    cast,
+)
 from dateutil.parser import parse as parse_date
 from dateutil.relativedelta import relativedelta
 
 T = TypeVar("T")
 
+# Width of each histogram bucket for the supported aggregation_by values
+AGGREGATION_BUCKET_DELTAS = {
+    "hour": datetime.timedelta(hours=1),
+    "day": datetime.timedelta(days=1),
+}
+
+
+def parse_time_chunk_size(time_chunk_size: str) -> datetime.timedelta:
+    """
+    Parse a chunk size such as "1d" or "12h" into a timedelta.
+
+    Raises:
+        ValueError: If the format is invalid
+    """
+    # Handle numeric values like "1d" or "12h"
+    if (
+        isinstance(time_chunk_size, str)
+        and len(time_chunk_size) >= 2
+        and time_chunk_size[-1].lower() in ["d", "h"]
+        and time_chunk_size[:-1].isdigit()
+    ):
+
+        chunk_value = int(time_chunk_size[:-1])
+        chunk_unit = time_chunk_size[-1].lower()
+
+        if chunk_unit == "d":
+            return datetime.timedelta(days=chunk_value)
+        if chunk_unit == "h":
+            return datetime.timedelta(hours=chunk_value)
+        raise ValueError(
+            f"Unsupported time chunk unit: {chunk_unit}. Use 'd' for days or 'h' for hours."
+        )
+    raise ValueError(
+        f"Invalid time_chunk_size format: {time_chunk_size}. Use format like '1d' or '12h'."
+    )
+
 
 def parse_time_parameters(
     endpoint_type: str, **kwargs
@@ -34,31 +83,7 @@ def parse_time_parameters(
     now = datetime.datetime.now(datetime.timezone.utc)
 
     # Parse chunk size first (common to both endpoints)
-    time_chunk_size = kwargs.get("time_chunk_size", "1h")  # Default to 1 hour chunks
-
-    # Handle numeric values like "1d" or "12h"
-    if (
-        isinstance(time_chunk_size, str)
-        and len(time_chunk_size) >= 2
-        and time_chunk_size[-1].lower() in ["d", "h"]
-        and time_chunk_size[:-1].isdigit()
-    ):
-
-        chunk_value = int(time_chunk_size[:-1])
-        chunk_unit = time_chunk_size[-1].lower()
-
-        if chunk_unit == "d":
-            chunk_delta = datetime.timedelta(days=chunk_value)
-        elif chunk_unit == "h":
-            chunk_delta = datetime.timedelta(hours=chunk_value)
-        else:
-            raise ValueError(
-                f"Unsupported time chunk unit: {chunk_unit}. Use 'd' for days or 'h' for hours."
-            )
-    else:
-        raise ValueError(
-            f"Invalid time_chunk_size format: {time_chunk_size}. Use format like '1d' or '12h'."
-        )
+    chunk_delta = parse_time_chunk_size(kwargs.get("time_chunk_size", "1h"))
 
     # Handle endpoint-specific parameters
     if endpoint_type == "search":
@@ -177,6 +202,223 @@ def create_time_chunks(
     return chunks
 
 
+def bisect_time_chunk(
+    chunk_start: datetime.datetime,
+    chunk_end: datetime.datetime,
+    min_chunk_delta: datetime.timedelta,
+) -> Optional[List[Tuple[datetime.datetime, datetime.datetime]]]:
+    """
+    Split a time chunk into two equal halves.
+
+    Args:
+        chunk_start: Start datetime of the chunk
+        chunk_end: End datetime of the chunk
+        min_chunk_delta: Smallest width either half may have
+
+    Returns:
+        Two (chunk_start, chunk_end) pairs, or None if the halves would be
+        narrower than min_chunk_delta
+    """
+    half = (chunk_end - chunk_start) / 2
+    if half < min_chunk_delta:
+        return None
+
+    midpoint = chunk_start + half
+    return [(chunk_start, midpoint), (midpoint, chunk_end)]
+
+
+class PlannedChunk(NamedTuple):
+    """A planned time chunk and the number of articles expected in it."""
+
+    start: datetime.datetime
+    end: datetime.datetime
+    expected_articles: int
+
+
+class HarvestPlan:
+    """
+    Chunk boundaries for a bulk harvest, planned from an article-count histogram.
+
+    Pass the plan to ``get_all_articles(plan=...)`` to fetch exactly these
+    chunks. Inspect ``estimated_requests`` first to see what the harvest
+    will cost.
+    """
+
+    def __init__(
+        self,
+        chunks: List[PlannedChunk],
+        from_date: datetime.datetime,
+        to_date: datetime.datetime,
+        page_size: int,
+        max_pages_per_chunk: int = 10,
+    ):
+        self.chunks = chunks
+        self.from_date = from_date
+        self.to_date = to_date
+        self.page_size = page_size
+        self.max_pages_per_chunk = max_pages_per_chunk
+
+    @property
+    def total_articles(self) -> int:
+        """Number of articles the histogram reported for the whole range."""
+        return sum(chunk.expected_articles for chunk in self.chunks)
+
+    @property
+    def estimated_requests(self) -> int:
+        """Number of search requests the planned harvest is expected to make."""
+        return sum(
+            min(
+                max(1, math.ceil(chunk.expected_articles / self.page_size)),
+                self.max_pages_per_chunk,
+            )
+            for chunk in self.chunks
+        )
+
+    def time_chunks(self) -> List[Tuple[datetime.datetime, datetime.datetime]]:
+        """Return the planned (chunk_start, chunk_end) pairs."""
+        return [(chunk.start, chunk.end) for chunk in self.chunks]
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def __iter__(self) -> Iterator[PlannedChunk]:
+        return iter(self.chunks)
+
+    def __repr__(self) -> str:
+        return (
+            f"HarvestPlan(chunks={len(self.chunks)}, total_articles={self.total_articles}, "
+            f"estimated_requests={self.estimated_requests})"
+        )
+
+
+class HarvestReport:
+    """
+    What a harvest left out, filled in by ``get_all_articles(report=...)``.
+
+    Chunks and pages whose requests fail are skipped so that the rest of
+    the harvest can go on; ``failed_units`` counts them. ``truncated`` is
+    set when ``max_articles`` or ``deadline`` stopped the harvest early.
+    """
+
+    def __init__(self) -> None:
+        self.failed_units = 0
+        self.truncated = False
+
+    @property
+    def complete(self) -> bool:
+        """Whether every chunk and page of the range was fetched and kept."""
+        return not self.failed_units and not self.truncated
+
+    def __repr__(self) -> str:
+        return f"HarvestReport(failed_units={self.failed_units}, truncated={self.truncated})"
+
+
+def extract_time_frame_counts(response) -> List[Tuple[datetime.datetime, int]]:
+    """
+    Extract (time_frame, article_count) pairs from an aggregation count response.
+
+    Args:
+        response: AggregationCountResponseDto, whose ``aggregations`` may be a
+                 single AggregationItem or a list of them
+
+    Returns:
+        List of (time_frame, article_count) pairs sorted by time_frame
+
+    Raises:
+        ValueError: If the response carries no aggregations
+    """
+    aggregations = getattr(response, "aggregations", None)
+    if aggregations is None:
+        raise ValueError(
+            f"Aggregation count request returned no aggregations (status: {getattr(response, 'status', None)})"
+        )
+
+    if not isinstance(aggregations, list):
+        aggregations = [aggregations]
+
+    counts = []
+    for item in aggregations:
+        for time_frame_count in getattr(item, "aggregation_count", None) or []:
+            counts.append((time_frame_count.time_frame, time_frame_count.article_count))
+
+    return sorted(counts, key=lambda count: count[0])
+
+
+def _align_timezone(value: datetime.datetime, reference: datetime.datetime) -> datetime.datetime:
+    """Give value the same timezone awareness as reference, assuming UTC for naive values."""
+    if reference.tzinfo is not None and value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+    if reference.tzinfo is None and value.tzinfo is not None:
+        return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def plan_time_chunks(
+    counts: List[Tuple[datetime.datetime, int]],
+    from_date: datetime.datetime,
+    to_date: datetime.datetime,
+    bucket_delta: datetime.timedelta,
+    capacity: int,
+) -> List[PlannedChunk]:
+    """
+    Pack histogram buckets into chunks that each hold at most ``capacity`` articles.
+
+    Consecutive buckets are merged greedily, so quiet periods become a single
+    wide chunk. A bucket that alone exceeds ``capacity`` is divided into equal
+    sub-windows, assuming articles are spread evenly within it. The returned
+    chunks are contiguous and cover ``from_date`` to ``to_date`` exactly.
+
+    Args:
+        counts: (time_frame, article_count) pairs sorted by time_frame
+        from_date: Start datetime of the harvest
+        to_date: End datetime of the harvest
+        bucket_delta: Width of each histogram bucket
+        capacity: Maximum number of articles per chunk
+
+    Returns:
+        List of PlannedChunk covering the whole range
+    """
+    capacity = max(1, capacity)
+    chunks: List[PlannedChunk] = []
+    chunk_start = from_date
+    chunk_count = 0
+
+    for time_frame, article_count in counts:
+        bucket_start = max(_align_timezone(time_frame, from_date), from_date)
+        bucket_end = min(_align_timezone(time_frame, from_date) + bucket_delta, to_date)
+        if bucket_start >= bucket_end or article_count <= 0:
+            continue
+
+        if chunk_count + article_count <= capacity:
+            chunk_count += article_count
+            continue
+
+        # Close the running chunk just before this bucket; an empty running
+        # chunk is a gap and is folded into the next one instead
+        if chunk_count > 0 and bucket_start > chunk_start:
+            chunks.append(PlannedChunk(chunk_start, bucket_start, chunk_count))
+            chunk_start = bucket_start
+            chunk_count = 0
+
+        if article_count <= capacity:
+            chunk_count = article_count
+            continue
+
+        # A single bucket too dense for one chunk: split it evenly
+        pieces = math.ceil(article_count / capacity)
+        width = (bucket_end - bucket_start) / pieces
+        for i in range(pieces):
+            piece_end = bucket_end if i == pieces - 1 else bucket_start + width * (i + 1)
+            piece_count = article_count * (i + 1) // pieces - article_count * i // pieces
+            chunks.append(PlannedChunk(chunk_start, piece_end, piece_count))
+            chunk_start = piece_end
+
+    if chunk_start < to_date or not chunks:
+        chunks.append(PlannedChunk(chunk_start, to_date, chunk_count))
+
+    return chunks
+
+
 def setup_progress_tracking(
     chunks: List[Tuple[datetime.datetime, datetime.datetime]],
     show_progress: bool,
@@ -256,6 +498,10 @@ def calculate_when_param(
     """
     Calculate the 'when' parameter for latest_headlines based on time difference.
 
+    ``when`` always ends at the current time, so the smallest value that
+    still reaches back to ``chunk_start`` is returned, rounded up to whole
+    hours.
+
     Args:
         to_date: Current time (usually now)
         chunk_start: The start time of the chunk
@@ -263,17 +509,42 @@ def calculate_when_param(
     Returns:
         A string like "3d" or "12h" representing the time difference
     """
-    time_diff = to_date - chunk_start
+    hours = max(1, math.ceil((to_date - chunk_start).total_seconds() / 3600))
 
-    # Convert to days or hours based on the size
-    if time_diff.total_seconds() >= 86400:  # 1 day in seconds
-        when_value = max(1, time_diff.days)
-        when_param = f"{when_value}d"
-    else:
-        when_value = max(1, int(time_diff.total_seconds() / 3600))  # hours
-        when_param = f"{when_value}h"
+    # Use days when the span is a whole number of days
+    if hours % 24 == 0:
+        return f"{hours // 24}d"
+    return f"{hours}h"
 
-    return when_param
+
+def filter_articles_to_window(
+    articles: List[Any],
+    window_start: datetime.datetime,
+    window_end: datetime.datetime,
+    date_field: str = "published_date",
+) -> List[Any]:
+    """
+    Keep the articles dated inside [window_start, window_end).
+
+    Used where an endpoint cannot express an end time, so that adjacent
+    windows never return the same article. Articles without a parseable
+    ``date_field`` are kept.
+
+    Args:
+        articles: Articles returned for the window
+        window_start: Inclusive start of the window
+        window_end: Exclusive end of the window
+        date_field: Article attribute holding the date
+
+    Returns:
+        The articles inside the window
+    """
+    kept = []
+    for article in articles:
+        date = parse_article_date(getattr(article, date_field, None))
+        if date is None or window_start <= date < window_end:
+            kept.append(article)
+    return kept
 
 
 def safe_get_articles(response):
@@ -303,3 +574,77 @@ def safe_get_articles(response):
 
     # If no articles found, return empty list
     return []
+
+
+def parse_article_date(value: Any) -> Optional[datetime.datetime]:
+    """
+    Parse an article date field into a timezone-aware datetime.
+
+    Args:
+        value: A date string such as ``published_date`` or ``parse_date``,
+               or a datetime
+
+    Returns:
+        The datetime in UTC if it has no timezone, or None if it cannot be parsed
+    """
+    if isinstance(value, datetime.datetime):
+        parsed = value
+    elif isinstance(value, str) and value:
+        try:
+            parsed = parse_date(value)
+        except (ValueError, OverflowError):
+            return None
+    else:
+        return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed
+
+
+def advance_watermark(
+    articles: List[Any],
+    watermark: Optional[Tuple[datetime.datetime, Set[str]]],
+    overlap: datetime.timedelta,
+    date_field: str,
+) -> Tuple[List[Any], Optional[Tuple[datetime.datetime, Set[str]]]]:
+    """
+    Drop articles already returned by a previous sync and compute the next watermark.
+
+    The watermark is the latest ``date_field`` value seen, plus the ids of
+    every article within ``overlap`` of it. The next sync starts ``overlap``
+    before the watermark, so exactly those ids can be returned again, and
+    they are filtered out.
+
+    Args:
+        articles: Articles fetched since ``watermark - overlap``
+        watermark: The previous (timestamp, boundary_ids), or None on the first sync
+        overlap: How far before the watermark the next sync starts
+        date_field: Article attribute the watermark tracks
+
+    Returns:
+        Tuple of (new_articles, next_watermark)
+    """
+    previous_ids = watermark[1] if watermark else set()
+    new_articles = [
+        article for article in articles if getattr(article, "id", None) not in previous_ids
+    ]
+
+    dated = [
+        (date, article)
+        for article in articles
+        for date in [parse_article_date(getattr(article, date_field, None))]
+        if date is not None
+    ]
+    if not dated:
+        return new_articles, watermark
+
+    latest = max(date for date, _ in dated)
+    if watermark and watermark[0] > latest:
+        latest = watermark[0]
+    boundary_ids = {
+        article.id
+        for date, article in dated
+        if date >= latest - overlap and getattr(article, "id", None)
+    }
+    return new_articles, (latest, boundary_ids)
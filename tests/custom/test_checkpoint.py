@@ -0,0 +1,323 @@
+"""
+Tests for checkpoint and resume of get_all_articles harvests.
+"""
+
+import sys
+import os
+import datetime
+import pytest
+from unittest.mock import patch, MagicMock
+
+# Add the src directory to the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+)
+
+from newscatcher.checkpoint import SPLIT_PAGE, SQLiteCheckpointStore
+from newscatcher.client import NewscatcherApi, AsyncNewscatcherApi
+from newscatcher.types.article_entity import ArticleEntity
+from newscatcher.types.search_response_dto import SearchResponseDto
+
+FROM = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+TO = datetime.datetime(2025, 1, 4, tzinfo=datetime.timezone.utc)
+
+
+def fake_post(**kwargs) -> MagicMock:
+    """Return a 3-page chunk whose single article id names its chunk and page."""
+    article = MagicMock(spec=ArticleEntity)
+    article.id = f"{kwargs['from_']}-{kwargs['page']}"
+    response = MagicMock(spec=SearchResponseDto)
+    response.articles = [article]
+    response.total_pages = 3
+    response.total_hits = 3
+    return response
+
+
+@pytest.fixture
+def store(tmp_path):
+    checkpoint = SQLiteCheckpointStore(str(tmp_path / "harvest.db"))
+    yield checkpoint
+    checkpoint.close()
+
+
+def test_seen_ids_are_streamed_in_batches(store):
+    """Test that every seen id is streamed, across batches."""
+    store.start_job("job", FROM, TO)
+    ids = [f"id-{i:03}" for i in range(25)]
+    store.record_unit("job", ("a", "b"), 1, 1, ids, 25)
+    store.record_unit("other", ("a", "b"), 1, 1, ["id-999"], 1)
+
+    assert list(store.iter_seen_ids("job", batch_size=10)) == ids
+    assert list(store.iter_seen_ids("job", batch_size=25)) == ids
+    assert list(store.iter_seen_ids("missing")) == []
+
+
+def test_store_round_trip(store):
+    """Test that recorded units, ids and counts are loaded back."""
+    assert store.load_job("job") is None
+
+    store.start_job("job", FROM, TO)
+    store.record_unit("job", ("a", "b"), 1, 3, ["x", "y"], 2)
+    store.record_unit("job", ("a", "b"), SPLIT_PAGE, 12, [], 2)
+
+    state = store.load_job("job")
+    assert state.from_date == FROM
+    assert state.to_date == TO
+    assert state.completed_units == {("a", "b"): {1: 3, SPLIT_PAGE: 12}}
+    assert list(store.iter_seen_ids("job")) == ["x", "y"]
+    assert state.article_count == 2
+
+    store.delete_job("job")
+    assert store.load_job("job") is None
+
+
+@patch("newscatcher.search.client.SearchClient.post")
+def test_resume_skips_completed_units(mock_post, store):
+    """Test that a resumed job fetches only the units not delivered before."""
+    client = NewscatcherApi(api_key="test_key")
+    mock_post.side_effect = fake_post
+
+    full = [
+        article.id
+        for article in client.get_all_articles(
+            q="test", from_=FROM, to=TO, time_chunk_size="1d"
+        )
+    ]
+    assert len(full) == 9
+    mock_post.reset_mock()
+
+    articles = client.iter_all_articles(
+        q="test",
+        from_=FROM,
+        to=TO,
+        time_chunk_size="1d",
+        checkpoint=store,
+        job_id="job",
+    )
+    first_run = [next(articles).id for _ in range(5)]
+    articles.close()
+    assert first_run == full[:5]
+
+    mock_post.reset_mock()
+    resumed = client.get_all_articles(
+        q="test",
+        from_="1d",
+        time_chunk_size="1d",
+        checkpoint=store,
+        job_id="job",
+    )
+
+    # Page 5 was being consumed when the first run stopped, so it is repeated
+    assert [article.id for article in resumed] == full[4:]
+    assert mock_post.call_count == 5
+    assert store.load_job("job").article_count == 9
+
+
+@patch("newscatcher.search.client.SearchClient.post")
+def test_resume_reuses_recorded_splits(mock_post, store):
+    """Test that an adaptive split recorded in a checkpoint is not refetched."""
+    client = NewscatcherApi(api_key="test_key")
+
+    def dense_post(**kwargs):
+        response = fake_post(**kwargs)
+        if (kwargs["from_"], kwargs["to"]) == (FROM.isoformat(), TO.isoformat()):
+            response.total_pages = 30
+            response.total_hits = 10000
+        return response
+
+    mock_post.side_effect = dense_post
+    client.get_all_articles(
+        q="test",
+        from_=FROM,
+        to=TO,
+        adaptive_chunking=True,
+        checkpoint=store,
+        job_id="job",
+        max_articles=1,
+    )
+
+    state = store.load_job("job")
+    assert SPLIT_PAGE in state.completed_units[(FROM.isoformat(), TO.isoformat())]
+
+    mock_post.reset_mock()
+    client.get_all_articles(
+        q="test",
+        adaptive_chunking=True,
+        checkpoint=store,
+        job_id="job",
+    )
+    assert all(
+        call.kwargs["to"] != TO.isoformat() or call.kwargs["from_"] != FROM.isoformat()
+        for call in mock_post.call_args_list
+    )
+    assert mock_post.call_count == 5
+
+
+def test_checkpoint_requires_job_id(store):
+    """Test that a checkpoint without a job id is rejected immediately."""
+    client = NewscatcherApi(api_key="test_key")
+    with pytest.raises(ValueError, match="job_id"):
+        client.iter_all_articles(q="test", checkpoint=store)
+
+
+@pytest.mark.asyncio
+@patch("newscatcher.search.client.AsyncSearchClient.post")
+async def test_async_resume_skips_completed_units(mock_post, store):
+    """Test that the async client resumes from the same checkpoint."""
+    client = AsyncNewscatcherApi(api_key="test_key")
+
+    async def async_fake_post(**kwargs):
+        return fake_post(**kwargs)
+
+    mock_post.side_effect = async_fake_post
+
+    first_run = await client.get_all_articles(
+        q="test",
+        from_=FROM,
+        to=TO,
+        time_chunk_size="1d",
+        max_articles=4,
+        checkpoint=store,
+        job_id="job",
+    )
+    assert len(first_run) == 4
+
+    mock_post.reset_mock()
+    resumed = await client.get_all_articles(
+        q="test",
+        time_chunk_size="1d",
+        checkpoint=store,
+        job_id="job",
+    )
+
+    assert len(resumed) == 5
+    assert {article.id for article in resumed}.isdisjoint(
+        {article.id for article in first_run}
+    )
+    assert mock_post.call_count == 5
+
+
+def dated_response(articles):
+    response = MagicMock(spec=SearchResponseDto)
+    response.articles = articles
+    response.total_pages = 1
+    return response
+
+
+def dated_article(article_id: str, published_date: str) -> MagicMock:
+    article = MagicMock(spec=ArticleEntity)
+    article.id = article_id
+    article.published_date = published_date
+    return article
+
+
+@patch("newscatcher.search.client.SearchClient.post")
+def test_get_new_articles_advances_watermark(mock_post, store):
+    """Test that a second sync starts at the watermark and skips boundary ids."""
+    client = NewscatcherApi(api_key="test_key")
+    mock_post.return_value = dated_response(
+        [
+            dated_article("a", "2025-01-01 10:00:00"),
+            dated_article("b", "2025-01-01 11:50:00"),
+            dated_article("c", "2025-01-01 12:00:00"),
+        ]
+    )
+
+    first = client.get_new_articles(q="test", store=store, sync_key="rates")
+    assert [a.id for a in first] == ["a", "b", "c"]
+
+    watermark = store.load_watermark("rates")
+    assert watermark.timestamp == datetime.datetime(
+        2025, 1, 1, 12, tzinfo=datetime.timezone.utc
+    )
+    assert watermark.boundary_ids == {"b", "c"}
+
+    mock_post.reset_mock()
+    mock_post.return_value = dated_response(
+        [
+            dated_article("b", "2025-01-01 11:50:00"),
+            dated_article("c", "2025-01-01 12:00:00"),
+            dated_article("d", "2025-01-01 11:55:00"),
+            dated_article("e", "2025-01-01 12:10:00"),
+        ]
+    )
+
+    second = client.get_new_articles(
+        q="test", store=store, sync_key="rates", time_chunk_size="30d"
+    )
+
+    assert [a.id for a in second] == ["d", "e"]
+    assert mock_post.call_args_list[0].kwargs["from_"] == "2025-01-01T11:30:00+00:00"
+    assert store.load_watermark("rates").boundary_ids == {"b", "c", "d", "e"}
+
+
+@pytest.mark.asyncio
+@patch("newscatcher.search.client.AsyncSearchClient.post")
+async def test_async_get_new_articles_without_results_keeps_watermark(mock_post, store):
+    """Test that an empty sync leaves the watermark unchanged."""
+    client = AsyncNewscatcherApi(api_key="test_key")
+
+    async def post(**kwargs):
+        return dated_response([dated_article("a", "2025-01-01T12:00:00Z")])
+
+    mock_post.side_effect = post
+    assert len(await client.get_new_articles(q="test", store=store)) == 1
+
+    async def empty_post(**kwargs):
+        return dated_response([])
+
+    mock_post.side_effect = empty_post
+    new_articles = await client.get_new_articles(
+        q="test", store=store, time_chunk_size="30d"
+    )
+    assert new_articles == []
+
+    sync_key = client._sync_key("test", {})
+    assert store.load_watermark(sync_key).boundary_ids == {"a"}
+
+
+@patch("newscatcher.search.client.SearchClient.post")
+def test_get_new_articles_keeps_watermark_after_incomplete_harvest(mock_post, store):
+    """Test that failed chunks and max_articles keep the watermark where it was."""
+    client = NewscatcherApi(api_key="test_key")
+    mock_post.return_value = dated_response([dated_article("a", "2025-01-01 10:00:00")])
+    client.get_new_articles(q="test", store=store, sync_key="rates")
+
+    def post(**kwargs):
+        if kwargs["from_"] < "2025-01-01T10:00":
+            raise RuntimeError("unavailable")
+        return dated_response(
+            [
+                dated_article("b", "2025-01-01 12:00:00"),
+                dated_article("c", "2025-01-01 12:05:00"),
+            ]
+        )
+
+    mock_post.return_value = None
+    mock_post.side_effect = post
+    with pytest.warns(RuntimeWarning, match="watermark was not advanced"):
+        articles = client.get_new_articles(
+            q="test", store=store, sync_key="rates", time_chunk_size="30d"
+        )
+    assert [a.id for a in articles] == ["b", "c"]
+    assert store.load_watermark("rates").boundary_ids == {"a"}
+
+    mock_post.side_effect = lambda **kwargs: post(**{**kwargs, "from_": "2025-01-02"})
+    with pytest.warns(RuntimeWarning, match="truncated=True"):
+        client.get_new_articles(
+            q="test",
+            store=store,
+            sync_key="rates",
+            time_chunk_size="30d",
+            max_articles=1,
+        )
+    assert store.load_watermark("rates").boundary_ids == {"a"}
+
+
+def test_sync_key_hashes_only_search_filters():
+    """Test that options controlling the harvest do not change the sync key."""
+    client = NewscatcherApi(api_key="test_key")
+    key = client._sync_key("test", {"sources": "example.com"})
+    options = {"concurrency": 4, "show_progress": True, "max_articles": 10}
+    assert client._sync_key("test", {"sources": "example.com", **options}) == key
+    assert client._sync_key("test", {"sources": "other.com"}) != key
@@ -10,8 +10,12 @@ through time-chunked requests.
 """
 
 import sys
+import asyncio
 import os
+import threading
+import time
 import pytest
+from contextlib import aclosing
 from unittest.mock import patch, MagicMock
 import datetime
 from typing import List, Dict, Any
@@ -22,8 +26,12 @@ sys.path.insert(
 )
 
 from newscatcher.client import NewscatcherApi, AsyncNewscatcherApi
+from newscatcher.core import AdaptiveConcurrencyController
 from newscatcher.types.article_entity import ArticleEntity
 from newscatcher.types.search_response_dto import SearchResponseDto
+from newscatcher.types.aggregation_count_response_dto import AggregationCountResponseDto
+from newscatcher.types.aggregation_item import AggregationItem
+from newscatcher.types.time_frame_count import TimeFrameCount
 
 
 def create_mock_article(article_id: str, title: str) -> MagicMock:
@@ -47,6 +55,20 @@ def create_mock_response(articles: List[MagicMock], total_pages: int = 1) -> Mag
     return response
 
 
+def create_density_response(from_: str, to: str, page: int) -> MagicMock:
+    """Create a response whose hit count is 1,000 articles per hour of window."""
+    hours = (
+        datetime.datetime.fromisoformat(to) - datetime.datetime.fromisoformat(from_)
+    ).total_seconds() / 3600
+    hits = int(hours * 1000)
+    response = create_mock_response(
+        [create_mock_article(f"{from_}-{page}", "Article")],
+        total_pages=-(-hits // 1000),
+    )
+    response.total_hits = min(hits, 10000)
+    return response
+
+
 class TestNewscatcherApiCustomMethods:
     """Tests for custom methods in NewscatcherApi."""
 
@@ -209,7 +231,195 @@ class TestNewscatcherApiCustomMethods:
         assert len(result) == 7
         assert [article.id for article in result] == ["1", "2", "3", "4", "5", "6", "7"]
 
-    @patch("newscatcher.latestheadlines.client.LatestheadlinesClient.post")
+    @patch("newscatcher.search.client.SearchClient.post")
+    def test_get_all_articles_thread_pool(self, mock_post):
+        """Test get_all_articles fetches chunks and pages on a thread pool."""
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+        thread_names = set()
+
+        def fake_post(**kwargs):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                thread_names.add(threading.current_thread().name)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return create_mock_response(
+                [create_mock_article(f"{kwargs['from_']}-{kwargs['page']}", "A")],
+                total_pages=3,
+            )
+
+        mock_post.side_effect = fake_post
+
+        result = self.client.get_all_articles(
+            q="test", from_="3d", time_chunk_size="1d", concurrency=3
+        )
+
+        chunk_starts = sorted({article.id.rsplit("-", 1)[0] for article in result})
+        assert mock_post.call_count == 9
+        assert max_in_flight == 3
+        assert all(name.startswith("newscatcher-harvest") for name in thread_names)
+        assert [article.id for article in result] == [
+            f"{chunk_start}-{page}" for chunk_start in chunk_starts for page in (1, 2, 3)
+        ]
+
+    @patch("newscatcher.search.client.SearchClient.post")
+    def test_get_all_articles_thread_pool_max_limit(self, mock_post):
+        """Test the thread pool stops once max_articles is reached."""
+
+        def fake_post(**kwargs):
+            time.sleep(0.01)
+            return create_mock_response(
+                [
+                    create_mock_article(f"{kwargs['from_']}-{i}", "A")
+                    for i in range(5)
+                ]
+            )
+
+        mock_post.side_effect = fake_post
+
+        result = self.client.get_all_articles(
+            q="test", from_="10d", time_chunk_size="1d", max_articles=7, concurrency=2
+        )
+
+        assert len(result) == 7
+        assert mock_post.call_count < 10
+
+    @patch("newscatcher.search.client.SearchClient.post")
+    def test_get_all_articles_adaptive_chunking(self, mock_post):
+        """Test adaptive chunking bisects dense windows until nothing is truncated."""
+        mock_post.side_effect = lambda **kwargs: create_density_response(
+            kwargs["from_"], kwargs["to"], kwargs["page"]
+        )
+
+        to = datetime.datetime(2026, 1, 2, tzinfo=datetime.timezone.utc)
+        result = self.client.get_all_articles(
+            q="test",
+            from_=to - datetime.timedelta(days=1),
+            to=to,
+            adaptive_chunking=True,
+        )
+
+        # 24h -> 2 x 12h -> 4 x 6h windows of 6 pages each
+        windows = [to - datetime.timedelta(hours=h) for h in (24, 18, 12, 6)]
+        assert mock_post.call_count == 1 + 2 + 4 * 6
+        assert [article.id for article in result] == [
+            f"{window.isoformat()}-{page}" for window in windows for page in range(1, 7)
+        ]
+
+    @patch("newscatcher.search.client.SearchClient.post")
+    @patch("newscatcher.aggregation_count.client.AggregationCountClient.post")
+    def test_plan_articles_harvest(self, mock_aggregation, mock_search):
+        """Test planning chunks from an aggregation histogram and harvesting them."""
+        start = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+        hourly_counts = {0: 2000, 1: 3000, 2: 4000, 3: 20000, 5: 500}
+        mock_aggregation.return_value = AggregationCountResponseDto(
+            status="ok",
+            total_hits=sum(hourly_counts.values()),
+            page=1,
+            total_pages=1,
+            page_size=1,
+            aggregations=[
+                AggregationItem(
+                    aggregation_count=[
+                        TimeFrameCount(
+                            time_frame=datetime.datetime(2026, 1, 1, hour),
+                            article_count=count,
+                        )
+                        for hour, count in hourly_counts.items()
+                    ]
+                )
+            ],
+        )
+
+        plan = self.client.plan_articles_harvest(
+            q="test",
+            from_=start,
+            to=start + datetime.timedelta(hours=6),
+            lang="en",
+            page_size=1000,
+        )
+
+        hour = datetime.timedelta(hours=1)
+        minutes_20 = datetime.timedelta(minutes=20)
+        assert [(c.start, c.end, c.expected_articles) for c in plan] == [
+            (start, start + 3 * hour, 9000),
+            (start + 3 * hour, start + 3 * hour + minutes_20, 6666),
+            (start + 3 * hour + minutes_20, start + 3 * hour + 2 * minutes_20, 6667),
+            (start + 3 * hour + 2 * minutes_20, start + 4 * hour, 6667),
+            (start + 4 * hour, start + 6 * hour, 500),
+        ]
+        assert plan.total_articles == 29500
+        assert plan.estimated_requests == 9 + 7 + 7 + 7 + 1
+        assert mock_aggregation.call_args.kwargs["aggregation_by"] == "hour"
+        assert mock_aggregation.call_args.kwargs["lang"] == "en"
+
+        mock_search.return_value = create_mock_response([])
+        self.client.get_all_articles(q="test", plan=plan)
+
+        assert [call.kwargs["from_"] for call in mock_search.call_args_list] == [
+            chunk.start.isoformat() for chunk in plan
+        ]
+        assert [call.kwargs["to"] for call in mock_search.call_args_list] == [
+            chunk.end.isoformat() for chunk in plan
+        ]
+
+    @patch("newscatcher.search.client.SearchClient.post")
+    def test_iter_all_articles_streams_pages(self, mock_post):
+        """Test iter_all_articles yields articles before later pages are fetched."""
+        mock_post.side_effect = [
+            create_mock_response(
+                [create_mock_article("1", "A"), create_mock_article("2", "B")],
+                total_pages=2,
+            ),
+            create_mock_response([create_mock_article("3", "C")], total_pages=2),
+        ]
+
+        articles = self.client.iter_all_articles(
+            q="test", from_="1d", time_chunk_size="1d"
+        )
+
+        assert mock_post.call_count == 0
+        assert next(articles).id == "1"
+        assert mock_post.call_count == 1
+        assert [article.id for article in articles] == ["2", "3"]
+        assert mock_post.call_count == 2
+
+    @patch("newscatcher.search.client.SearchClient.post")
+    def test_iter_all_articles_page_batches(self, mock_post):
+        """Test iter_all_articles can yield one list of articles per page."""
+        mock_post.side_effect = [
+            create_mock_response(
+                [create_mock_article("1", "A"), create_mock_article("2", "B")],
+                total_pages=2,
+            ),
+            create_mock_response(
+                [create_mock_article("2", "B"), create_mock_article("3", "C")],
+                total_pages=2,
+            ),
+        ]
+
+        batches = list(
+            self.client.iter_all_articles(
+                q="test", from_="1d", time_chunk_size="1d", page_batches=True
+            )
+        )
+
+        assert [[article.id for article in batch] for batch in batches] == [
+            ["1", "2"],
+            ["3"],
+        ]
+
+    def test_iter_all_articles_validates_eagerly(self):
+        """Test invalid queries raise when iter_all_articles is called."""
+        with pytest.raises(ValueError):
+            self.client.iter_all_articles(q="AND test")
+
+    @patch("newscatcher.latest_headlines.client.LatestHeadlinesClient.post")
     def test_get_all_headlines(self, mock_post):
         """Test get_all_headlines functionality."""
         # Create mock articles
@@ -236,6 +446,80 @@ class TestNewscatcherApiCustomMethods:
         assert "when" in kwargs
         assert kwargs["when"] == "1d"
 
+    @patch("newscatcher.latest_headlines.client.LatestHeadlinesClient.post")
+    def test_get_all_headlines_single_request_when_range_fits(self, mock_post):
+        """Test that a range under the page ceiling is fetched without windowing."""
+        mock_post.return_value = create_mock_response(
+            [create_mock_article("1", "Headline 1")], total_pages=2
+        )
+
+        result = self.client.get_all_headlines(when="3d", time_chunk_size="1h")
+
+        assert [article.id for article in result] == ["1"]
+        assert [call.kwargs["when"] for call in mock_post.call_args_list] == ["3d", "3d"]
+        assert [call.kwargs["page"] for call in mock_post.call_args_list] == [1, 2]
+
+    @patch("newscatcher.latest_headlines.client.LatestHeadlinesClient.post")
+    def test_get_all_headlines_exact_windows(self, mock_post):
+        """Test that an oversized range is split into windows filtered client-side."""
+        now = datetime.datetime.now(datetime.timezone.utc)
+        # One article every 8 hours, from 4 to 68 hours old
+        articles = []
+        for hours in range(4, 72, 8):
+            article = create_mock_article(f"{hours}h", "Headline")
+            article.published_date = (now - datetime.timedelta(hours=hours)).isoformat()
+            articles.append(article)
+
+        def fake_post(when, page, **kwargs):
+            # `when` always ends now: newest first, two articles per page
+            hits = articles[: int(when[:-1]) * 3]
+            response = create_mock_response(hits[(page - 1) * 2 : page * 2])
+            response.total_pages = (len(hits) + 1) // 2
+            response.total_hits = len(hits)
+            return response
+
+        mock_post.side_effect = fake_post
+        self.client.MAX_PAGES_PER_CHUNK = 2
+
+        with pytest.warns(RuntimeWarning) as record:
+            result = self.client.get_all_headlines(
+                when="3d", time_chunk_size="1d", deduplicate=False
+            )
+
+        assert [article.id for article in result] == ["28h", "4h", "12h", "20h"]
+        calls = [(call.kwargs["when"], call.kwargs["page"]) for call in mock_post.call_args_list]
+        # The oldest window reuses the first page of the whole range
+        assert calls == [("3d", 1), ("3d", 2), ("2d", 1), ("2d", 2), ("1d", 1), ("1d", 2)]
+        # Only the windows whose own request is oversized are incomplete
+        messages = [str(warning.message) for warning in record]
+        assert len(messages) == 2
+        assert "when=3d" in messages[0] and "when=2d" in messages[1]
+
+    @patch("newscatcher.search.client.SearchClient.post")
+    def test_get_all_articles_deadline(self, mock_post):
+        """Test that a harvest deadline is passed down and stops the harvest."""
+
+        def fake_post(**kwargs):
+            time.sleep(0.05)
+            return create_mock_response(
+                [create_mock_article(f"{kwargs['from_']}-{kwargs['page']}", "A")]
+            )
+
+        mock_post.side_effect = fake_post
+
+        result = self.client.get_all_articles(
+            q="test",
+            from_="10d",
+            time_chunk_size="1d",
+            deadline=0.12,
+            request_options={"max_retries": 1},
+        )
+
+        assert 0 < len(result) < 10
+        for call in mock_post.call_args_list:
+            assert call.kwargs["request_options"]["max_retries"] == 1
+            assert 0 <= call.kwargs["request_options"]["deadline"] <= 0.12
+
 
 @pytest.mark.asyncio
 class TestAsyncNewscatcherApiCustomMethods:
@@ -293,7 +577,7 @@ class TestAsyncNewscatcherApiCustomMethods:
         assert [article.id for article in result] == ["1", "2", "3"]
         assert mock_post.call_count == 3
 
-    @patch("newscatcher.latestheadlines.client.AsyncLatestheadlinesClient.post")
+    @patch("newscatcher.latest_headlines.client.AsyncLatestHeadlinesClient.post")
     async def test_get_all_headlines_async(self, mock_post):
         """Test async get_all_headlines functionality."""
         # Create mock articles
@@ -314,3 +598,183 @@ class TestAsyncNewscatcherApiCustomMethods:
         assert result[0].id == "1"
         assert result[1].id == "2"
         assert mock_post.call_count == 1
+
+    @patch("newscatcher.search.client.AsyncSearchClient.post")
+    async def test_get_all_articles_async_cross_chunk_concurrency(self, mock_post):
+        """Test that pages of different chunks share one bounded request pool."""
+        in_flight = 0
+        max_in_flight = 0
+        chunk_starts: List[str] = []
+
+        async def fake_post(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+            if kwargs["from_"] not in chunk_starts:
+                chunk_starts.append(kwargs["from_"])
+            return create_mock_response(
+                [create_mock_article(f"{kwargs['from_']}-{kwargs['page']}", "Article")],
+                total_pages=2,
+            )
+
+        mock_post.side_effect = fake_post
+
+        result = await self.client.get_all_articles(
+            q="test", from_="4d", time_chunk_size="1d", concurrency=4
+        )
+
+        # Four chunks of two pages each, fetched with overlap across chunks
+        assert mock_post.call_count == 8
+        assert max_in_flight == 4
+        assert [article.id for article in result] == [
+            f"{chunk_start}-{page}"
+            for chunk_start in sorted(chunk_starts)
+            for page in (1, 2)
+        ]
+
+    @pytest.mark.parametrize("concurrency, expected", [(None, 6), (2, 2)])
+    @patch("newscatcher.search.client.AsyncSearchClient.post")
+    async def test_get_all_articles_async_controller_concurrency(
+        self, mock_post, concurrency, expected
+    ):
+        """Test that a controller sets the default pool size but not an explicit one."""
+        client = AsyncNewscatcherApi(
+            api_key="test_key",
+            concurrency_controller=AdaptiveConcurrencyController(initial_limit=2, max_limit=6),
+        )
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_post(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return create_mock_response([create_mock_article("1", "Article")], total_pages=2)
+
+        mock_post.side_effect = fake_post
+
+        await client.get_all_articles(
+            q="test", from_="8d", time_chunk_size="1d", concurrency=concurrency, deduplicate=False
+        )
+
+        assert mock_post.call_count == 16
+        assert max_in_flight == expected
+
+    @patch("newscatcher.search.client.AsyncSearchClient.post")
+    async def test_get_all_articles_async_max_articles_cancels_pending(
+        self, mock_post
+    ):
+        """Test that reaching max_articles stops the cross-chunk scheduler."""
+
+        async def fake_post(**kwargs):
+            await asyncio.sleep(0.01)
+            return create_mock_response(
+                [
+                    create_mock_article(f"{kwargs['from_']}-{kwargs['page']}-{i}", "A")
+                    for i in range(5)
+                ],
+                total_pages=1,
+            )
+
+        mock_post.side_effect = fake_post
+
+        result = await self.client.get_all_articles(
+            q="test", from_="10d", time_chunk_size="1d", max_articles=7, concurrency=2
+        )
+
+        assert len(result) == 7
+        # Only the look-ahead window was requested, not all ten chunks
+        assert mock_post.call_count < 10
+
+    @patch("newscatcher.search.client.AsyncSearchClient.post")
+    async def test_get_all_articles_async_adaptive_chunking(self, mock_post):
+        """Test async adaptive chunking yields bisected windows in time order."""
+
+        async def fake_post(**kwargs):
+            return create_density_response(
+                kwargs["from_"], kwargs["to"], kwargs["page"]
+            )
+
+        mock_post.side_effect = fake_post
+
+        to = datetime.datetime(2026, 1, 2, tzinfo=datetime.timezone.utc)
+        result = await self.client.get_all_articles(
+            q="test",
+            from_=to - datetime.timedelta(days=1),
+            to=to,
+            adaptive_chunking=True,
+            concurrency=4,
+        )
+
+        windows = [to - datetime.timedelta(hours=h) for h in (24, 18, 12, 6)]
+        assert mock_post.call_count == 1 + 2 + 4 * 6
+        assert [article.id for article in result] == [
+            f"{window.isoformat()}-{page}" for window in windows for page in range(1, 7)
+        ]
+
+    @patch("newscatcher.search.client.AsyncSearchClient.post")
+    async def test_aiter_all_articles_page_batches(self, mock_post):
+        """Test aiter_all_articles streams one batch per page."""
+        mock_post.side_effect = [
+            create_mock_response([create_mock_article("1", "A")], total_pages=2),
+            create_mock_response([create_mock_article("2", "B")], total_pages=2),
+        ]
+
+        batches = [
+            [article.id for article in batch]
+            async for batch in self.client.aiter_all_articles(
+                q="test", from_="1d", time_chunk_size="1d", page_batches=True
+            )
+        ]
+
+        assert batches == [["1"], ["2"]]
+
+    @patch("newscatcher.search.client.AsyncSearchClient.post")
+    async def test_aiter_all_articles_early_exit(self, mock_post):
+        """Test closing aiter_all_articles early stops further requests."""
+
+        async def fake_post(**kwargs):
+            await asyncio.sleep(0.01)
+            return create_mock_response(
+                [create_mock_article(f"{kwargs['from_']}-{kwargs['page']}", "A")]
+            )
+
+        mock_post.side_effect = fake_post
+
+        async with aclosing(
+            self.client.aiter_all_articles(
+                q="test", from_="10d", time_chunk_size="1d", concurrency=1
+            )
+        ) as articles:
+            async for article in articles:
+                break
+
+        assert mock_post.call_count < 10
+
+    @patch("newscatcher.search.client.AsyncSearchClient.post")
+    async def test_get_all_articles_async_deadline(self, mock_post):
+        """Test that a harvest deadline bounds every request and stops the harvest."""
+
+        async def fake_post(**kwargs):
+            await asyncio.sleep(0.05)
+            return create_mock_response(
+                [create_mock_article(f"{kwargs['from_']}-{kwargs['page']}", "A")]
+            )
+
+        mock_post.side_effect = fake_post
+
+        started = time.monotonic()
+        result = await self.client.get_all_articles(
+            q="test", from_="10d", time_chunk_size="1d", concurrency=1, deadline=0.12
+        )
+
+        assert time.monotonic() - started < 0.3
+        assert 0 < len(result) < 10
+        deadlines = [call.kwargs["request_options"]["deadline"] for call in mock_post.call_args_list]
+        assert all(0 <= deadline <= 0.12 for deadline in deadlines)
+        assert deadlines == sorted(deadlines, reverse=True)
@@ -0,0 +1,180 @@
+"""
+Tests for the deduplication backends used by bulk harvests.
+"""
+
+import sys
+import os
+import pytest
+from unittest.mock import patch, MagicMock
+
+# Add the src directory to the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+)
+
+from newscatcher.client import NewscatcherApi
+from newscatcher.dedup import (
+    BloomDeduplicator,
+    Deduplicator,
+    ExactDeduplicator,
+    HashedIdDeduplicator,
+    NearDuplicateDetector,
+)
+from newscatcher.types.article_entity import ArticleEntity
+from newscatcher.types.search_response_dto import SearchResponseDto
+
+
+@pytest.mark.parametrize(
+    "deduplicator",
+    [
+        ExactDeduplicator(),
+        HashedIdDeduplicator(initial_capacity=4),
+        BloomDeduplicator(capacity=10000, false_positive_rate=0.001),
+    ],
+)
+def test_backends_track_seen_ids(deduplicator):
+    """Test that every backend remembers added ids and reports its size."""
+    ids = [f"article-{i}" for i in range(5000)]
+    for article_id in ids:
+        deduplicator.add(article_id)
+    deduplicator.add(ids[0])
+
+    assert all(article_id in deduplicator for article_id in ids)
+    assert len(deduplicator) == pytest.approx(5000, abs=5)
+
+    stats = deduplicator.stats()
+    assert stats.items == len(deduplicator)
+    assert stats.memory_bytes > 0
+    assert stats.false_positive_rate < 0.001
+
+
+def test_incomplete_backend_cannot_be_created():
+    """Test that a backend missing part of the interface fails when created."""
+
+    class NoStats(Deduplicator):
+        def add(self, article_id):
+            pass
+
+        def __contains__(self, article_id):
+            return False
+
+        def __len__(self):
+            return 0
+
+    with pytest.raises(TypeError, match="stats"):
+        NoStats()
+
+
+def test_compact_backends_use_less_memory():
+    """Test that the compact backends are smaller than a set of id strings."""
+    exact, hashed, bloom = (
+        ExactDeduplicator(),
+        HashedIdDeduplicator(),
+        BloomDeduplicator(capacity=20000),
+    )
+    for i in range(20000):
+        article_id = f"0123456789abcdef0123456789abcdef-{i}"
+        for deduplicator in (exact, hashed, bloom):
+            deduplicator.add(article_id)
+
+    assert hashed.stats().bytes_per_item <= 32
+    assert bloom.stats().bytes_per_item < 2
+    assert exact.stats().memory_bytes > 3 * hashed.stats().memory_bytes
+
+
+def test_bloom_false_positive_rate_is_near_target():
+    """Test that unseen ids are rarely reported as seen."""
+    bloom = BloomDeduplicator(capacity=10000, false_positive_rate=0.01)
+    for i in range(10000):
+        bloom.add(f"seen-{i}")
+
+    false_positives = sum(f"unseen-{i}" in bloom for i in range(10000))
+    assert false_positives < 200
+
+
+@patch("newscatcher.search.client.SearchClient.post")
+def test_get_all_articles_with_backend(mock_post):
+    """Test that a backend passed as deduplicate drops repeated articles."""
+
+    def article(article_id):
+        mock = MagicMock(spec=ArticleEntity)
+        mock.id = article_id
+        return mock
+
+    response = MagicMock(spec=SearchResponseDto)
+    response.articles = [article("1"), article("2"), article("1")]
+    response.total_pages = 1
+    mock_post.return_value = response
+
+    deduplicator = HashedIdDeduplicator()
+    client = NewscatcherApi(api_key="test_key")
+    result = client.get_all_articles(
+        q="test", from_="1d", time_chunk_size="1d", deduplicate=deduplicator
+    )
+
+    assert [a.id for a in result] == ["1", "2"]
+    assert len(deduplicator) == 2
+
+
+WIRE_STORY = (
+    "The central bank raised interest rates by a quarter point on Wednesday, "
+    "citing persistent inflation in services and a tight labor market. "
+    "Officials signaled that further increases remain possible this year."
+)
+
+
+def make_article(article_id: str, title: str, content: str) -> MagicMock:
+    article = MagicMock(spec=ArticleEntity)
+    article.id = article_id
+    article.title = title
+    article.content = content
+    return article
+
+
+def test_near_duplicate_detector_drops_syndicated_copies():
+    """Test that lightly edited copies of a story are detected as duplicates."""
+    detector = NearDuplicateDetector(threshold=0.7)
+
+    original = make_article("1", "Central bank raises rates", WIRE_STORY)
+    copy = make_article("2", "Central bank raises rates", WIRE_STORY + " Reporting by staff.")
+    unrelated = make_article(
+        "3", "Local team wins final", "The home side won the championship final in extra time."
+    )
+
+    assert detector.add(original)
+    assert not detector.add(copy)
+    assert detector.add(unrelated)
+    assert detector.duplicates == {"2": "1"}
+    assert len(detector) == 2
+
+
+def test_near_duplicate_detector_tag_mode_keeps_copies():
+    """Test that tag mode keeps duplicates and records their story."""
+    detector = NearDuplicateDetector(threshold=0.7, action="tag")
+
+    assert detector.add(make_article("1", "Rates rise", WIRE_STORY))
+    assert detector.add(make_article("2", "Rates rise", WIRE_STORY))
+    assert detector.duplicates == {"2": "1"}
+
+
+@patch("newscatcher.search.client.SearchClient.post")
+def test_get_all_articles_with_near_duplicates(mock_post):
+    """Test that syndicated copies with different ids are collapsed in a harvest."""
+    response = MagicMock(spec=SearchResponseDto)
+    response.articles = [
+        make_article("1", "Rates rise", WIRE_STORY),
+        make_article("2", "Rates rise", WIRE_STORY),
+        make_article("3", "Team wins", "The home side won the final."),
+    ]
+    response.total_pages = 1
+    mock_post.return_value = response
+
+    client = NewscatcherApi(api_key="test_key")
+    result = client.get_all_articles(
+        q="test",
+        from_="1d",
+        time_chunk_size="1d",
+        near_duplicates=NearDuplicateDetector(),
+    )
+
+    assert [a.id for a in result] == ["1", "3"]
@@ -0,0 +1,99 @@
+import asyncio
+import time
+import types
+from typing import Any, Callable, Optional
+
+import httpx
+import pytest
+
+from newscatcher.core import deadline as deadline_module
+from newscatcher.core import http_client as http_client_module
+from newscatcher.core.http_client import AsyncHttpClient, HttpClient
+
+_real_async_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """A monotonic clock that only moves when a test sets ``now`` or one of its sleeps runs."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+    async def async_sleep(self, seconds: float) -> None:
+        # Tasks sleeping at the same time wake in order of their end times, not one after another
+        wake_at = self.now + seconds
+        await _real_async_sleep(0)
+        self.now = max(self.now, wake_at)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def fake_time(monkeypatch: pytest.MonkeyPatch, clock: FakeClock) -> FakeClock:
+    """Run the deadline and retry timing of the HTTP clients, and every ``asyncio.sleep``, on ``clock``."""
+    fake_time_module = types.SimpleNamespace(monotonic=clock, sleep=clock.sleep, time=time.time)
+    monkeypatch.setattr(deadline_module, "time", fake_time_module)
+    monkeypatch.setattr(http_client_module, "time", fake_time_module)
+    monkeypatch.setattr(asyncio, "sleep", clock.async_sleep)
+    return clock
+
+
+def _http_client_options(timeout: Optional[float], max_retries: int) -> Any:
+    return dict(
+        base_timeout=lambda: timeout,
+        base_headers=lambda: {"x-api-token": "key"},
+        base_url=lambda: "https://example.com",
+        base_max_retries=max_retries,
+    )
+
+
+@pytest.fixture
+def make_sync_http_client() -> Callable[..., HttpClient]:
+    """
+    Build an ``HttpClient`` for ``https://example.com``.
+
+    Requests are answered by ``handler`` through a mock transport, or by ``httpx_client``
+    if one is given; other keyword arguments are passed to ``HttpClient``.
+    """
+
+    def make(
+        handler: Any = None,
+        *,
+        httpx_client: Any = None,
+        timeout: Optional[float] = None,
+        max_retries: int = 2,
+        **options: Any,
+    ) -> HttpClient:
+        if httpx_client is None:
+            httpx_client = httpx.Client(transport=httpx.MockTransport(handler))
+        return HttpClient(httpx_client=httpx_client, **_http_client_options(timeout, max_retries), **options)
+
+    return make
+
+
+@pytest.fixture
+def make_async_http_client() -> Callable[..., AsyncHttpClient]:
+    """Build an ``AsyncHttpClient`` for ``https://example.com``, as ``make_sync_http_client`` does."""
+
+    def make(
+        handler: Any = None,
+        *,
+        httpx_client: Any = None,
+        timeout: Optional[float] = None,
+        max_retries: int = 2,
+        **options: Any,
+    ) -> AsyncHttpClient:
+        if httpx_client is None:
+            httpx_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncHttpClient(httpx_client=httpx_client, **_http_client_options(timeout, max_retries), **options)
+
+    return make
@@ -0,0 +1,106 @@
+from typing import Callable, List
+
+import httpx
+import pytest
+
+from newscatcher.core.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from newscatcher.core.http_client import AsyncHttpClient, HttpClient
+
+from .conftest import FakeClock
+
+KEY = "https://example.com/api/search"
+
+
+def test_opens_after_consecutive_failures() -> None:
+    breaker = CircuitBreaker(failure_threshold=3)
+    breaker.record_failure(KEY)
+    breaker.record_failure(KEY)
+    breaker.record_response(KEY, 200)
+    breaker.record_failure(KEY)
+    breaker.record_failure(KEY)
+    assert breaker.state(KEY) == CLOSED
+
+    breaker.record_response(KEY, 503)
+    assert breaker.state(KEY) == OPEN
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_request(KEY)
+    assert error.value.key == KEY
+    assert breaker.rejected == 1
+
+
+def test_half_open_probe_closes_or_reopens(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+    breaker.record_failure(KEY)
+
+    clock.now = 10
+    assert breaker.state(KEY) == HALF_OPEN
+    breaker.before_request(KEY)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(KEY)
+    breaker.record_failure(KEY)
+    assert breaker.state(KEY) == OPEN
+
+    clock.now = 20
+    breaker.before_request(KEY)
+    breaker.record_response(KEY, 200)
+    assert breaker.state(KEY) == CLOSED
+    assert breaker.opened == 2
+
+
+def test_released_probe_frees_its_slot(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=1, clock=clock)
+    breaker.record_failure(KEY)
+    clock.now = 1
+    breaker.before_request(KEY)
+    breaker.release(KEY)
+    breaker.before_request(KEY)
+
+
+def test_circuits_per_endpoint_or_host() -> None:
+    assert CircuitBreaker().key_for("https://example.com/api/search/") == KEY
+    assert CircuitBreaker(per_endpoint=False).key_for(KEY) == "https://example.com"
+
+
+def test_sync_client_fails_fast_while_open(
+    fake_time: FakeClock, make_sync_http_client: Callable[..., HttpClient]
+) -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(503)
+
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    http_client = make_sync_http_client(handler, max_retries=5, circuit_breaker=breaker)
+
+    # The second attempt opens the circuit, so the remaining retries are abandoned
+    response = http_client.request("api/search", method="POST", json={})
+    assert response.status_code == 503
+    assert len(calls) == 2
+
+    with pytest.raises(CircuitOpenError):
+        http_client.request("api/search", method="POST", json={})
+    assert len(calls) == 2
+
+    # Other endpoints have their own circuit
+    http_client.request("api/sources", method="GET", request_options={"max_retries": 0})
+    assert len(calls) == 3
+
+
+async def test_async_client_records_connection_errors(
+    fake_time: FakeClock, make_async_http_client: Callable[..., AsyncHttpClient]
+) -> None:
+    calls: List[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        raise httpx.ConnectError("refused")
+
+    breaker = CircuitBreaker(failure_threshold=1)
+    http_client = make_async_http_client(handler, max_retries=3, circuit_breaker=breaker)
+    with pytest.raises(httpx.ConnectError):
+        await http_client.request("api/search", method="POST", json={})
+    with pytest.raises(CircuitOpenError):
+        await http_client.request("api/search", method="POST", json={})
+
+    assert len(calls) == 1
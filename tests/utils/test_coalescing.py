@@ -0,0 +1,160 @@
+import asyncio
+import threading
+import time
+from typing import Any, Callable, List
+
+import httpx
+import pytest
+
+from newscatcher import AsyncNewscatcherApi, NewscatcherApi
+from newscatcher.core.coalescing import coalescing_key
+from newscatcher.core.http_client import AsyncHttpClient, HttpClient
+
+
+def test_key_ignores_parameter_order() -> None:
+    first = coalescing_key("post", "https://e.com/s", [("a", 1), ("b", 2)], {"q": "x", "page": 1}, {"H": "v"})
+    second = coalescing_key("POST", "https://e.com/s", [("b", 2), ("a", 1)], {"page": 1, "q": "x"}, {"h": "v"})
+    assert first == second
+    assert first != coalescing_key("POST", "https://e.com/s", [("a", 1)], {"q": "x", "page": 2}, {"h": "v"})
+
+
+def test_key_skips_unsafe_methods() -> None:
+    assert coalescing_key("DELETE", "https://e.com/s", [], None, {}) is None
+
+
+def test_sync_concurrent_duplicates_share_one_call(make_sync_http_client: Callable[..., HttpClient]) -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        time.sleep(0.05)
+        return httpx.Response(200, json={"sources": ["a"]})
+
+    http_client = make_sync_http_client(handler, coalesce_requests=True)
+    results: List[Any] = []
+
+    def fetch() -> None:
+        results.append(http_client.request("api/sources", method="GET", params={"lang": "en"}).json())
+
+    threads = [threading.Thread(target=fetch) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"sources": ["a"]}] * 5
+    assert http_client.request_coalescer.coalesced == 4  # type: ignore[union-attr]
+
+
+def test_sync_sequential_calls_are_not_cached(make_sync_http_client: Callable[..., HttpClient]) -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={})
+
+    http_client = make_sync_http_client(handler, coalesce_requests=True)
+    http_client.request("api/subscription", method="GET")
+    http_client.request("api/subscription", method="GET")
+    assert len(calls) == 2
+
+
+async def test_async_concurrent_duplicates_share_one_call(
+    make_async_http_client: Callable[..., AsyncHttpClient],
+) -> None:
+    calls: List[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={"articles": []})
+
+    http_client = make_async_http_client(handler, coalesce_requests=True)
+    responses = await asyncio.gather(
+        *(http_client.request("api/latest_headlines", method="POST", json={"when": "1d"}) for _ in range(4)),
+        http_client.request("api/latest_headlines", method="POST", json={"when": "7d"}),
+    )
+
+    assert len(calls) == 2
+    assert responses[0] is responses[3]
+    assert responses[0] is not responses[4]
+    assert http_client.transfer_stats.responses == 2
+
+
+async def test_async_duplicates_share_errors(make_async_http_client: Callable[..., AsyncHttpClient]) -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        raise httpx.ReadTimeout("timed out")
+
+    http_client = make_async_http_client(handler, coalesce_requests=True)
+    results = await asyncio.gather(
+        *(http_client.request("api/sources", method="GET") for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(result, httpx.ReadTimeout) for result in results)
+
+
+async def test_async_cancelled_follower_does_not_cancel_leader(
+    make_async_http_client: Callable[..., AsyncHttpClient],
+) -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={"ok": True})
+
+    http_client = make_async_http_client(handler, coalesce_requests=True)
+    leader = asyncio.ensure_future(http_client.request("api/sources", method="GET"))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(http_client.request("api/sources", method="GET"))
+    await asyncio.sleep(0)
+    follower.cancel()
+
+    assert (await leader).json() == {"ok": True}
+    with pytest.raises(asyncio.CancelledError):
+        await follower
+
+
+SOURCES_RESPONSE = {"message": "ok", "sources": ["a"], "user_input": {"lang": "en"}}
+
+
+def test_sync_duplicates_share_one_call() -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        time.sleep(0.05)
+        return httpx.Response(200, json=SOURCES_RESPONSE)
+
+    client = NewscatcherApi(
+        api_key="key", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)), coalesce_requests=True
+    )
+    results: List[Any] = []
+    threads = [threading.Thread(target=lambda: results.append(client.sources.get(lang="en"))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 4 and all(result == results[0] for result in results)
+
+
+async def test_async_duplicates_share_one_call_across_response_modes() -> None:
+    calls: List[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json=SOURCES_RESPONSE)
+
+    client = AsyncNewscatcherApi(
+        api_key="key", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), coalesce_requests=True
+    )
+    results = await asyncio.gather(
+        *(client.sources.get(lang="en") for _ in range(3)),
+        client.sources.get(lang="en", request_options={"response_mode": "trusted"}),
+    )
+
+    # Each caller parses the shared body with its own response mode
+    assert len(calls) == 1
+    assert results[0] == results[1] == results[2]
+    assert results[3].sources == results[0].sources
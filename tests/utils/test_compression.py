@@ -0,0 +1,99 @@
+import gzip
+import json
+
+import httpx
+import pytest
+
+from newscatcher.core import compression
+from newscatcher.core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from newscatcher.core.compression import TransferStats, accept_encoding_header
+from newscatcher.core.http_response import HttpResponse
+
+BODY = json.dumps({"articles": [{"content": "renewable energy " * 200}] * 20}).encode()
+
+
+def _gzip_handler(request: httpx.Request) -> httpx.Response:
+    # An iterator body is read by the client as it would be from the network
+    return httpx.Response(
+        200,
+        headers={"content-encoding": "gzip", "content-type": "application/json"},
+        content=iter([gzip.compress(BODY)]),
+    )
+
+
+def test_accept_encoding_ranks_strongest_first(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(compression, "_installed", lambda package: True)
+    monkeypatch.setattr(compression, "_HTTPX_VERSION", (0, 28, 1))
+    assert accept_encoding_header() == "zstd, br;q=0.9, gzip;q=0.8, deflate;q=0.7"
+
+
+def test_accept_encoding_skips_unavailable_decoders(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(compression, "_installed", lambda package: False)
+    assert accept_encoding_header() == "gzip, deflate;q=0.9"
+
+
+def test_accept_encoding_skips_zstd_before_httpx_decodes_it(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(compression, "_installed", lambda package: package in ("brotlicffi", "zstandard"))
+    monkeypatch.setattr(compression, "_HTTPX_VERSION", (0, 27, 0))
+    assert accept_encoding_header() == "br, gzip;q=0.9, deflate;q=0.8"
+
+
+def test_sync_client_counts_wire_and_decoded_bytes() -> None:
+    sent_headers = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_headers.update(request.headers)
+        return _gzip_handler(request)
+
+    wrapper = SyncClientWrapper(
+        api_key="key",
+        base_url="https://example.com",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    response = wrapper.httpx_client.request("api/search", method="POST", json={"q": "energy"})
+
+    assert response.json() == json.loads(BODY)
+    assert sent_headers["accept-encoding"] == compression.ACCEPT_ENCODING
+    assert "Accept-Encoding" not in wrapper.get_headers()
+
+    wrapped = HttpResponse(response=response, data=None)
+    assert wrapped.content_encoding == "gzip"
+    assert wrapped.wire_bytes == len(gzip.compress(BODY))
+    assert wrapped.decoded_bytes == len(BODY)
+
+    stats = wrapper.httpx_client.transfer_stats
+    assert stats.responses == 1
+    assert stats.encodings == {"gzip": 1}
+    assert stats.compression_ratio > 10
+    assert stats.saved_bytes == len(BODY) - len(gzip.compress(BODY))
+
+
+async def test_async_client_counts_wire_and_decoded_bytes() -> None:
+    async def body():
+        yield gzip.compress(BODY)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-encoding": "gzip"}, content=body())
+
+    wrapper = AsyncClientWrapper(
+        api_key="key",
+        base_url="https://example.com",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    await wrapper.httpx_client.request("api/search", method="POST", json={"q": "energy"})
+    await wrapper.httpx_client.request("api/search", method="POST", json={"q": "solar"})
+
+    stats = wrapper.httpx_client.transfer_stats
+    assert stats.responses == 2
+    assert stats.decoded_bytes == 2 * len(BODY)
+    assert stats.wire_bytes < stats.decoded_bytes / 10
+
+
+def test_transfer_stats_reset() -> None:
+    stats = TransferStats()
+    response = httpx.Response(200, content=iter([b"abc"]))
+    response.read()
+    stats.record(response)
+    assert (stats.wire_bytes, stats.decoded_bytes, stats.compression_ratio) == (3, 3, 1.0)
+    stats.reset()
+    assert stats.responses == 0 and stats.encodings == {}
@@ -0,0 +1,129 @@
+import asyncio
+from typing import Any, Callable
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from newscatcher.core.concurrency import AdaptiveConcurrencyController
+from newscatcher.core.http_client import AsyncHttpClient
+
+from .conftest import FakeClock
+
+
+def _fill(controller: AdaptiveConcurrencyController) -> None:
+    """Mark the whole window as in flight, as a saturated client would."""
+    controller._in_flight = controller.limit
+
+
+def test_limit_grows_by_about_one_per_healthy_window(clock: FakeClock) -> None:
+    controller = AdaptiveConcurrencyController(initial_limit=4, clock=clock)
+    for _ in range(5):
+        _fill(controller)
+        controller.release(200, 0.1)
+    assert controller.limit == 5
+
+
+def test_limit_does_not_grow_when_window_is_not_used(clock: FakeClock) -> None:
+    controller = AdaptiveConcurrencyController(initial_limit=4, clock=clock)
+    for _ in range(20):
+        controller._in_flight = 1
+        controller.release(200, 0.1)
+    assert controller.limit == 4
+
+
+def test_overload_halves_limit_once_per_round_trip(clock: FakeClock) -> None:
+    controller = AdaptiveConcurrencyController(initial_limit=16, clock=clock)
+    _fill(controller)
+    controller.release(200, 0.5)
+
+    for _ in range(5):
+        controller._in_flight = 1
+        controller.release(429, 0.5)
+    assert controller.limit == 8
+    assert controller.decreases == 1
+
+    clock.now += 1
+    controller._in_flight = 1
+    controller.release(503, 0.5)
+    assert controller.limit == 4
+
+
+def test_rising_latency_reduces_limit(clock: FakeClock) -> None:
+    controller = AdaptiveConcurrencyController(initial_limit=10, clock=clock, latency_tolerance=2.0)
+    for latency in [0.1] * 5 + [1.0] * 5:
+        clock.now += 1
+        controller._in_flight = 1
+        controller.release(200, latency)
+    assert controller.limit < 10
+
+
+def test_limit_stays_within_bounds(clock: FakeClock) -> None:
+    controller = AdaptiveConcurrencyController(initial_limit=2, min_limit=2, max_limit=3, clock=clock)
+    for _ in range(50):
+        _fill(controller)
+        controller.release(200, 0.1)
+    assert controller.limit == 3
+
+    controller._in_flight = 1
+    controller.release(None, None)
+    assert controller.limit == 2
+
+
+def test_invalid_bounds_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyController(initial_limit=10, max_limit=5)
+
+
+async def test_async_http_client_bounds_requests_in_flight(
+    make_async_http_client: Callable[..., AsyncHttpClient],
+) -> None:
+    controller = AdaptiveConcurrencyController(initial_limit=3, max_limit=3)
+    in_flight = 0
+    peak = 0
+
+    async def request(**kwargs: Any) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200)
+
+    mock_client = MagicMock()
+    mock_client.request.side_effect = request
+    http_client = make_async_http_client(httpx_client=mock_client, concurrency_controller=controller)
+
+    await asyncio.gather(*(http_client.request(path="/test", method="GET") for _ in range(12)))
+
+    assert peak == 3
+    assert controller.in_flight == 0
+
+
+async def test_async_http_client_releases_slot_on_error(
+    make_async_http_client: Callable[..., AsyncHttpClient],
+) -> None:
+    controller = AdaptiveConcurrencyController(initial_limit=4)
+    mock_client = MagicMock()
+    mock_client.request.side_effect = httpx.ReadTimeout("timed out")
+    http_client = make_async_http_client(httpx_client=mock_client, concurrency_controller=controller)
+
+    with pytest.raises(httpx.ReadTimeout):
+        await http_client.request(path="/test", method="GET")
+
+    assert controller.in_flight == 0
+    assert controller.limit == 2
+
+
+async def test_cancelled_waiter_does_not_leak_slot() -> None:
+    controller = AdaptiveConcurrencyController(initial_limit=1, max_limit=1)
+    await controller.acquire()
+    waiter = asyncio.ensure_future(controller.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    controller.release(200, 0.1)
+    await asyncio.wait_for(controller.acquire(), timeout=1)
+    assert controller.in_flight == 1
@@ -0,0 +1,150 @@
+from typing import Callable, List
+
+import httpx
+import pytest
+
+from newscatcher.core import http_client as http_client_module
+from newscatcher.core.circuit_breaker import CLOSED, OPEN, CircuitBreaker
+from newscatcher.core.deadline import DeadlineExceededError, request_options_with_deadline, retry_fits_deadline
+from newscatcher.core.http_client import AsyncHttpClient, HttpClient
+
+from .conftest import FakeClock
+
+MakeSyncHttpClient = Callable[..., HttpClient]
+
+
+def _unavailable(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(503, headers={"retry-after": "1"}, json={"message": "unavailable"})
+
+
+def test_retry_that_cannot_finish_is_skipped(fake_time: FakeClock, make_sync_http_client: MakeSyncHttpClient) -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return _unavailable(request)
+
+    http_client = make_sync_http_client(handler, timeout=30, max_retries=5)
+    response = http_client.request("api/search", method="POST", json={}, request_options={"deadline": 0.5})
+
+    assert response.status_code == 503
+    assert len(calls) == 1
+    assert fake_time.now == 0
+
+
+def test_retries_within_deadline(fake_time: FakeClock, make_sync_http_client: MakeSyncHttpClient) -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, json={})
+
+    http_client = make_sync_http_client(handler, timeout=30, max_retries=5)
+    response = http_client.request("api/search", method="POST", json={}, request_options={"deadline": 5})
+    assert response.status_code == 200
+    assert len(calls) == 3
+    # Backoffs of about 1s and 2s
+    assert 2.7 <= fake_time.now <= 3.3
+
+
+def test_attempt_timeout_is_cut_to_time_left(fake_time: FakeClock, make_sync_http_client: MakeSyncHttpClient) -> None:
+    timeouts: List[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, json={})
+
+    http_client = make_sync_http_client(handler, timeout=30)
+    http_client.request("api/sources", method="GET", request_options={"deadline": 2})
+    http_client.request("api/sources", method="GET")
+    assert timeouts[0] == 2
+    assert timeouts[1] == 30
+
+
+def test_expired_deadline_raises_without_request(make_sync_http_client: MakeSyncHttpClient) -> None:
+    calls: List[httpx.Request] = []
+    http_client = make_sync_http_client(lambda request: calls.append(request))
+    with pytest.raises(DeadlineExceededError):
+        http_client.request("api/sources", method="GET", request_options={"deadline": 0})
+    assert calls == []
+
+
+def test_timeout_at_deadline_raises_deadline_exceeded(
+    fake_time: FakeClock, make_sync_http_client: MakeSyncHttpClient
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    http_client = make_sync_http_client(handler, timeout=30, max_retries=5)
+    with pytest.raises(DeadlineExceededError):
+        http_client.request("api/sources", method="GET", request_options={"deadline": 1})
+    with pytest.raises(httpx.ReadTimeout) as error:
+        http_client.request("api/sources", method="GET", request_options={"deadline": 60})
+    assert not isinstance(error.value, DeadlineExceededError)
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_timeout_at_deadline_leaves_the_circuit_closed(
+    use_async: bool,
+    fake_time: FakeClock,
+    make_sync_http_client: MakeSyncHttpClient,
+    make_async_http_client: Callable[..., AsyncHttpClient],
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    breaker = CircuitBreaker(failure_threshold=1)
+    if use_async:
+        async_client = make_async_http_client(async_handler, timeout=30, max_retries=0, circuit_breaker=breaker)
+
+        async def request(deadline: float) -> None:
+            await async_client.request("api/sources", method="GET", request_options={"deadline": deadline})
+
+    else:
+        sync_client = make_sync_http_client(handler, timeout=30, max_retries=0, circuit_breaker=breaker)
+
+        async def request(deadline: float) -> None:
+            sync_client.request("api/sources", method="GET", request_options={"deadline": deadline})
+
+    # Only the deadline cut the timeout short, so the endpoint is not blamed
+    with pytest.raises(DeadlineExceededError):
+        await request(1)
+    assert breaker.state("https://example.com/api/sources") == CLOSED
+
+    with pytest.raises(httpx.ReadTimeout):
+        await request(60)
+    assert breaker.state("https://example.com/api/sources") == OPEN
+
+
+def test_request_options_with_deadline(fake_time: FakeClock) -> None:
+    fake_time.now = 100
+    options = request_options_with_deadline({"max_retries": 1}, 110)
+    assert options == {"max_retries": 1, "deadline": 10}
+    assert request_options_with_deadline(None, None) is None
+    assert retry_fits_deadline(None, 60, 60)
+    assert retry_fits_deadline(101, 0.5, 0.4)
+    assert not retry_fits_deadline(101, 0.5, 0.6)
+
+
+async def test_async_retry_that_cannot_finish_is_skipped(
+    monkeypatch: pytest.MonkeyPatch, fake_time: FakeClock, make_async_http_client: Callable[..., AsyncHttpClient]
+) -> None:
+    monkeypatch.setattr(http_client_module, "INITIAL_RETRY_DELAY_SECONDS", 0.3)
+    calls: List[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(503)
+
+    http_client = make_async_http_client(handler, max_retries=5)
+    response = await http_client.request("api/search", method="POST", json={}, request_options={"deadline": 0.5})
+
+    # The first backoff (~0.3s) fits in the deadline, the second (~0.6s) does not
+    assert response.status_code == 503
+    assert len(calls) == 2
+    assert 0.27 <= fake_time.now <= 0.33
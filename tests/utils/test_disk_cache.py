@@ -0,0 +1,180 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from typing import Any, Callable, List
+
+import httpx
+
+from newscatcher.core.disk_cache import DiskResponseCache
+from newscatcher.core.http_client import HttpClient
+
+SRC = str(Path(__file__).resolve().parents[2] / "src")
+BODY = json.dumps({"articles": [{"title": "Solar output hits record"}] * 50}).encode()
+
+
+def _response(url: str = "https://e.com/api/search", content: bytes = BODY) -> httpx.Response:
+    return httpx.Response(
+        200, headers={"content-type": "application/json"}, content=content, request=httpx.Request("POST", url)
+    )
+
+
+def test_round_trip_is_compressed(tmp_path: Path) -> None:
+    cache = DiskResponseCache(tmp_path / "cache" / "responses.db")
+    cache.set("k", _response())
+
+    cached = cache.get("k")
+    assert cached is not None
+    assert cached.content == BODY
+    assert cached.headers["content-type"] == "application/json"
+    assert str(cached.request.url) == "https://e.com/api/search"
+    assert 0 < cache.total_bytes < len(BODY) / 10
+
+
+def test_entries_expire(tmp_path: Path) -> None:
+    now = [1000.0]
+    cache = DiskResponseCache(tmp_path / "responses.db", endpoint_ttls={"api/search": 60}, clock=lambda: now[0])
+    cache.set("k", _response())
+    now[0] += 60
+    assert cache.get("k") is None
+
+    cache.set("other", _response())
+    assert len(cache) == 1
+
+
+def test_evicts_least_recently_read(tmp_path: Path) -> None:
+    now = [1000.0]
+    cache = DiskResponseCache(tmp_path / "responses.db", max_entries=2, clock=lambda: now[0])
+    for key in ("a", "b"):
+        now[0] += 1
+        cache.set(key, _response(content=key.encode()))
+    now[0] += 1
+    cache.get("a")
+    now[0] += 1
+    cache.set("c", _response(content=b"c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.evictions == 1
+
+
+def test_size_cap(tmp_path: Path) -> None:
+    cache = DiskResponseCache(tmp_path / "responses.db", max_bytes=2048, compression_level=0)
+    for index in range(10):
+        cache.set(str(index), _response(content=os.urandom(500)))
+    assert cache.total_bytes <= 2048
+    assert cache.get("9") is not None
+
+
+def test_totals_follow_writes(tmp_path: Path) -> None:
+    now = [1000.0]
+    cache = DiskResponseCache(
+        tmp_path / "responses.db", max_entries=3, endpoint_ttls={"api/search": 60}, clock=lambda: now[0]
+    )
+
+    def counted() -> Any:
+        return cache._connection().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+
+    for index in range(5):
+        cache.set(str(index), _response(content=os.urandom(100 + index)))
+    cache.set("4", _response(content=os.urandom(300)))
+    assert (len(cache), cache.total_bytes) == counted() and len(cache) == 3
+
+    now[0] += 60
+    cache.set("fresh", _response(url="https://e.com/api/sources"))
+    assert (len(cache), cache.total_bytes) == counted() and len(cache) == 1
+
+    cache.clear()
+    assert (len(cache), cache.total_bytes) == (0, 0)
+
+
+def test_totals_are_backfilled_for_an_existing_database(tmp_path: Path) -> None:
+    path = tmp_path / "responses.db"
+    cache = DiskResponseCache(path)
+    for key in ("a", "b"):
+        cache.set(key, _response(content=key.encode()))
+    connection = cache._connection()
+    for trigger in ("responses_insert", "responses_delete", "responses_update_size"):
+        connection.execute(f"DROP TRIGGER {trigger}")
+    connection.execute("DROP TABLE totals")
+    cache.close()
+
+    reopened = DiskResponseCache(path)
+    assert len(reopened) == 2
+    assert reopened.total_bytes == cache._connection().execute("SELECT SUM(size) FROM responses").fetchone()[0]
+
+
+def test_drifted_totals_are_recounted(tmp_path: Path) -> None:
+    cache = DiskResponseCache(tmp_path / "responses.db", max_entries=3)
+    cache.set("a", _response())
+    # Totals that count more rows than the table holds, so eviction runs out of rows to delete
+    cache._connection().execute("UPDATE totals SET entries = 100, bytes = 1000000")
+
+    cache.set("b", _response())
+    assert len(cache) == 2
+    assert cache.total_bytes == cache._connection().execute("SELECT SUM(size) FROM responses").fetchone()[0]
+    assert cache.get("a") is not None and cache.get("b") is not None
+
+
+def test_writes_under_budget_do_not_scan_for_eviction(tmp_path: Path) -> None:
+    cache = DiskResponseCache(tmp_path / "responses.db")
+    statements: List[str] = []
+    cache._connection().set_trace_callback(statements.append)
+    cache.set("k", _response())
+
+    assert statements and not any("ORDER BY accessed_at" in statement for statement in statements)
+    assert not any("COUNT(" in statement or "SUM(" in statement for statement in statements)
+
+
+def test_reads_update_access_time_once_per_resolution(tmp_path: Path) -> None:
+    now = [1000.0]
+    cache = DiskResponseCache(tmp_path / "responses.db", access_resolution=10, clock=lambda: now[0])
+    cache.set("k", _response())
+
+    def accessed_at() -> float:
+        return cache._connection().execute("SELECT accessed_at FROM responses").fetchone()[0]
+
+    now[0] += 5
+    assert cache.get("k") is not None
+    assert accessed_at() == 1000.0
+    now[0] += 5
+    assert cache.get("k") is not None
+    assert accessed_at() == 1010.0
+
+
+def test_shared_between_processes(tmp_path: Path) -> None:
+    path = tmp_path / "responses.db"
+    script = textwrap.dedent(
+        f"""
+        import httpx
+        from newscatcher.core.disk_cache import DiskResponseCache
+
+        cache = DiskResponseCache({str(path)!r})
+        request = httpx.Request("GET", "https://e.com/api/sources")
+        cache.set("from-worker", httpx.Response(200, content=b"worker", request=request))
+        """
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, env={**os.environ, "PYTHONPATH": SRC})
+
+    cached = DiskResponseCache(path).get("from-worker")
+    assert cached is not None and cached.content == b"worker"
+
+
+def test_client_reuses_cache_after_restart(tmp_path: Path, make_sync_http_client: Callable[..., HttpClient]) -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"status": "ok", "total_hits": 1})
+
+    body = {"q": "solar", "from_": "2024-01-01", "to_": "2024-01-02"}
+    first = make_sync_http_client(handler, response_cache=DiskResponseCache(tmp_path / "responses.db"))
+    first.request("api/search", method="POST", json=body)
+    restarted = DiskResponseCache(tmp_path / "responses.db")
+    response = make_sync_http_client(handler, response_cache=restarted).request("api/search", method="POST", json=body)
+
+    assert len(calls) == 1
+    assert response.json() == {"status": "ok", "total_hits": 1}
+    assert restarted.hits == 1
@@ -0,0 +1,141 @@
+import json
+import pickle
+import typing
+import warnings
+
+import httpx
+import pydantic
+import pytest
+
+from newscatcher import NewscatcherApi
+from newscatcher.core.embeddings import NumpyArticleEntity, NumpySearchResponseDto, stack_embeddings
+from newscatcher.core.parsing import parse_json_as
+from newscatcher.core.pydantic_utilities import IS_PYDANTIC_V2
+from newscatcher.search.types.get_search_response import GetSearchResponse
+from newscatcher.types.article_entity import ArticleEntity
+from newscatcher.types.clustered_search_response_dto import ClusteredSearchResponseDto
+from newscatcher.types.search_response_dto import SearchResponseDto
+
+numpy = pytest.importorskip("numpy")
+pytestmark = pytest.mark.skipif(not IS_PYDANTIC_V2, reason="numpy embeddings require Pydantic v2")
+
+
+def make_article(id_: str, nlp: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    return {
+        "id": id_,
+        "title": "Title",
+        "link": f"https://example.com/{id_}",
+        "domain_url": "example.com",
+        "full_domain_url": "example.com",
+        "parent_url": "https://example.com",
+        "rank": 10,
+        "score": 1.5,
+        "nlp": nlp,
+    }
+
+
+ARTICLES = [
+    make_article("a", {"theme": "Business", "new_embedding": [0.25, -0.5, 1e-3], "qwen_embedding": []}),
+    make_article("b", {"qwen_embedding": [1, 2.5, -3], "new_embedding": None}),
+    make_article("c", {"summary": 'has "new_embedding": [9, 9] in it', "new_embedding": [0.5, 0.5, 0.5]}),
+]
+PAGE = {"status": "ok", "total_hits": 3, "page": 1, "total_pages": 1, "page_size": 3}
+SEARCH_RESPONSE = {**PAGE, "articles": ARTICLES}
+
+
+def assert_array(value: typing.Any, expected: typing.List[float]) -> None:
+    assert isinstance(value, numpy.ndarray)
+    assert value.dtype == numpy.float32 and value.flags["C_CONTIGUOUS"]
+    numpy.testing.assert_array_equal(value, numpy.array(expected, dtype=numpy.float32))
+
+
+@pytest.mark.parametrize("response_mode", ["validate", "lazy", "trusted"])
+def test_response_modes_keep_arrays(response_mode: typing.Any) -> None:
+    content = json.dumps(SEARCH_RESPONSE).encode()
+    response = parse_json_as(GetSearchResponse, content, response_mode=response_mode, embedding_format="numpy")
+    articles = typing.cast(typing.List[typing.Any], response.articles)
+    assert_array(articles[0].nlp.new_embedding, [0.25, -0.5, 1e-3])
+    assert_array(articles[1].nlp.qwen_embedding, [1, 2.5, -3])
+    assert articles[0].nlp.theme == "Business"
+    assert articles[1].nlp.new_embedding is None
+    if response_mode == "lazy":
+        assert_array(articles[2].materialize().nlp.new_embedding, [0.5, 0.5, 0.5])
+    else:
+        assert_array(articles[0].nlp.qwen_embedding, [])
+        assert isinstance(articles[0], ArticleEntity) and type(articles[0]) is NumpyArticleEntity
+
+
+def test_embeddings_that_are_not_lists_of_numbers_are_rejected() -> None:
+    for embedding in [[1, None], ["1"], [[1, 2]], 1]:
+        content = json.dumps({**PAGE, "articles": [make_article("a", {"new_embedding": embedding})]}).encode()
+        with pytest.raises(pydantic.ValidationError):
+            parse_json_as(SearchResponseDto, content, embedding_format="numpy")
+
+
+def test_cluster_articles_keep_arrays() -> None:
+    body = {**PAGE, "clusters_count": 1, "clusters": [{"cluster_id": "1", "cluster_size": 3, "articles": ARTICLES}]}
+    response = parse_json_as(GetSearchResponse, json.dumps(body).encode(), embedding_format="numpy")
+    assert isinstance(response, ClusteredSearchResponseDto)
+    assert_array(response.clusters[0].articles[2].nlp.new_embedding, [0.5, 0.5, 0.5])  # type: ignore[union-attr]
+
+
+@pytest.mark.parametrize("response_mode", ["validate", "lazy", "trusted"])
+def test_serializes_arrays_as_lists(response_mode: typing.Any) -> None:
+    # Embeddings that float32 holds exactly, so that the dumps can be compared
+    content = json.dumps({**PAGE, "articles": ARTICLES[1:]}).encode()
+    response = parse_json_as(GetSearchResponse, content, response_mode=response_mode, embedding_format="numpy")
+    listed = parse_json_as(GetSearchResponse, content)
+    assert isinstance(response, type(listed))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert response.dict() == listed.dict()
+        assert json.loads(response.json()) == json.loads(listed.json())
+        assert response.model_dump(by_alias=True, exclude_none=True) == listed.model_dump(
+            by_alias=True, exclude_none=True
+        )
+    assert response.dict()["articles"][0]["nlp"]["qwen_embedding"] == [1.0, 2.5, -3.0]
+
+
+def test_models_compare_and_pickle() -> None:
+    content = json.dumps(SEARCH_RESPONSE).encode()
+    response = parse_json_as(GetSearchResponse, content, embedding_format="numpy")
+    assert response == parse_json_as(GetSearchResponse, content, embedding_format="numpy")
+    assert response != parse_json_as(GetSearchResponse, content)
+    changed = json.loads(content)
+    changed["articles"][0]["nlp"]["new_embedding"][0] = 0.75
+    assert response != parse_json_as(GetSearchResponse, json.dumps(changed).encode(), embedding_format="numpy")
+
+    unpickled = pickle.loads(pickle.dumps(response))
+    assert type(unpickled) is NumpySearchResponseDto and unpickled == response
+    assert_array(unpickled.articles[0].nlp.new_embedding, [0.25, -0.5, 1e-3])  # type: ignore[index,union-attr]
+
+
+def test_stack_embeddings() -> None:
+    response = parse_json_as(GetSearchResponse, json.dumps(SEARCH_RESPONSE).encode(), embedding_format="numpy")
+    articles = typing.cast(typing.List[typing.Any], response.articles)
+
+    matrix = stack_embeddings(articles, "new_embedding", skip_missing=True)
+    assert matrix.shape == (2, 3) and matrix.dtype == numpy.float32
+    numpy.testing.assert_array_equal(matrix[1], numpy.full(3, 0.5, dtype=numpy.float32))
+    with pytest.raises(ValueError, match="Article 1 has no new_embedding"):
+        stack_embeddings(articles, "new_embedding")
+
+    listed = parse_json_as(GetSearchResponse, json.dumps(SEARCH_RESPONSE).encode())
+    numpy.testing.assert_array_equal(
+        stack_embeddings(typing.cast(typing.List[typing.Any], listed.articles), "new_embedding", skip_missing=True),
+        matrix,
+    )
+    assert stack_embeddings([]).shape == (0, 1024)
+
+
+def test_client_and_request_embedding_format() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=SEARCH_RESPONSE)
+
+    client = NewscatcherApi(
+        api_key="key", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)), embedding_format="numpy"
+    )
+    articles = typing.cast(typing.List[typing.Any], client.search.post(q="x").articles)
+    assert isinstance(articles[0].nlp.new_embedding, numpy.ndarray)
+    response = client.search.post(q="x", request_options={"embedding_format": "list"})
+    assert response.articles[0].nlp.new_embedding == [0.25, -0.5, 1e-3]  # type: ignore[index,union-attr]
@@ -0,0 +1,181 @@
+import asyncio
+from typing import Callable, List
+
+import httpx
+import pytest
+
+from newscatcher.core.concurrency import AdaptiveConcurrencyController
+from newscatcher.core.hedging import RequestHedger
+from newscatcher.core.http_client import AsyncHttpClient
+from newscatcher.core.rate_limiter import RateLimiter
+
+
+def _warmed_hedger(latency: float = 0.01, **kwargs) -> RequestHedger:
+    hedger = RequestHedger(min_samples=5, **kwargs)
+    for _ in range(5):
+        hedger.record("/api/search", latency)
+    return hedger
+
+
+def test_endpoint_selection() -> None:
+    hedger = RequestHedger()
+    assert hedger.endpoint_for("https://e.com/api/search", {"q": "x"}) == "/api/search"
+    assert hedger.endpoint_for("https://e.com/api/latest_headlines", {"page": 1}) == "/api/latest_headlines"
+    assert hedger.endpoint_for("https://e.com/api/search", {"q": "x", "page": 2}) is None
+    assert hedger.endpoint_for("https://e.com/api/sources") is None
+    assert RequestHedger(first_page_only=False).endpoint_for("https://e.com/api/search", {"page": 3}) is not None
+
+
+def test_hedge_delay_follows_percentile() -> None:
+    hedger = RequestHedger(percentile=0.9, min_samples=10)
+    for latency in range(1, 10):
+        hedger.record("/api/search", latency / 100)
+    assert hedger.hedge_delay("/api/search") is None
+    hedger.record("/api/search", 1.0)
+    assert hedger.hedge_delay("/api/search") == 1.0
+    hedger.record("/api/search", 0.05)
+    assert hedger.hedge_delay("/api/search") == 0.09
+
+
+async def test_slow_request_is_hedged_and_loser_cancelled() -> None:
+    hedger = _warmed_hedger(budget=1.0)
+    cancelled: List[int] = []
+    attempts = 0
+
+    async def send() -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        attempt = attempts
+        try:
+            await asyncio.sleep(1.0 if attempt == 1 else 0.01)
+        except asyncio.CancelledError:
+            cancelled.append(attempt)
+            raise
+        return httpx.Response(200, json={"attempt": attempt})
+
+    response = await asyncio.wait_for(hedger.run("/api/search", send), timeout=0.5)
+
+    assert response.json() == {"attempt": 2}
+    assert cancelled == [1]
+    assert (hedger.hedges, hedger.hedge_wins) == (1, 1)
+
+
+async def test_cancelled_primary_latency_is_recorded() -> None:
+    hedger = _warmed_hedger(budget=1.0)
+    attempts = 0
+
+    async def send() -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(1.0 if attempts == 1 else 0.01)
+        return httpx.Response(200)
+
+    await hedger.run("/api/search", send)
+
+    latencies = sorted(hedger._latencies["/api/search"])
+    assert len(latencies) == 7
+    # The winning duplicate, and the original, censored after the hedge delay and the duplicate
+    assert latencies[-2] < latencies[-1] < 1.0
+    assert latencies[-1] >= 0.02
+
+
+async def test_fast_request_is_not_hedged() -> None:
+    hedger = _warmed_hedger(latency=0.05, budget=1.0)
+
+    async def send() -> httpx.Response:
+        return httpx.Response(200)
+
+    await hedger.run("/api/search", send)
+    assert hedger.hedges == 0
+
+
+async def test_budget_caps_hedges() -> None:
+    hedger = _warmed_hedger(budget=0.25)
+
+    async def send() -> httpx.Response:
+        await asyncio.sleep(0.03)
+        return httpx.Response(200)
+
+    await asyncio.gather(*(hedger.run("/api/search", send) for _ in range(8)))
+    assert hedger.hedges == 2
+
+
+async def test_failed_attempt_waits_for_the_other() -> None:
+    hedger = _warmed_hedger(budget=1.0)
+    attempts = 0
+
+    async def send() -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            await asyncio.sleep(0.05)
+            raise httpx.ConnectError("refused")
+        await asyncio.sleep(0.1)
+        return httpx.Response(200)
+
+    response = await hedger.run("/api/search", send)
+    assert response.status_code == 200
+
+    async def always_fails() -> httpx.Response:
+        await asyncio.sleep(0.02)
+        raise httpx.ConnectError("refused")
+
+    with pytest.raises(httpx.ConnectError):
+        await hedger.run("/api/search", always_fails)
+
+
+async def test_async_client_hedges_slow_search(make_async_http_client: Callable[..., AsyncHttpClient]) -> None:
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        # Every tenth request hits a slow shard
+        await asyncio.sleep(1.0 if calls % 10 == 0 else 0.005)
+        return httpx.Response(200, json={"calls": calls})
+
+    hedger = RequestHedger(min_samples=5, budget=0.5)
+    http_client = make_async_http_client(handler, request_hedger=hedger)
+    for _ in range(10):
+        await asyncio.wait_for(
+            http_client.request("api/search", method="POST", json={"q": "x", "page": 1}), timeout=0.5
+        )
+
+    assert hedger.hedges == 1 and hedger.hedge_wins == 1
+    assert calls == 11
+
+
+class _CountingRateLimiter(RateLimiter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.acquired = 0
+
+    async def acquire_async(self) -> None:
+        self.acquired += 1
+        await super().acquire_async()
+
+
+async def test_hedged_duplicate_is_rate_limited_and_holds_a_slot(
+    make_async_http_client: Callable[..., AsyncHttpClient],
+) -> None:
+    calls = 0
+    peak_in_flight = 0
+    controller = AdaptiveConcurrencyController(initial_limit=4)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls, peak_in_flight
+        calls += 1
+        peak_in_flight = max(peak_in_flight, controller.in_flight)
+        await asyncio.sleep(1.0 if calls == 1 else 0.01)
+        return httpx.Response(200, json={"calls": calls})
+
+    limiter = _CountingRateLimiter()
+    http_client = make_async_http_client(
+        handler, request_hedger=_warmed_hedger(budget=1.0), rate_limiter=limiter, concurrency_controller=controller
+    )
+    await asyncio.wait_for(http_client.request("api/search", method="POST", json={"q": "x"}), timeout=0.5)
+
+    assert calls == 2
+    assert limiter.acquired == 2
+    assert peak_in_flight == 2
+    assert controller.in_flight == 0
@@ -0,0 +1,133 @@
+import json
+import pickle
+import typing
+import warnings
+
+import httpx
+import pydantic
+import pytest
+
+from newscatcher import AsyncNewscatcherApi, NewscatcherApi
+from newscatcher.core.lazy_model import LazyClusteredSearchResponseDto, LazyModel, parse_lazy_json_as
+from newscatcher.core.parsing import parse_json_as
+from newscatcher.core.pydantic_utilities import IS_PYDANTIC_V2
+from newscatcher.search.types.get_search_response import GetSearchResponse
+from newscatcher.types.article_entity import ArticleEntity
+from newscatcher.types.clustered_search_response_dto import ClusteredSearchResponseDto
+from newscatcher.types.search_response_dto import SearchResponseDto
+
+pytestmark = pytest.mark.skipif(not IS_PYDANTIC_V2, reason="lazy responses require Pydantic v2")
+
+ARTICLE = {
+    "id": "a",
+    "title": "Title",
+    "link": "https://example.com/a",
+    "domain_url": "example.com",
+    "full_domain_url": "example.com",
+    "parent_url": "https://example.com",
+    "rank": 10,
+    "score": 1.5,
+    "nlp": {"theme": "Business", "ner_PER": [{"entity_name": "Ada", "count": 2}]},
+    "custom_field": "kept",
+}
+PAGE = {"status": "ok", "total_hits": 1, "page": 1, "total_pages": 1, "page_size": 1}
+SEARCH_RESPONSE = {**PAGE, "articles": [ARTICLE]}
+CLUSTERED_RESPONSE = {
+    **PAGE,
+    "clusters_count": 1,
+    "clusters": [{"cluster_id": "1", "cluster_size": 1, "articles": [ARTICLE]}],
+}
+
+
+def test_articles_are_views_and_the_rest_is_validated() -> None:
+    response = parse_lazy_json_as(SearchResponseDto, json.dumps(SEARCH_RESPONSE).encode())
+    assert isinstance(response, SearchResponseDto)
+    assert response.total_hits == 1
+
+    article = response.articles[0]  # type: ignore[index]
+    assert isinstance(article, LazyModel)
+    assert article.__dict__.keys() == {"_model_type", "_raw"}
+    assert article.title == "Title"
+    assert article.nlp.ner_per[0].entity_name == "Ada"
+    assert article.custom_field == "kept"
+    assert article.is_opinion is None
+    assert "nlp" in article.__dict__ and "rank" not in article.__dict__
+    with pytest.raises(AttributeError):
+        article.missing
+
+    assert article.materialize() == parse_json_as(ArticleEntity, json.dumps(ARTICLE).encode())
+
+
+def test_cluster_articles_stay_lazy() -> None:
+    response = parse_lazy_json_as(GetSearchResponse, json.dumps(CLUSTERED_RESPONSE).encode())
+    assert isinstance(response, ClusteredSearchResponseDto)
+    cluster = response.clusters[0]
+    assert isinstance(cluster, LazyModel) and cluster.cluster_size == 1
+    assert isinstance(cluster.articles[0], LazyModel)
+    assert cluster.articles[0].rank == 10
+
+
+@pytest.mark.parametrize("body", [SEARCH_RESPONSE, CLUSTERED_RESPONSE])
+def test_serializes_as_the_validated_response(body: typing.Dict[str, typing.Any]) -> None:
+    content = json.dumps(body).encode()
+    response = parse_lazy_json_as(GetSearchResponse, content)
+    validated = parse_json_as(GetSearchResponse, content)
+    assert isinstance(response, type(validated))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert response.dict() == validated.dict()
+        assert response.json() == validated.json()
+        assert response.model_dump() == validated.model_dump()
+        assert response.model_dump(mode="json", by_alias=True) == validated.model_dump(mode="json", by_alias=True)
+
+
+def test_invalid_fields_fail_when_read() -> None:
+    content = json.dumps({**PAGE, "articles": [{**ARTICLE, "rank": "high"}, {"id": "b"}]}).encode()
+    articles = parse_lazy_json_as(SearchResponseDto, content).articles
+    assert articles[0].title == "Title"  # type: ignore[index]
+    with pytest.raises(pydantic.ValidationError):
+        articles[0].rank  # type: ignore[index]
+    with pytest.raises(pydantic.ValidationError):
+        articles[1].title  # type: ignore[index]
+
+
+def test_client_and_request_response_mode() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=SEARCH_RESPONSE)
+
+    client = NewscatcherApi(
+        api_key="key", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)), response_mode="lazy"
+    )
+    assert isinstance(client.search.post(q="x").articles[0], LazyModel)  # type: ignore[index]
+    response = client.search.post(q="x", request_options={"response_mode": "validate"})
+    assert isinstance(response.articles[0], ArticleEntity)  # type: ignore[index]
+
+
+async def test_async_client_per_request_lazy() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=SEARCH_RESPONSE)
+
+    client = AsyncNewscatcherApi(api_key="key", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    response = await client.search.post(q="x", request_options={"response_mode": "lazy"})
+    articles = typing.cast(typing.List[typing.Any], response.articles)
+    assert isinstance(articles[0], LazyModel)
+
+
+def test_compares_and_pickles_as_the_validated_response() -> None:
+    content = json.dumps(CLUSTERED_RESPONSE).encode()
+    response = parse_lazy_json_as(GetSearchResponse, content)
+    validated = parse_json_as(GetSearchResponse, content)
+    assert type(response) is LazyClusteredSearchResponseDto
+    assert response == parse_lazy_json_as(GetSearchResponse, content)
+    assert response.clusters[0] == validated.clusters[0]  # type: ignore[union-attr]
+    changed = json.loads(content)
+    changed["clusters"][0]["articles"][0]["title"] = "Other"
+    assert response != parse_lazy_json_as(GetSearchResponse, json.dumps(changed).encode())
+
+    articles = parse_lazy_json_as(SearchResponseDto, json.dumps(SEARCH_RESPONSE).encode()).articles
+    article = typing.cast(typing.List[typing.Any], articles)[0]
+    assert pickle.loads(pickle.dumps(article)) == article.materialize()
+    unpickled = pickle.loads(pickle.dumps(response))
+    assert type(unpickled) is LazyClusteredSearchResponseDto
+    assert unpickled.clusters == validated.clusters  # type: ignore[union-attr]
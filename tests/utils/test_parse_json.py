@@ -0,0 +1,108 @@
+import json
+import typing
+
+import httpx
+import pytest
+import typing_extensions
+
+from newscatcher import NewscatcherApi
+from newscatcher.core import parsing
+from newscatcher.core.lazy_model import LazyModel
+from newscatcher.core.parse_error import ParsingError
+from newscatcher.core.parsing import _validates_wire_json, parse_json_as
+from newscatcher.core.pydantic_utilities import IS_PYDANTIC_V2, UniversalBaseModel, parse_obj_as
+from newscatcher.core.serialization import FieldMetadata
+from newscatcher.search.types.get_search_response import GetSearchResponse
+from newscatcher.types.search_response_dto import SearchResponseDto
+
+SEARCH_RESPONSE = {
+    "status": "ok",
+    "total_hits": 1,
+    "page": 1,
+    "total_pages": 1,
+    "page_size": 1,
+    "articles": [
+        {
+            "title": "Title",
+            "link": "https://example.com/a",
+            "domain_url": "example.com",
+            "full_domain_url": "example.com",
+            "parent_url": "https://example.com",
+            "rank": 10,
+            "id": "a",
+            "score": 1.5,
+            "published_date": "2024-05-01 10:00:00",
+            "nlp": {"theme": "Business", "ner_PER": [{"entity_name": "Ada", "count": 2}]},
+            "custom_field": "kept",
+        }
+    ],
+}
+
+
+class MetadataAliasOnly(UniversalBaseModel):
+    ner_per: typing_extensions.Annotated[typing.Optional[str], FieldMetadata(alias="ner_PER")] = None
+
+
+def test_matches_parse_obj_as() -> None:
+    content = json.dumps(SEARCH_RESPONSE).encode()
+    for type_ in (SearchResponseDto, GetSearchResponse):
+        assert parse_json_as(type_, content) == parse_obj_as(type_, json.loads(content))
+
+    response = parse_json_as(SearchResponseDto, content)
+    article = response.articles[0]  # type: ignore[index]
+    assert article.nlp.ner_per[0].entity_name == "Ada"  # type: ignore[union-attr, index]
+
+
+@pytest.mark.skipif(not IS_PYDANTIC_V2, reason="validate_json requires Pydantic v2")
+def test_alias_decision_is_per_type() -> None:
+    # Fields aliased through both FieldMetadata and Pydantic accept wire keys as they are
+    assert _validates_wire_json(SearchResponseDto)
+    assert _validates_wire_json(GetSearchResponse)
+    assert not _validates_wire_json(MetadataAliasOnly)
+    assert not _validates_wire_json(typing.List[MetadataAliasOnly])
+
+
+def test_metadata_aliases_fall_back_to_dealiasing() -> None:
+    assert parse_json_as(MetadataAliasOnly, b'{"ner_PER": "Ada"}').ner_per == "Ada"
+
+
+def test_malformed_body_raises_json_decode_error() -> None:
+    with pytest.raises(json.JSONDecodeError):
+        parse_json_as(SearchResponseDto, b"<html>Bad gateway</html>")
+
+
+def make_client(body: bytes, status_code: int = 200) -> NewscatcherApi:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code, content=body, headers={"content-type": "application/json"})
+
+    return NewscatcherApi(api_key="key", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def test_client_parses_response_bytes(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = make_client(json.dumps(SEARCH_RESPONSE).encode())
+    if IS_PYDANTIC_V2:
+        # The body is validated from its bytes and never decoded into dicts
+        monkeypatch.setattr(parsing, "json", None)
+    response = client.search.with_raw_response.post(q="x")
+    assert response.data == parse_obj_as(GetSearchResponse, SEARCH_RESPONSE)
+    assert isinstance(response._response, httpx.Response)
+
+
+def test_response_json_is_the_decoded_dict() -> None:
+    response = make_client(json.dumps(SEARCH_RESPONSE).encode()).search.with_raw_response.post(q="x")._response
+    body = response.json()
+    assert type(body) is dict and body == SEARCH_RESPONSE
+    assert json.loads(json.dumps(body)) == SEARCH_RESPONSE
+
+
+def test_request_options_choose_the_response_mode() -> None:
+    client = make_client(json.dumps(SEARCH_RESPONSE).encode())
+    response = client.search.post(q="x", request_options={"response_mode": "lazy"})
+    assert isinstance(response.articles[0], LazyModel)  # type: ignore[index]
+
+
+def test_invalid_body_is_reported_decoded() -> None:
+    client = make_client(b'{"status": "ok", "articles": "none"}')
+    with pytest.raises(ParsingError) as exc_info:
+        client.search.post(q="x")
+    assert exc_info.value.body == {"status": "ok", "articles": "none"}
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, List
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from newscatcher.core.http_client import AsyncHttpClient, HttpClient
+from newscatcher.core.rate_limiter import RateLimiter
+
+from .conftest import FakeClock
+
+
+def _response(status_code: int = 200, headers: Dict[str, str] = {}) -> httpx.Response:
+    return httpx.Response(status_code, headers=headers)
+
+
+def test_unconfigured_limiter_does_not_pace(clock: FakeClock) -> None:
+    limiter = RateLimiter(clock=clock)
+    assert [limiter.reserve() for _ in range(10)] == [0.0] * 10
+
+
+def test_fixed_rate_spaces_requests_after_burst(clock: FakeClock) -> None:
+    limiter = RateLimiter(requests_per_second=4, burst=2, clock=clock)
+    delays = [limiter.reserve() for _ in range(5)]
+    assert delays == pytest.approx([0.0, 0.0, 0.25, 0.5, 0.75])
+
+
+def test_tokens_refill_over_time(clock: FakeClock) -> None:
+    limiter = RateLimiter(requests_per_second=2, burst=1, clock=clock)
+    assert limiter.reserve() == 0.0
+    clock.now += 0.5
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(0.5)
+
+
+def test_learns_rate_from_headers(clock: FakeClock) -> None:
+    limiter = RateLimiter(clock=clock)
+    limiter.update(200, httpx.Headers({"X-RateLimit-Limit": "10", "X-RateLimit-Remaining": "3"}))
+
+    assert limiter.requests_per_second == 10
+    delays = [limiter.reserve() for _ in range(5)]
+    assert delays == pytest.approx([0.0, 0.1, 0.2, 0.3, 0.4])
+
+
+def test_spreads_remaining_requests_until_reset(clock: FakeClock) -> None:
+    limiter = RateLimiter(clock=clock)
+    limiter.update(
+        200,
+        httpx.Headers({"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "30", "X-RateLimit-Reset": "60"}),
+    )
+    assert limiter.requests_per_second == pytest.approx(0.5)
+
+
+def test_reset_as_unix_timestamp(monkeypatch: pytest.MonkeyPatch, clock: FakeClock) -> None:
+    monkeypatch.setattr(time, "time", lambda: 1_700_000_000.0)
+    limiter = RateLimiter(clock=clock)
+    headers = {"X-RateLimit-Limit": "5", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1700000010"}
+    limiter.update(200, httpx.Headers(headers))
+    assert limiter.reserve() == pytest.approx(10)
+
+
+def test_429_pauses_all_requests(clock: FakeClock) -> None:
+    limiter = RateLimiter(requests_per_second=100, clock=clock)
+    limiter.update(429, httpx.Headers({"Retry-After": "2"}))
+
+    assert limiter.reserve() == pytest.approx(2.0)
+    assert limiter.reserve() >= 2.0
+    assert limiter.rate_limited_responses == 1
+    clock.now += 3
+    assert limiter.reserve() == 0.0
+
+
+def test_reservations_are_unique_across_threads(clock: FakeClock) -> None:
+    limiter = RateLimiter(requests_per_second=10, burst=1, clock=clock)
+    delays: List[float] = []
+    lock = threading.Lock()
+
+    def worker() -> None:
+        for _ in range(25):
+            delay = limiter.reserve()
+            with lock:
+                delays.append(delay)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(delays) == pytest.approx([i / 10 for i in range(200)])
+
+
+def test_sync_http_client_paces_and_learns(make_sync_http_client: Callable[..., HttpClient]) -> None:
+    limiter = MagicMock(spec=RateLimiter)
+    mock_client = MagicMock()
+    mock_client.request.return_value = _response(headers={"X-RateLimit-Limit": "5"})
+    http_client = make_sync_http_client(httpx_client=mock_client, rate_limiter=limiter)
+
+    http_client.request(path="/test", method="GET")
+
+    limiter.acquire.assert_called_once()
+    status_code, headers = limiter.update.call_args.args
+    assert status_code == 200
+    assert headers["x-ratelimit-limit"] == "5"
+
+
+async def test_async_http_client_shares_limiter_between_tasks(
+    fake_time: FakeClock, make_async_http_client: Callable[..., AsyncHttpClient]
+) -> None:
+    limiter = RateLimiter(requests_per_second=50, burst=1, clock=fake_time)
+    sent_at: List[float] = []
+
+    async def request(**kwargs: Any) -> httpx.Response:
+        sent_at.append(fake_time())
+        return _response()
+
+    mock_client = MagicMock()
+    mock_client.request.side_effect = request
+    http_client = make_async_http_client(httpx_client=mock_client, rate_limiter=limiter)
+
+    await asyncio.gather(*(http_client.request(path="/test", method="GET") for _ in range(6)))
+
+    assert sent_at == pytest.approx([i / 50 for i in range(6)])
@@ -0,0 +1,109 @@
+import gzip
+from typing import Any, Callable, List
+
+import httpx
+import pytest
+
+from newscatcher.core.http_client import AsyncHttpClient, HttpClient
+from newscatcher.core.response_cache import ResponseCache, request_cache_key
+
+from .conftest import FakeClock
+
+
+def _response(url: str, status_code: int = 200, **kwargs: Any) -> httpx.Response:
+    return httpx.Response(status_code, request=httpx.Request("GET", url), **kwargs)
+
+
+def test_key_is_canonical() -> None:
+    first = request_cache_key("POST", "https://e.com/api/search", [("b", 2), ("a", 1)], {"q": "x", "page": 1}, {})
+    second = request_cache_key("POST", "https://e.com/api/search", [("a", 1), ("b", 2)], {"page": 1, "q": "x"}, {})
+    assert first == second
+    assert first != request_cache_key("POST", "https://e.com/api/search", [], {"q": "x", "page": 2}, {})
+    assert request_cache_key("DELETE", "https://e.com/api/search", [], None, {}) is None
+
+
+def test_ttl_by_endpoint() -> None:
+    cache = ResponseCache(ttl=5, endpoint_ttls={"api/search": 30, "api/search_by_link": 10})
+    assert cache.ttl_for("https://e.com/v3/api/search") == 30
+    assert cache.ttl_for("https://e.com/v3/api/search_by_link/") == 10
+    assert cache.ttl_for("https://e.com/v3/api/sources") == 5
+
+
+def test_entries_expire(clock: FakeClock) -> None:
+    cache = ResponseCache(endpoint_ttls={"api/sources": 60}, clock=clock)
+    cache.set("k", _response("https://e.com/api/sources", json={"sources": []}))
+
+    clock.now += 59
+    cached = cache.get("k")
+    assert cached is not None and cached.json() == {"sources": []}
+    clock.now += 1
+    assert cache.get("k") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_eviction() -> None:
+    cache = ResponseCache(max_entries=2)
+    for key in ("a", "b"):
+        cache.set(key, _response("https://e.com/api/sources", content=key.encode()))
+    cache.get("a")
+    cache.set("c", _response("https://e.com/api/sources", content=b"c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.evictions == 1 and len(cache) == 2
+
+
+def test_only_successful_responses_are_cached() -> None:
+    cache = ResponseCache(endpoint_ttls={"api/breaking_news": 0})
+    cache.set("error", _response("https://e.com/api/sources", status_code=500))
+    cache.set("disabled", _response("https://e.com/api/breaking_news"))
+    assert len(cache) == 0
+
+
+def test_sync_client_serves_repeats_from_cache(make_sync_http_client: Callable[..., HttpClient]) -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"message": "ok"})
+
+    cache = ResponseCache()
+    http_client = make_sync_http_client(handler, response_cache=cache)
+    first = http_client.request("api/sources", method="GET", params={"lang": "en", "countries": "US"})
+    second = http_client.request("api/sources", method="GET", params={"countries": "US", "lang": "en"})
+    http_client.request("api/sources", method="GET", params={"lang": "fr"})
+
+    assert len(calls) == 2
+    assert first.json() == second.json() == {"message": "ok"}
+    assert second.request.url == first.request.url
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cached_compressed_response_is_decoded(make_sync_http_client: Callable[..., HttpClient]) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-encoding": "gzip"}, content=iter([gzip.compress(b'{"a": 1}')]))
+
+    cache = ResponseCache()
+    http_client = make_sync_http_client(handler, response_cache=cache)
+    http_client.request("api/search", method="POST", json={"q": "x"})
+    assert http_client.request("api/search", method="POST", json={"q": "x"}).json() == {"a": 1}
+    assert cache.hits == 1
+
+
+async def test_async_client_serves_repeats_from_cache(
+    make_async_http_client: Callable[..., AsyncHttpClient],
+) -> None:
+    calls: List[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"count": 3})
+
+    cache = ResponseCache()
+    http_client = make_async_http_client(handler, response_cache=cache)
+    for _ in range(3):
+        response = await http_client.request("api/aggregation_count", method="POST", json={"q": "x"})
+        assert response.json() == {"count": 3}
+
+    assert len(calls) == 1
+    assert cache.hit_rate == pytest.approx(2 / 3)
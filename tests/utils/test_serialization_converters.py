@@ -0,0 +1,58 @@
+import typing
+
+import typing_extensions
+
+from newscatcher.core.serialization import (
+    FieldMetadata,
+    _get_converter,
+    _identity,
+    convert_and_respect_annotation_metadata,
+)
+from newscatcher.types.article_entity import ArticleEntity
+from newscatcher.types.clustered_search_response_dto import ClusteredSearchResponseDto
+from newscatcher.types.sentiment_scores import SentimentScores
+
+ARTICLE = {
+    "id": "a",
+    "title": "Title",
+    "nlp": {"theme": "Business", "ner_PER": [{"entity_name": "Ada", "count": 2}], "sentiment": {"title": 0.5}},
+    "custom_field": "kept",
+}
+
+
+class Node(typing_extensions.TypedDict, total=False):
+    node_name: typing_extensions.Annotated[str, FieldMetadata(alias="nodeName")]
+    children: typing.List["Node"]
+
+
+def test_converters_are_compiled_once_per_type() -> None:
+    assert _get_converter(ArticleEntity, "read") is _get_converter(ArticleEntity, "read")
+    assert _get_converter(ArticleEntity, "read") is not _get_converter(ArticleEntity, "write")
+
+
+def test_subtrees_without_aliases_are_skipped() -> None:
+    assert _get_converter(SentimentScores, "read") is _identity
+    assert _get_converter(typing.List[str], "read") is _identity
+
+    converted = convert_and_respect_annotation_metadata(object_=ARTICLE, annotation=ArticleEntity, direction="read")
+    assert converted["nlp"]["ner_per"] == [{"entity_name": "Ada", "count": 2}]
+    assert converted["nlp"]["sentiment"] is ARTICLE["nlp"]["sentiment"]  # type: ignore[index]
+    assert converted["custom_field"] == "kept"
+    assert "ner_PER" in ARTICLE["nlp"]  # type: ignore[operator]
+
+
+def test_nested_articles_in_clusters() -> None:
+    response = {"status": "ok", "clusters": [{"cluster_id": "1", "articles": [ARTICLE, {"id": "b", "nlp": None}]}]}
+    converted = convert_and_respect_annotation_metadata(
+        object_=response, annotation=ClusteredSearchResponseDto, direction="read"
+    )
+    articles = converted["clusters"][0]["articles"]
+    assert articles[0]["nlp"]["ner_per"][0]["entity_name"] == "Ada"
+    assert articles[1] == {"id": "b", "nlp": None}
+
+
+def test_self_referencing_type() -> None:
+    data = {"node_name": "root", "children": [{"node_name": "leaf", "children": []}]}
+    converted = convert_and_respect_annotation_metadata(object_=data, annotation=Node, direction="write")
+    assert converted == {"nodeName": "root", "children": [{"nodeName": "leaf", "children": []}]}
+    assert convert_and_respect_annotation_metadata(object_=converted, annotation=Node, direction="read") == data
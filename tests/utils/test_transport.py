@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from newscatcher.base_client import _make_default_async_client, _make_default_client
+from newscatcher.core.transport import AsyncStreamLimitedTransport, StreamLimitedTransport
+
+
+class _PeakCounter:
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def enter(self) -> None:
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def exit(self) -> None:
+        with self.lock:
+            self.current -= 1
+
+
+def test_stream_limited_transport_bounds_open_requests() -> None:
+    counter = _PeakCounter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        counter.enter()
+        time.sleep(0.01)
+        counter.exit()
+        return httpx.Response(200, json={"ok": True})
+
+    transport = StreamLimitedTransport(httpx.MockTransport(handler), max_concurrent_streams=2)
+    with httpx.Client(transport=transport) as client:
+        threads = [threading.Thread(target=client.get, args=("https://example.com",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert counter.peak == 2
+
+
+def test_stream_slot_is_held_until_response_is_closed() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=iter([b"{}"]))
+
+    transport = StreamLimitedTransport(httpx.MockTransport(handler), 1)
+    with httpx.Client(transport=transport) as client:
+        with client.stream("GET", "https://example.com"):
+            assert not transport._slots.acquire(blocking=False)
+        assert client.get("https://example.com").status_code == 200
+
+
+async def test_async_stream_limited_transport_bounds_open_requests() -> None:
+    counter = _PeakCounter()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        counter.enter()
+        await asyncio.sleep(0.01)
+        counter.exit()
+        return httpx.Response(200)
+
+    transport = AsyncStreamLimitedTransport(httpx.MockTransport(handler), max_concurrent_streams=3)
+    async with httpx.AsyncClient(transport=transport) as client:
+        await asyncio.gather(*(client.get("https://example.com") for _ in range(12)))
+
+    assert counter.peak == 3
+
+
+def test_default_client_applies_pool_limits() -> None:
+    client = _make_default_client(
+        timeout=60, follow_redirects=True, limits=httpx.Limits(max_connections=7, max_keepalive_connections=3)
+    )
+    pool = client._transport._pool  # type: ignore[attr-defined]
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+    assert client.follow_redirects
+
+
+def test_default_client_wraps_transport_with_stream_limit() -> None:
+    client = _make_default_client(timeout=60, follow_redirects=None, max_concurrent_streams=16)
+    assert isinstance(client._transport, StreamLimitedTransport)
+    assert client._transport.max_concurrent_streams == 16
+
+
+def test_default_clients_enable_http2() -> None:
+    pytest.importorskip("h2")
+    client = _make_default_client(timeout=60, follow_redirects=True, http2=True)
+    assert client._transport._pool._http2  # type: ignore[attr-defined]
+
+    async_client = _make_default_async_client(timeout=60, follow_redirects=True, http2=True)
+    assert type(async_client) is httpx.AsyncClient
+    assert async_client._transport._pool._http2  # type: ignore[attr-defined]
@@ -0,0 +1,90 @@
+import datetime as dt
+import json
+import typing
+
+import httpx
+import pytest
+
+from newscatcher import NewscatcherApi
+from newscatcher.core.parse_error import ParsingError
+from newscatcher.core.parsing import parse_json_as
+from newscatcher.core.pydantic_utilities import IS_PYDANTIC_V2, UniversalBaseModel
+from newscatcher.core.trusted import construct_obj_as
+from newscatcher.search.types.get_search_response import GetSearchResponse
+from newscatcher.types.clustered_search_response_dto import ClusteredSearchResponseDto
+from newscatcher.types.nlp_data_entity import NlpDataEntity
+from newscatcher.types.search_response_dto import SearchResponseDto
+
+pytestmark = pytest.mark.skipif(not IS_PYDANTIC_V2, reason="trusted responses require Pydantic v2")
+
+ARTICLE = {
+    "id": "a",
+    "title": "Title",
+    "link": "https://example.com/a",
+    "domain_url": "example.com",
+    "full_domain_url": "example.com",
+    "parent_url": "https://example.com",
+    "rank": 10,
+    "score": 1.5,
+    "nlp": {
+        "theme": "Business",
+        "sentiment": {"title": 0.5, "content": -0.1},
+        "ner_PER": [{"entity_name": "Ada", "count": 2}],
+        "new_embedding": [0.25, 0.5],
+    },
+    "custom_field": "kept",
+}
+PAGE = {"status": "ok", "total_hits": 1, "page": 1, "total_pages": 1, "page_size": 1}
+SEARCH_RESPONSE = {**PAGE, "articles": [ARTICLE]}
+CLUSTERED_RESPONSE = {
+    **PAGE,
+    "clusters_count": 1,
+    "clusters": [{"cluster_id": "1", "cluster_size": 1, "articles": [ARTICLE]}],
+}
+
+
+class Event(UniversalBaseModel):
+    at: dt.datetime
+    tags: typing.List[str] = []
+
+
+@pytest.mark.parametrize("body", [SEARCH_RESPONSE, CLUSTERED_RESPONSE])
+def test_matches_validated_models(body: typing.Dict[str, typing.Any]) -> None:
+    content = json.dumps(body).encode()
+    trusted = parse_json_as(GetSearchResponse, content, response_mode="trusted")
+    validated = parse_json_as(GetSearchResponse, content)
+
+    assert type(trusted) is type(validated)
+    assert trusted == validated
+    assert trusted.model_dump() == validated.model_dump()
+    assert trusted.model_fields_set == validated.model_fields_set
+
+
+def test_nested_models_are_built() -> None:
+    response = construct_obj_as(ClusteredSearchResponseDto, CLUSTERED_RESPONSE)
+    article = response.clusters[0].articles[0]
+    assert isinstance(article.nlp, NlpDataEntity)
+    assert article.nlp.sentiment.title == 0.5  # type: ignore[union-attr]
+    assert article.nlp.ner_per[0].entity_name == "Ada"  # type: ignore[index]
+    assert article.custom_field == "kept"  # type: ignore[attr-defined]
+
+
+def test_values_are_not_validated() -> None:
+    response = construct_obj_as(SearchResponseDto, {"status": "ok", "total_hits": "many"})
+    assert response.total_hits == "many"
+
+    event = construct_obj_as(Event, {"at": "2024-05-01T10:00:00Z"})
+    assert event.at == dt.datetime(2024, 5, 1, 10, tzinfo=dt.timezone.utc)
+    assert event.tags == []
+
+
+def test_client_and_request_response_mode() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={**SEARCH_RESPONSE, "total_hits": "unchecked"})
+
+    client = NewscatcherApi(
+        api_key="key", httpx_client=httpx.Client(transport=httpx.MockTransport(handler)), response_mode="trusted"
+    )
+    assert client.search.post(q="x").total_hits == "unchecked"
+    with pytest.raises(ParsingError):
+        client.search.post(q="x", request_options={"response_mode": "validate"})